@@ -14,6 +14,7 @@ def load_env() -> None:
     로드되는 주요 변수:
     - KAKAO_CLIENT_ID, KAKAO_REDIRECT_URI, KAKAO_CLIENT_SECRET (Kakao OAuth)
     - DATABASE_URL (PostgreSQL 연결 문자열)
+    - DB_MODE (sync | async, DB 세션 모드)
     """
     env_path = Path(__file__).resolve().parent.parent / ".env"
     load_dotenv(dotenv_path=env_path)
@@ -0,0 +1,112 @@
+"""프로세스 내 TTL + LRU 캐시.
+
+- 항목별 TTL(기본값은 캐시 생성 시 지정, None이면 만료 없이 LRU로만 축출).
+- maxsize 초과 시 가장 오래 사용되지 않은 항목부터 축출.
+- 생성된 캐시는 이름으로 등록되어 cache_stats()로 hit/miss/eviction 카운터를 조회할 수 있다.
+- 스레드 안전 (sync 라우트는 threadpool에서 동시에 호출된다).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+_DEFAULT_TTL = object()
+
+_REGISTRY: Dict[str, "TTLCache"] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+class TTLCache:
+    """TTL + LRU 캐시. 값은 (만료 시각, 값)으로 저장한다."""
+
+    def __init__(self, name: str, maxsize: int, ttl_seconds: Optional[float]) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        with _REGISTRY_LOCK:
+            _REGISTRY[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= now:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Any = _DEFAULT_TTL) -> None:
+        """값 저장. ttl 미지정 시 캐시 기본 TTL, None이면 만료 없음, 0 이하면 저장하지 않는다."""
+        if ttl is _DEFAULT_TTL:
+            ttl = self.ttl_seconds
+        if ttl is not None and ttl <= 0:
+            return
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> bool:
+        with self._lock:
+            if self._data.pop(key, None) is None:
+                return False
+            self.invalidations += 1
+            return True
+
+    def pop_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """predicate(key, value)가 참인 항목을 모두 제거하고 제거 수를 반환한다."""
+        with self._lock:
+            keys = [k for k, (_, v) in self._data.items() if predicate(k, v)]
+            for k in keys:
+                del self._data[k]
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._data)
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+def cache_stats() -> List[Dict[str, Any]]:
+    """등록된 모든 캐시의 카운터."""
+    with _REGISTRY_LOCK:
+        caches = list(_REGISTRY.values())
+    return [c.stats() for c in caches]
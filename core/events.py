@@ -0,0 +1,45 @@
+"""프로세스 내 도메인 이벤트 발행/구독.
+
+서비스는 커밋 후 이벤트만 발행하고, 캐시 무효화 등 부수 효과는 구독자가 처리한다.
+핸들러는 발행 스레드에서 동기 호출되므로 짧고 논블로킹이어야 한다.
+핸들러 예외는 로그만 남기고 발행자(요청 처리)로 전파하지 않는다.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# 점심 기록 생성 (payload: record_id, user_id, recorded_at, category, menu_name)
+LUNCH_RECORD_CREATED = "lunch_record.created"
+# 점심 기록 대량 적재 (payload: user_ids) - 기록별 이벤트 대신 한 번 발행
+LUNCH_RECORDS_IMPORTED = "lunch_record.imported"
+# 반응 설정/변경/취소 (payload: record_id, user_id, reaction, result, previous, counts, removed_at)
+# removed_at: 취소된 반응의 생성 시각 (모르면 None)
+REACTION_CHANGED = "reaction.changed"
+
+# 사용자 정보/설정 변경 (payload: user_id)
+USER_UPDATED = "user.updated"
+
+EventHandler = Callable[..., None]
+
+_handlers: Dict[str, List[EventHandler]] = {}
+_lock = threading.Lock()
+
+
+def subscribe(event: str, handler: EventHandler) -> None:
+    """event 발행 시 handler(**payload)가 호출되도록 등록한다."""
+    with _lock:
+        _handlers.setdefault(event, []).append(handler)
+
+
+def publish(event: str, **payload: Any) -> None:
+    """등록된 핸들러를 순서대로 호출한다."""
+    with _lock:
+        handlers = list(_handlers.get(event, ()))
+    for handler in handlers:
+        try:
+            handler(**payload)
+        except Exception:
+            logger.exception("event handler failed: %s", event)
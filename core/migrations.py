@@ -0,0 +1,143 @@
+"""버전 기반 전진 전용(forward-only) 마이그레이션 실행기.
+
+- 마이그레이션은 migrations/versions/vNNNN_*.py 모듈 하나당 한 버전.
+  각 모듈은 VERSION(int), DESCRIPTION(str), upgrade(conn)을 정의하고,
+  CREATE INDEX CONCURRENTLY 처럼 트랜잭션 밖에서 실행해야 하면 TRANSACTIONAL = False.
+- 적용 이력은 schema_migrations 테이블에 기록하며, 되돌리기(downgrade)는 없다.
+- 여러 워커가 동시에 시작해도 advisory lock으로 한 번만 적용된다.
+- 테이블 생성 자체는 create_all이 담당하고(없는 테이블만 생성),
+  기존 테이블의 인덱스·제약·컬럼·데이터 변경은 마이그레이션으로만 한다.
+"""
+
+import importlib
+import pkgutil
+from types import ModuleType
+from typing import List, NamedTuple, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+MIGRATIONS_PACKAGE = "migrations.versions"
+
+# pg_advisory_lock 키 (임의의 고정값)
+_MIGRATION_LOCK_KEY = 5_000_001
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    transactional: bool
+    module: ModuleType
+
+
+def load_migrations() -> List[Migration]:
+    """migrations.versions 패키지의 마이그레이션을 버전 순으로 반환한다."""
+    package = importlib.import_module(MIGRATIONS_PACKAGE)
+    migrations: List[Migration] = []
+    for info in pkgutil.iter_modules(package.__path__):
+        if not info.name.startswith("v"):
+            continue
+        module = importlib.import_module(f"{MIGRATIONS_PACKAGE}.{info.name}")
+        migrations.append(
+            Migration(
+                version=module.VERSION,
+                description=module.DESCRIPTION,
+                transactional=getattr(module, "TRANSACTIONAL", True),
+                module=module,
+            )
+        )
+    migrations.sort(key=lambda m: m.version)
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"중복된 마이그레이션 버전이 있습니다: {versions}")
+    return migrations
+
+
+def _ensure_migrations_table(conn: Connection) -> None:
+    conn.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                description VARCHAR(255) NOT NULL,
+                applied_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
+            )
+            """
+        )
+    )
+
+
+def applied_versions(conn: Connection) -> Set[int]:
+    _ensure_migrations_table(conn)
+    return {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+
+def _record(conn: Connection, migration: Migration) -> None:
+    conn.execute(
+        text("INSERT INTO schema_migrations (version, description) VALUES (:version, :description)"),
+        {"version": migration.version, "description": migration.description},
+    )
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """미적용 마이그레이션을 버전 순으로 적용하고, 적용한 버전 목록을 반환한다."""
+    migrations = load_migrations()
+    applied: List[int] = []
+    # 잠금·이력 기록용 연결은 autocommit (CONCURRENTLY 마이그레이션과 섞여도 트랜잭션이 열려 있지 않도록)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+        try:
+            done = applied_versions(lock_conn)
+            for migration in migrations:
+                if migration.version in done:
+                    continue
+                if migration.transactional:
+                    with engine.begin() as conn:
+                        migration.module.upgrade(conn)
+                        _record(conn, migration)
+                else:
+                    migration.module.upgrade(lock_conn)
+                    _record(lock_conn, migration)
+                applied.append(migration.version)
+        finally:
+            lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+    return applied
+
+
+def create_index_concurrently(conn: Connection, name: str, definition: str) -> None:
+    """트랜잭션 밖(autocommit 연결)에서 테이블 잠금 없이 인덱스를 만든다.
+
+    이전 시도가 중간에 실패해 INVALID 인덱스가 남아 있으면 지우고 다시 만든다.
+    definition 예: "ON lunch_records (category, id DESC)"
+    """
+    invalid = conn.execute(
+        text(
+            """
+            SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = :name AND NOT i.indisvalid
+            """
+        ),
+        {"name": name},
+    ).first()
+    if invalid:
+        conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+    conn.execute(text(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" {definition}'))
+
+
+def constraint_exists(conn: Connection, name: str) -> bool:
+    return conn.execute(
+        text("SELECT 1 FROM pg_constraint WHERE conname = :name"), {"name": name}
+    ).first() is not None
+
+
+def column_data_type(conn: Connection, table: str, column: str) -> str:
+    """information_schema 기준 컬럼 타입 (예: 'smallint', 'character varying')."""
+    return conn.execute(
+        text(
+            """
+            SELECT data_type FROM information_schema.columns
+            WHERE table_name = :table AND column_name = :column
+            """
+        ),
+        {"table": table, "column": column},
+    ).scalar_one()
@@ -2,7 +2,8 @@
 커뮤니티 반응(이모지) 규격 (Backlog-001).
 
 - 허용 종류·저장 방식·중복 정책: docs/backlog-001-report-period-and-reactions.md §3 참조.
-- 저장은 코드값만 사용; 표시 시 아래 매핑으로 이모지 렌더링.
+- API는 코드값(like/love/yummy)으로 주고받고, DB에는 SMALLINT 번호(reaction_types.id)로 저장한다.
+- 표시 시 아래 매핑으로 이모지 렌더링.
 """
 
 from typing import Dict
@@ -10,6 +11,16 @@ from typing import Dict
 # 허용 반응 코드값 (DB/API 저장용)
 ALLOWED_REACTION_CODES = ("like", "love", "yummy")
 
+# 코드값 → DB 저장 번호 (reaction_types 코드표의 원본).
+# 새 코드는 다음 번호로 끝에 추가하고, 기존 번호는 바꾸거나 재사용하지 않는다.
+REACTION_CODE_TO_ID: Dict[str, int] = {
+    "like": 1,
+    "love": 2,
+    "yummy": 3,
+}
+REACTION_ID_TO_CODE: Dict[int, str] = {rid: code for code, rid in REACTION_CODE_TO_ID.items()}
+ALLOWED_REACTION_IDS = tuple(REACTION_CODE_TO_ID[code] for code in ALLOWED_REACTION_CODES)
+
 # 코드값 → 표시 이모지 (클라이언트 매핑용)
 REACTION_CODE_TO_EMOJI: Dict[str, str] = {
     "like": "👍",
@@ -5,8 +5,9 @@
 - 주(week): ISO-8601 기준, 월요일 시작.
 """
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from typing import Literal, Tuple
+from zoneinfo import ZoneInfo
 
 # API에서 사용하는 period 파라미터 값
 PeriodType = Literal["week", "month", "year"]
@@ -19,6 +20,11 @@ WEEK_START = "monday"  # ISO-8601
 DEFAULT_TIMEZONE = "Asia/Seoul"
 
 
+def today_kst() -> date:
+    """기본 타임존 기준 오늘 날짜."""
+    return datetime.now(ZoneInfo(DEFAULT_TIMEZONE)).date()
+
+
 def get_period_range(reference_date: date, period: PeriodType) -> Tuple[date, date]:
     """기준일이 속한 주/월/연의 시작일·종료일을 반환 (Backlog-001 §2).
 
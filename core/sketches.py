@@ -0,0 +1,85 @@
+"""스트리밍 빈도 스케치.
+
+SpaceSaving (Metwally et al., 2005): 최대 capacity(m)개 항목만 세는 heavy-hitter 스케치.
+- 새 항목이 들어왔는데 가득 차 있으면 가장 작은 카운트의 항목을 내보내고, 그 카운트를 물려받는다
+  (물려받은 값 = 그 항목의 최대 과대추정 error).
+- 오차 한계 (N = 지금까지 더한 총 가중치):
+  - 추정값은 실제 빈도보다 작지 않고, 과대추정은 최대 error ≤ N/m.
+  - 실제 빈도가 N/m보다 큰 항목은 반드시 스케치에 남아 있다.
+  - count - error는 실제 빈도의 하한이다.
+- 메모리는 항목 수 m에 비례하고 갱신은 O(log m) (최소 항목은 지연 삭제 힙으로 찾는다).
+- 스레드 안전.
+"""
+
+import heapq
+import threading
+from typing import Dict, Hashable, List, NamedTuple, Tuple
+
+
+class HeavyHitter(NamedTuple):
+    item: Hashable
+    count: int
+    error: int
+
+    @property
+    def lower_bound(self) -> int:
+        return self.count - self.error
+
+
+class SpaceSaving:
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.total = 0
+        # item → [count, error]
+        self._counters: Dict[Hashable, List[int]] = {}
+        # (count, 삽입 순번, item). count가 현재 값과 다르면 낡은 항목 → 꺼낼 때 버린다.
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def _push(self, item: Hashable, count: int) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (count, self._seq, item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, i, key) for i, (key, (c, _e)) in enumerate(self._counters.items())]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[Hashable, int]:
+        while True:
+            count, _seq, item = heapq.heappop(self._heap)
+            counter = self._counters.get(item)
+            if counter is not None and counter[0] == count:
+                del self._counters[item]
+                return item, count
+
+    def update(self, item: Hashable, weight: int = 1) -> None:
+        """item의 빈도에 weight(양수)를 더한다."""
+        if weight <= 0:
+            return
+        with self._lock:
+            self.total += weight
+            counter = self._counters.get(item)
+            if counter is None:
+                if len(self._counters) < self.capacity:
+                    counter = self._counters[item] = [0, 0]
+                else:
+                    _evicted, min_count = self._pop_min()
+                    counter = self._counters[item] = [min_count, min_count]
+            counter[0] += weight
+            self._push(item, counter[0])
+
+    def top(self, n: int) -> List[HeavyHitter]:
+        """추정 빈도 상위 n개 (같으면 하한이 큰 순)."""
+        with self._lock:
+            entries = [HeavyHitter(item, c, e) for item, (c, e) in self._counters.items()]
+        return heapq.nlargest(n, entries, key=lambda h: (h.count, h.lower_bound))
+
+    @property
+    def error_bound(self) -> float:
+        """추정값의 최대 과대추정 N/m."""
+        return self.total / self.capacity
+
+    def __len__(self) -> int:
+        return len(self._counters)
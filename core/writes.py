@@ -0,0 +1,46 @@
+"""INSERT/UPDATE ... RETURNING 쓰기 헬퍼.
+
+commit() 후 refresh()로 다시 SELECT하지 않고, 쓰기 문장의 RETURNING 행으로 응답 스키마를 바로 만든다.
+RETURNING 컬럼은 스키마 필드 중 테이블 컬럼과 이름이 같은 것들이다.
+커밋은 호출자 책임 (여러 쓰기를 한 트랜잭션으로 묶을 수 있도록).
+"""
+
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Row, insert, update
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel
+
+S = TypeVar("S", bound=BaseModel)
+
+
+def returning_columns(model: Type[SQLModel], schema: Type[BaseModel]) -> List[Any]:
+    """schema 필드와 이름이 같은 model 테이블 컬럼 목록 (RETURNING 대상)."""
+    table_columns = model.__table__.c
+    return [table_columns[name] for name in schema.model_fields if name in table_columns]
+
+
+def schema_from_row(schema: Type[S], row: Row) -> S:
+    """RETURNING 행으로 응답 스키마를 만든다 (스키마에 없는 추가 컬럼은 무시)."""
+    mapping = row._mapping
+    return schema.model_validate({name: mapping[name] for name in schema.model_fields if name in mapping})
+
+
+def insert_returning(db: Session, model: Type[SQLModel], values: Dict[str, Any], schema: Type[S]) -> S:
+    """한 행을 INSERT ... RETURNING으로 넣고 schema로 반환한다."""
+    stmt = insert(model).values(**values).returning(*returning_columns(model, schema))
+    return schema_from_row(schema, db.execute(stmt).one())
+
+
+def update_returning(
+    db: Session,
+    model: Type[SQLModel],
+    where: ColumnElement[bool],
+    values: Dict[str, Any],
+    schema: Type[S],
+) -> Optional[S]:
+    """where에 맞는 한 행을 UPDATE ... RETURNING으로 바꾸고 schema로 반환한다. 대상이 없으면 None."""
+    stmt = update(model).where(where).values(**values).returning(*returning_columns(model, schema))
+    row = db.execute(stmt).one_or_none()
+    return schema_from_row(schema, row) if row is not None else None
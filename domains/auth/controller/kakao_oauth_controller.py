@@ -2,16 +2,17 @@
 
 import httpx
 from fastapi import HTTPException, Query
-from sqlalchemy.orm import Session
 
+from core.database import DBSession
 from domains.auth.schemas import AccessTokenResponse, KakaoUserInfo, OAuthLinkResponse
+from domains.auth.service.kakao_client import KakaoUnavailableError
 from domains.auth.service.kakao_oauth_service import KakaoAuthServiceInterface
 
 
 class KakaoAuthController:
     """Controller는 환경 변수, 기본값, URL 구성 로직을 다루지 않고 Service Interface에 위임한다."""
 
-    def __init__(self, service: KakaoAuthServiceInterface, db: Session) -> None:
+    def __init__(self, service: KakaoAuthServiceInterface, db: DBSession) -> None:
         self._service = service
         self._db = db
 
@@ -22,32 +23,36 @@ class KakaoAuthController:
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
-    def request_access_token_after_redirection(
+    async def request_access_token_after_redirection(
         self,
         code: str = Query(..., description="Kakao 인증 후 전달된 인가 코드"),
     ) -> AccessTokenResponse:
         """GET /auth/request-access-token-after-redirection: 인가 코드로 로그인 처리 후 JWT·사용자 반환."""
         try:
-            return self._service.request_access_token(code=code, db=self._db)
+            return await self._service.request_access_token(code=code, db=self._db)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         except httpx.HTTPStatusError as e:
             msg = e.response.text if e.response else str(e)
             raise HTTPException(status_code=502, detail=f"Kakao 토큰 요청 실패: {msg}")
+        except KakaoUnavailableError as e:
+            raise HTTPException(status_code=503, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    def get_user_info(
+    async def get_user_info(
         self,
         access_token: str = Query(..., description="Kakao 액세스 토큰"),
     ) -> KakaoUserInfo:
         """GET /auth/user-info: 액세스 토큰으로 사용자 정보 조회 (PM-JIHYUN-4)."""
         try:
-            return self._service.get_user_info(access_token=access_token)
+            return await self._service.get_user_info(access_token=access_token)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         except httpx.HTTPStatusError as e:
             msg = e.response.text if e.response else str(e)
             raise HTTPException(status_code=502, detail=f"Kakao 사용자 정보 요청 실패: {msg}")
+        except KakaoUnavailableError as e:
+            raise HTTPException(status_code=503, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
@@ -1,32 +1,39 @@
 """Auth 도메인 의존성: JWT 검증 및 현재 사용자 조회."""
 
+import hmac
 import os
 from typing import Annotated
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
 
-from core.database import get_db
+from core.database import run_in_session
 from domains.auth.schemas import AuthUserResponse
+from domains.auth.token_cache import auth_user_cache, cache_auth_user
 from models.user import User
 
 HTTPBearerScheme = HTTPBearer(auto_error=False)
 JWT_ALGORITHM = "HS256"
 
 
-def get_current_user(
+async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(HTTPBearerScheme)],
-    db: Annotated[Session, Depends(get_db)],
 ) -> AuthUserResponse:
-    """Authorization: Bearer <JWT> 에서 사용자 ID를 꺼내 DB에서 조회 후 반환. 실패 시 401."""
+    """Authorization: Bearer <JWT> 에서 사용자 ID를 꺼내 DB에서 조회 후 반환. 실패 시 401.
+
+    검증된 토큰은 캐시(token_cache)에서 바로 반환하고, 미스일 때만 세션을 열어 조회한다.
+    """
     if not credentials or not credentials.credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="인증이 필요합니다.",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    token = credentials.credentials
+    cached = auth_user_cache.get(token)
+    if cached is not None:
+        return cached
     secret = os.getenv("JWT_SECRET_KEY", "")
     if not secret:
         raise HTTPException(
@@ -35,7 +42,7 @@ def get_current_user(
         )
     try:
         payload = jwt.decode(
-            credentials.credentials,
+            token,
             secret,
             algorithms=[JWT_ALGORITHM],
         )
@@ -55,17 +62,30 @@ def get_current_user(
             detail="잘못된 토큰입니다.",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    user = db.get(User, user_id)
+    user = await run_in_session(lambda s: s.get(User, user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="사용자를 찾을 수 없습니다.",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return AuthUserResponse(
+    current_user = AuthUserResponse(
         id=user.id,
         kakao_id=user.kakao_id,
         nickname=user.nickname,
         email=user.email,
         profile_image_url=user.profile_image_url,
     )
+    cache_auth_user(token, payload, current_user)
+    return current_user
+
+
+async def require_admin_token(
+    x_admin_token: Annotated[str | None, Header(description="운영용 관리자 토큰 (ADMIN_API_TOKEN)")] = None,
+) -> None:
+    """X-Admin-Token 헤더가 ADMIN_API_TOKEN과 같을 때만 통과. 설정이 없으면 관리자 API는 비활성."""
+    expected = os.getenv("ADMIN_API_TOKEN", "")
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자 API가 비활성화되어 있습니다.")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자 토큰이 올바르지 않습니다.")
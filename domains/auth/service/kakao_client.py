@@ -0,0 +1,168 @@
+"""Kakao API 호출용 공유 HTTP 클라이언트.
+
+- 앱 lifespan이 소유하는 httpx.AsyncClient 하나를 재사용한다 (커넥션 풀·keep-alive로 TLS 핸드셰이크 재사용).
+- connect/read 타임아웃, 제한된 재시도(지수 백오프), 서킷 브레이커.
+- 재시도 대상: GET은 전송 오류·5xx, POST(인가 코드 교환)는 요청이 전송되지 않은 연결 오류만
+  (인가 코드는 1회용이라 전송된 POST를 다시 보내면 실패한다).
+- 연속 실패가 임계치를 넘으면 KAKAO_CIRCUIT_RESET_SECONDS 동안 즉시 KakaoUnavailableError.
+  이후 1건을 시험 호출(half-open)해 성공하면 닫는다.
+- KAKAO_AUTH_BASE_URL / KAKAO_API_BASE_URL로 로컬 대역(scripts/fake_kakao_server.py)을 가리킬 수 있다.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Optional
+
+import httpx
+
+KAKAO_AUTH_BASE_URL = os.getenv("KAKAO_AUTH_BASE_URL", "https://kauth.kakao.com").rstrip("/")
+KAKAO_API_BASE_URL = os.getenv("KAKAO_API_BASE_URL", "https://kapi.kakao.com").rstrip("/")
+KAKAO_HTTP_CONNECT_TIMEOUT = float(os.getenv("KAKAO_HTTP_CONNECT_TIMEOUT", "3"))
+KAKAO_HTTP_READ_TIMEOUT = float(os.getenv("KAKAO_HTTP_READ_TIMEOUT", "5"))
+KAKAO_HTTP_MAX_RETRIES = int(os.getenv("KAKAO_HTTP_MAX_RETRIES", "2"))
+KAKAO_HTTP_MAX_CONNECTIONS = int(os.getenv("KAKAO_HTTP_MAX_CONNECTIONS", "100"))
+KAKAO_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("KAKAO_CIRCUIT_FAILURE_THRESHOLD", "5"))
+KAKAO_CIRCUIT_RESET_SECONDS = float(os.getenv("KAKAO_CIRCUIT_RESET_SECONDS", "30"))
+
+_RETRY_BACKOFF_SECONDS = 0.1
+# 요청 바이트가 서버로 나가기 전에 실패한 오류 (POST도 재시도 안전)
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class KakaoUnavailableError(Exception):
+    """Kakao 호출 불가 (서킷 열림 또는 재시도 소진)."""
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커 (closed → open → half-open)."""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_seconds:
+                return "half-open"
+            return "open"
+
+    def allow(self) -> bool:
+        """호출 허용 여부. half-open에서는 시험 호출 1건만 허용한다."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_seconds or self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """결과 없이 끝난 호출(취소 등)의 half-open 시험 슬롯을 돌려준다."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class KakaoHttpClient:
+    """Kakao 호출 공유 클라이언트. start()/aclose()는 앱 lifespan에서 호출한다."""
+
+    def __init__(self) -> None:
+        self._client: Optional[httpx.AsyncClient] = None
+        self.breaker = CircuitBreaker(KAKAO_CIRCUIT_FAILURE_THRESHOLD, KAKAO_CIRCUIT_RESET_SECONDS)
+
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                KAKAO_HTTP_READ_TIMEOUT,
+                connect=KAKAO_HTTP_CONNECT_TIMEOUT,
+                pool=KAKAO_HTTP_CONNECT_TIMEOUT,
+            ),
+            limits=httpx.Limits(
+                max_connections=KAKAO_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=KAKAO_HTTP_MAX_CONNECTIONS,
+            ),
+        )
+
+    async def start(self) -> None:
+        if self._client is None:
+            self._client = self._build_client()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # lifespan 밖(스크립트 등)에서 쓰이면 처음 호출 시 생성
+        if self._client is None:
+            self._client = self._build_client()
+        return self._client
+
+    def _retryable(self, method: str, exc: Optional[Exception], response: Optional[httpx.Response]) -> bool:
+        if exc is not None:
+            return method == "GET" or isinstance(exc, _NOT_SENT_ERRORS)
+        return method == "GET" and response is not None and response.status_code >= 500
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """재시도·서킷 브레이커를 적용해 요청한다. 4xx/5xx 응답은 그대로 반환 (raise_for_status는 호출자)."""
+        if not self.breaker.allow():
+            raise KakaoUnavailableError("Kakao 호출이 일시 중단되었습니다 (circuit open).")
+        # 어떤 경로로 끝나든 브레이커에 결과를 남긴다 (half-open 시험 슬롯이 잠긴 채로 남지 않도록)
+        settled = False
+        try:
+            attempt = 0
+            while True:
+                exc: Optional[Exception] = None
+                response: Optional[httpx.Response] = None
+                try:
+                    response = await self.client.request(method, url, **kwargs)
+                except httpx.TransportError as e:
+                    exc = e
+                failed = exc is not None or response.status_code >= 500
+                if not failed:
+                    self.breaker.record_success()
+                    settled = True
+                    return response
+                if attempt < KAKAO_HTTP_MAX_RETRIES and self._retryable(method, exc, response):
+                    await asyncio.sleep(_RETRY_BACKOFF_SECONDS * (2 ** attempt))
+                    attempt += 1
+                    continue
+                self.breaker.record_failure()
+                settled = True
+                if exc is not None:
+                    raise KakaoUnavailableError(f"Kakao 요청 실패: {exc!r}") from exc
+                return response
+        except httpx.HTTPError:
+            # 전송 오류 외 httpx 오류(DecodingError 등)도 Kakao 쪽 실패로 센다
+            self.breaker.record_failure()
+            settled = True
+            raise
+        finally:
+            # 취소(CancelledError) 등 결과 없이 끝나면 실패로 세지 않고 시험 슬롯만 돌려준다
+            if not settled:
+                self.breaker.release_trial()
+
+
+kakao_http_client = KakaoHttpClient()
@@ -2,8 +2,7 @@
 
 from abc import ABC, abstractmethod
 
-from sqlalchemy.orm import Session
-
+from core.database import DBSession
 from domains.auth.schemas import AccessTokenResponse, KakaoUserInfo, OAuthLinkResponse
 
 
@@ -16,11 +15,11 @@ class KakaoAuthServiceInterface(ABC):
         ...
 
     @abstractmethod
-    def request_access_token(self, code: str, db: Session) -> AccessTokenResponse:
+    async def request_access_token(self, code: str, db: DBSession) -> AccessTokenResponse:
         """인가 코드로 Kakao 토큰·사용자 조회 후, DB에 사용자 저장/조회하고 JWT 및 우리 사용자 정보를 반환한다."""
         ...
 
     @abstractmethod
-    def get_user_info(self, access_token: str) -> KakaoUserInfo:
+    async def get_user_info(self, access_token: str) -> KakaoUserInfo:
         """액세스 토큰으로 Kakao 사용자 정보를 조회한다 (PM-JIHYUN-4)."""
         ...
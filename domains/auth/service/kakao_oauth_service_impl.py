@@ -8,26 +8,35 @@
 
 import os
 from datetime import datetime, timedelta, timezone
+from typing import Tuple
 from urllib.parse import urlencode
 
-import httpx
 import jwt
+from sqlalchemy import func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from sqlmodel import select
 
+from core.database import DBSession, run_db
+from core.events import USER_UPDATED, publish
+from core.writes import returning_columns, schema_from_row
 from domains.auth.schemas import (
     AccessTokenResponse,
     AuthUserResponse,
     KakaoUserInfo,
     OAuthLinkResponse,
 )
+from domains.auth.service.kakao_client import (
+    KAKAO_API_BASE_URL,
+    KAKAO_AUTH_BASE_URL,
+    kakao_http_client,
+)
 from domains.auth.service.kakao_oauth_service import KakaoAuthServiceInterface
 from models.user import User
 
-# Kakao OAuth 상수 (엔드포인트 URL만 하드코딩)
-KAKAO_AUTH_URL = "https://kauth.kakao.com/oauth/authorize"
-KAKAO_TOKEN_URL = "https://kauth.kakao.com/oauth/token"
-KAKAO_USER_ME_URL = "https://kapi.kakao.com/v2/user/me"
+# Kakao OAuth 엔드포인트 (호스트는 KAKAO_AUTH_BASE_URL / KAKAO_API_BASE_URL)
+KAKAO_AUTH_URL = f"{KAKAO_AUTH_BASE_URL}/oauth/authorize"
+KAKAO_TOKEN_URL = f"{KAKAO_AUTH_BASE_URL}/oauth/token"
+KAKAO_USER_ME_URL = f"{KAKAO_API_BASE_URL}/v2/user/me"
 
 # JWT: .env에서 JWT_SECRET_KEY, JWT_ALGORITHM(기본 HS256), JWT_EXPIRE_MINUTES 로드
 JWT_ALGORITHM = "HS256"
@@ -62,22 +71,48 @@ class KakaoOAuthServiceImpl(KakaoAuthServiceInterface):
         nickname: str | None,
         email: str | None,
         profile_image_url: str | None,
-    ) -> User:
-        """kakao_id로 사용자 조회. 없으면 새로 생성 후 반환."""
-        stmt = select(User).where(User.kakao_id == kakao_id)
-        user = db.execute(stmt).scalars().first()
-        if user:
-            return user
-        user = User(
+    ) -> Tuple[AuthUserResponse, bool]:
+        """kakao_id로 사용자를 생성하거나 프로필을 갱신해 (사용자, 새로 생성 여부)를 반환한다.
+
+        INSERT ... ON CONFLICT (kakao_id) DO UPDATE ... RETURNING 한 문장이라
+        같은 kakao_id로 동시에 들어온 첫 로그인도 unique 위반 없이 같은 행을 받는다.
+        Kakao가 값을 주지 않은 항목(None)은 기존 값을 유지하고, 프로필이 그대로면 행을 갱신하지 않는다.
+        """
+        now = datetime.utcnow()
+        stmt = pg_insert(User).values(
             kakao_id=kakao_id,
             nickname=nickname,
             email=email,
             profile_image_url=profile_image_url,
+            created_at=now,
+            updated_at=now,
+        )
+        profile = {
+            "nickname": func.coalesce(stmt.excluded.nickname, User.nickname),
+            "email": func.coalesce(stmt.excluded.email, User.email),
+            "profile_image_url": func.coalesce(stmt.excluded.profile_image_url, User.profile_image_url),
+        }
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.kakao_id],
+            set_={**profile, "updated_at": stmt.excluded.updated_at},
+            where=or_(*(getattr(User, name).is_distinct_from(value) for name, value in profile.items())),
+        ).returning(
+            *returning_columns(User, AuthUserResponse),
+            # 새로 삽입된 행이면 xmax = 0
+            literal_column("(xmax = 0)").label("inserted"),
         )
-        db.add(user)
+        row = db.execute(stmt).one_or_none()
+        if row is None:
+            # 프로필이 그대로라 갱신하지 않은 기존 사용자
+            row = db.execute(
+                select(*returning_columns(User, AuthUserResponse)).where(User.kakao_id == kakao_id)
+            ).one()
+            db.commit()
+            return schema_from_row(AuthUserResponse, row), False
         db.commit()
-        db.refresh(user)
-        return user
+        if not row.inserted:
+            publish(USER_UPDATED, user_id=row.id)
+        return schema_from_row(AuthUserResponse, row), row.inserted
 
     def _create_jwt(self, user_id: int) -> tuple[str, int]:
         """우리 DB user_id로 JWT 생성. (token, expires_in_seconds) 반환."""
@@ -109,7 +144,7 @@ class KakaoOAuthServiceImpl(KakaoAuthServiceInterface):
             response_type="code",
         )
 
-    def request_access_token(self, code: str, db: Session) -> AccessTokenResponse:
+    async def request_access_token(self, code: str, db: DBSession) -> AccessTokenResponse:
         """인가 코드로 Kakao 토큰·사용자 조회 → DB에 사용자 저장/조회 → JWT 발급 후 반환."""
         self._validate_oauth_config()
         if not self._client_secret:
@@ -125,22 +160,23 @@ class KakaoOAuthServiceImpl(KakaoAuthServiceInterface):
             "client_secret": self._client_secret,
         }
 
-        with httpx.Client() as client:
-            token_res = client.post(
-                KAKAO_TOKEN_URL,
-                headers={"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"},
-                data=data,
-            )
-            token_res.raise_for_status()
-            token_body = token_res.json()
+        token_res = await kakao_http_client.request(
+            "POST",
+            KAKAO_TOKEN_URL,
+            headers={"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"},
+            data=data,
+        )
+        token_res.raise_for_status()
+        token_body = token_res.json()
 
         access_token = token_body.get("access_token")
         if not access_token:
             raise ValueError("액세스 토큰을 받지 못했습니다.")
 
-        kakao_user = self.get_user_info(access_token)
-        user = self._find_or_create_user(
+        kakao_user = await self.get_user_info(access_token)
+        user, _created = await run_db(
             db,
+            self._find_or_create_user,
             kakao_id=kakao_user.id,
             nickname=kakao_user.nickname,
             email=kakao_user.email,
@@ -152,30 +188,24 @@ class KakaoOAuthServiceImpl(KakaoAuthServiceInterface):
             access_token=jwt_token,
             token_type="bearer",
             expires_in=expires_in,
-            user=AuthUserResponse(
-                id=user.id,
-                kakao_id=user.kakao_id,
-                nickname=user.nickname,
-                email=user.email,
-                profile_image_url=user.profile_image_url,
-            ),
+            user=user,
         )
 
-    def get_user_info(self, access_token: str) -> KakaoUserInfo:
+    async def get_user_info(self, access_token: str) -> KakaoUserInfo:
         """액세스 토큰으로 Kakao 사용자 정보 조회 (PM-JIHYUN-4)."""
         if not access_token or not access_token.strip():
             raise ValueError("액세스 토큰이 필요합니다.")
 
-        with httpx.Client() as client:
-            res = client.get(
-                KAKAO_USER_ME_URL,
-                headers={
-                    "Authorization": f"Bearer {access_token.strip()}",
-                    "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
-                },
-            )
-            res.raise_for_status()
-            body = res.json()
+        res = await kakao_http_client.request(
+            "GET",
+            KAKAO_USER_ME_URL,
+            headers={
+                "Authorization": f"Bearer {access_token.strip()}",
+                "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
+            },
+        )
+        res.raise_for_status()
+        body = res.json()
 
         kakao_account = body.get("kakao_account") or {}
         profile = kakao_account.get("profile") or {}
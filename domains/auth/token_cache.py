@@ -0,0 +1,40 @@
+"""검증된 JWT → 현재 사용자 캐시 (get_current_user).
+
+- 키: Bearer 토큰 문자열, 값: AuthUserResponse.
+- TTL: min(AUTH_CACHE_TTL_SECONDS, 토큰 exp까지 남은 시간) → 만료된 토큰은 캐시에서도 통과하지 않는다.
+- 무효화: USER_UPDATED 이벤트 시 해당 사용자의 항목을 모두 제거.
+- 지표: GET /metrics/caches 의 "auth.user".
+"""
+
+import os
+import time
+from typing import Any, Dict, Optional
+
+from core.cache import TTLCache
+from core.events import USER_UPDATED, subscribe
+from domains.auth.schemas import AuthUserResponse
+
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "300"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+
+auth_user_cache = TTLCache(
+    "auth.user",
+    maxsize=AUTH_CACHE_MAX_ENTRIES,
+    ttl_seconds=AUTH_CACHE_TTL_SECONDS,
+)
+
+
+def cache_auth_user(token: str, payload: Dict[str, Any], user: AuthUserResponse) -> None:
+    """토큰 exp를 넘지 않는 TTL로 저장한다 (exp 없으면 기본 TTL)."""
+    ttl: Optional[float] = AUTH_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(AUTH_CACHE_TTL_SECONDS, float(exp) - time.time())
+    auth_user_cache.set(token, user, ttl=ttl)
+
+
+def _on_user_updated(user_id: int, **_: object) -> None:
+    auth_user_cache.pop_where(lambda _token, user: user.id == user_id)
+
+
+subscribe(USER_UPDATED, _on_user_updated)
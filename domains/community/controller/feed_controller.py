@@ -2,35 +2,81 @@
 
 from typing import Optional
 
-from sqlalchemy.orm import Session
-
-from domains.community.schemas import FeedResponse, ReactionResponse
+from core.database import DBSession, run_db
+from domains.community.schemas import FeedNewResponse, FeedResponse, ReactionResponse, TopMenusResponse
 from domains.community.service.feed_service import FeedServiceInterface
 
 
 class FeedController:
-    def __init__(self, service: FeedServiceInterface, db: Session) -> None:
+    def __init__(self, service: FeedServiceInterface, db: DBSession) -> None:
         self._service = service
         self._db = db
 
-    def get_feed(
+    async def get_feed(
         self,
         category: Optional[str],
         limit: int,
         cursor: Optional[str],
         current_user_id: Optional[int],
+        sort: str = "latest",
     ) -> FeedResponse:
-        return self._service.get_feed(
+        return await run_db(
+            self._db,
+            self._service.get_feed,
+            category=category,
+            limit=limit,
+            cursor=cursor,
+            current_user_id=current_user_id,
+            sort=sort,
+        )
+
+    async def get_feed_etag(
+        self,
+        category: Optional[str],
+        limit: int,
+        cursor: Optional[str],
+        current_user_id: Optional[int],
+        sort: str = "latest",
+    ) -> str:
+        return await run_db(
             self._db,
+            self._service.get_feed_etag,
             category=category,
             limit=limit,
             cursor=cursor,
             current_user_id=current_user_id,
+            sort=sort,
+        )
+
+    async def get_new_since(
+        self,
+        category: Optional[str],
+        after_id: int,
+        limit: int,
+        current_user_id: Optional[int],
+    ) -> FeedNewResponse:
+        return await run_db(
+            self._db,
+            self._service.get_new_since,
+            category=category,
+            after_id=after_id,
+            limit=limit,
+            current_user_id=current_user_id,
+        )
+
+    async def get_top_menus(self, period: str, category: Optional[str], limit: int) -> TopMenusResponse:
+        return await run_db(
+            self._db,
+            self._service.get_top_menus,
+            period=period,
+            category=category,
+            limit=limit,
         )
 
-    def set_reaction(self, record_id: int, user_id: int, reaction: str) -> ReactionResponse:
-        return self._service.set_reaction(
+    async def set_reaction(self, record_id: int, user_id: int, reaction: str) -> ReactionResponse:
+        return await run_db(
             self._db,
+            self._service.set_reaction,
             record_id=record_id,
             user_id=user_id,
             reaction=reaction,
@@ -2,23 +2,30 @@
 커뮤니티 피드 + 반응 API (Backlog-003).
 
 파일명: feed
-- GET /community/feed: 익명 피드 (카테고리/커서/limit)
+- GET /community/feed: 익명 피드 (카테고리/커서/limit/sort, ETag/If-None-Match → 304)
+- GET /community/feed/new: after 이후 새 기록 (폴링용)
+- GET /community/top-menus: 이번 주/달 인기 메뉴 (스트리밍 스케치 근사)
 - POST /records/{record_id}/reactions: 반응 남기기/토글
 """
 
-from typing import Optional
+from typing import Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
-from core.database import get_db
+from core.database import DBSession, get_session
 from core.reactions import is_allowed_reaction_code
 from domains.community.controller.feed_controller import FeedController
-from domains.community.schemas import FeedResponse, ReactionRequest, ReactionResponse
+from domains.community.schemas import (
+    FeedNewResponse,
+    FeedResponse,
+    ReactionRequest,
+    ReactionResponse,
+    TopMenusResponse,
+)
 from domains.community.service.feed_service_impl import FeedServiceImpl
 
 
-def get_feed_controller(db: Session = Depends(get_db)) -> FeedController:
+async def get_feed_controller(db: DBSession = Depends(get_session)) -> FeedController:
     return FeedController(service=FeedServiceImpl(), db=db)
 
 
@@ -26,28 +33,105 @@ def get_feed_controller(db: Session = Depends(get_db)) -> FeedController:
 feed_router = APIRouter()
 
 
+def _parse_record_id(value: str) -> int:
+    """'rec_123' 또는 '123' → 123."""
+    try:
+        return int(value.removeprefix("rec_"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="after는 기록 ID(rec_123 또는 123)여야 합니다.")
+
+
 @feed_router.get(
     "/feed",
     response_model=FeedResponse,
     summary="커뮤니티 피드",
-    description="전체 사용자의 최신 기록을 익명 피드로 반환. userId/닉네임 등 개인 식별 정보 없음.",
+    description=(
+        "전체 사용자의 최신 기록을 익명 피드로 반환. userId/닉네임 등 개인 식별 정보 없음. "
+        "응답의 ETag를 If-None-Match로 보내면 바뀐 것이 없을 때 본문 없이 304를 반환합니다. "
+        "sort=trending이면 최근 반응에 가중치를 둔 인기순이며, 첫 페이지 시점의 순위로 고정되어 페이지를 넘깁니다."
+    ),
+    responses={
+        304: {"description": "If-None-Match와 같은 내용 (본문 없음)"},
+        400: {"description": "인기순 커서 형식 오류 또는 만료 (첫 페이지부터 다시 요청)"},
+    },
 )
-def get_feed(
+async def get_feed(
+    response: Response,
     category: Optional[str] = Query(None, description="음식 카테고리 필터 (예: KOREAN)"),
     limit: int = Query(20, ge=1, le=50, description="페이지당 개수"),
     cursor: Optional[str] = Query(None, description="다음 페이지 커서 (없으면 첫 페이지)"),
+    sort: Literal["latest", "trending"] = Query("latest", description="latest: 최신순 | trending: 인기순"),
+    if_none_match: Optional[str] = Header(None, description="직전 응답의 ETag"),
     controller: FeedController = Depends(get_feed_controller),
     # TODO: 인증 시 user_id 주입, 비로그인 허용 시 None
     user_id: Optional[int] = 1,
-) -> FeedResponse:
-    return controller.get_feed(
+) -> Union[FeedResponse, Response]:
+    # ETag는 피드 버전으로 먼저 계산해, 같으면 페이지 쿼리 없이 304
+    etag = await controller.get_feed_etag(
         category=category,
         limit=limit,
         cursor=cursor,
         current_user_id=user_id,
+        sort=sort,
+    )
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match is not None and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    feed = await controller.get_feed(
+        category=category,
+        limit=limit,
+        cursor=cursor,
+        current_user_id=user_id,
+        sort=sort,
+    )
+    response.headers.update(headers)
+    return feed
+
+
+@feed_router.get(
+    "/feed/new",
+    response_model=FeedNewResponse,
+    summary="피드 새 기록 폴링",
+    description=(
+        "after보다 새 기록만 반환합니다. 새 기록이 없으면 DB 조회 없이 빈 배열을 반환합니다. "
+        "응답의 latestId를 다음 요청의 after로 사용하세요."
+    ),
+    responses={400: {"description": "after 형식 오류"}},
+)
+async def get_feed_new(
+    after: str = Query(..., description="클라이언트가 가진 가장 최신 기록 ID (rec_123 또는 123)"),
+    category: Optional[str] = Query(None, description="음식 카테고리 필터 (예: KOREAN)"),
+    limit: int = Query(50, ge=1, le=100, description="최대 개수 (초과 시 truncated=true)"),
+    controller: FeedController = Depends(get_feed_controller),
+    # TODO: 인증 시 user_id 주입, 비로그인 허용 시 None
+    user_id: Optional[int] = 1,
+) -> FeedNewResponse:
+    return await controller.get_new_since(
+        category=category,
+        after_id=_parse_record_id(after),
+        limit=limit,
+        current_user_id=user_id,
     )
 
 
+@feed_router.get(
+    "/top-menus",
+    response_model=TopMenusResponse,
+    summary="커뮤니티 인기 메뉴",
+    description=(
+        "이번 주(월~일) 또는 이번 달 전체 사용자의 최다 기록 메뉴. 메모리 스케치로 근사하며 "
+        "count는 실제보다 최대 errorBound(N/m)만큼 클 수 있고, minCount는 실제 기록 수의 하한입니다."
+    ),
+)
+async def get_top_menus(
+    period: Literal["week", "month"] = Query("week", description="week | month"),
+    category: Optional[str] = Query(None, description="음식 카테고리 필터 (예: KOREAN)"),
+    limit: int = Query(10, ge=1, le=50, description="최대 개수"),
+    controller: FeedController = Depends(get_feed_controller),
+) -> TopMenusResponse:
+    return await controller.get_top_menus(period=period, category=category, limit=limit)
+
+
 # POST /records/{record_id}/reactions → prefix 없이 마운트
 reactions_router = APIRouter()
 
@@ -59,7 +143,7 @@ reactions_router = APIRouter()
     description="허용 코드: like, love, yummy. 동일 반응 재요청 시 제거(removed).",
     responses={400: {"description": "reaction 코드 오류"}, 401: {"description": "미인증"}, 404: {"description": "기록 없음"}},
 )
-def post_reaction(
+async def post_reaction(
     record_id: int,
     body: ReactionRequest,
     controller: FeedController = Depends(get_feed_controller),
@@ -68,4 +152,4 @@ def post_reaction(
 ) -> ReactionResponse:
     if not is_allowed_reaction_code(body.reaction):
         raise HTTPException(status_code=400, detail=f"Invalid reaction. Allowed: like, love, yummy")
-    return controller.set_reaction(record_id=record_id, user_id=user_id, reaction=body.reaction)
+    return await controller.set_reaction(record_id=record_id, user_id=user_id, reaction=body.reaction)
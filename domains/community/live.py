@@ -0,0 +1,91 @@
+"""
+반응 수 실시간 채널 (WebSocket).
+
+- WS /community/live
+  - 클라이언트 → 서버: {"type": "subscribe", "recordIds": ["rec_1", "rec_2"]}  (화면의 기록으로 교체)
+  - 서버 → 클라이언트: {"type": "subscribed", "recordIds": [...]}  (적용된 목록, 최대 개수 제한)
+  - 서버 → 클라이언트: {"type": "counts", "items": {"rec_1": {"like": 3, "love": 0, "yummy": 1}}}
+    LIVE_FLUSH_INTERVAL_MS마다 변경된 기록만, 기록별 최신 counts로 합쳐서 보낸다.
+- 전송이 LIVE_SEND_TIMEOUT_SECONDS 안에 끝나지 않는 느린 클라이언트는 연결을 닫는다.
+"""
+
+import asyncio
+import json
+from typing import List, Optional
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+from domains.community.service.live_hub import (
+    LIVE_FLUSH_INTERVAL_MS,
+    LIVE_SEND_TIMEOUT_SECONDS,
+    LiveSubscriber,
+    live_hub,
+)
+
+# WS /community/live → prefix "/community" 로 마운트
+live_router = APIRouter()
+
+
+def _parse_record_ids(values: object) -> List[int]:
+    if not isinstance(values, list):
+        raise ValueError("recordIds는 배열이어야 합니다.")
+    return [int(str(v).removeprefix("rec_")) for v in values]
+
+
+async def _receive_message(websocket: WebSocket) -> Optional[object]:
+    """텍스트 프레임 하나를 JSON으로 읽는다. JSON이 아니거나 바이너리 프레임이면 None."""
+    frame = await websocket.receive()
+    if frame["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(frame.get("code", 1000))
+    text = frame.get("text")
+    if text is None:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+async def _flush_loop(websocket: WebSocket, subscriber: LiveSubscriber) -> None:
+    interval = LIVE_FLUSH_INTERVAL_MS / 1000
+    while True:
+        await asyncio.sleep(interval)
+        pending = live_hub.drain(subscriber)
+        if not pending:
+            continue
+        message = {"type": "counts", "items": {f"rec_{rid}": counts for rid, counts in pending.items()}}
+        try:
+            await asyncio.wait_for(websocket.send_json(message), LIVE_SEND_TIMEOUT_SECONDS)
+        except Exception:
+            # 느리거나 끊긴 클라이언트: 연결을 닫아 수신 루프도 끝나게 한다
+            try:
+                await websocket.close(code=1011)
+            except Exception:
+                pass
+            return
+
+
+@live_router.websocket("/live")
+async def live_reaction_counts(websocket: WebSocket) -> None:
+    """화면에 보이는 기록의 반응 수 변경을 묶어서 실시간으로 보낸다."""
+    await websocket.accept()
+    subscriber = live_hub.register()
+    flusher = asyncio.create_task(_flush_loop(websocket, subscriber))
+    try:
+        while True:
+            message = await _receive_message(websocket)
+            if not isinstance(message, dict) or message.get("type") != "subscribe":
+                await websocket.send_json({"type": "error", "detail": "지원하지 않는 메시지입니다."})
+                continue
+            try:
+                record_ids = _parse_record_ids(message.get("recordIds"))
+            except ValueError as e:
+                await websocket.send_json({"type": "error", "detail": str(e)})
+                continue
+            applied = live_hub.set_records(subscriber, record_ids)
+            await websocket.send_json({"type": "subscribed", "recordIds": [f"rec_{rid}" for rid in sorted(applied)]})
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        flusher.cancel()
+        live_hub.unregister(subscriber)
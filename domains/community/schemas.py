@@ -1,6 +1,6 @@
 """Community Feed + Reactions API 스키마 (Backlog-003)."""
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -38,6 +38,48 @@ class FeedResponse(BaseModel):
     next_cursor: Optional[str] = Field(None, alias="nextCursor")
 
 
+
+class FeedNewResponse(BaseModel):
+    """after 이후 새 기록 (GET /community/feed/new)."""
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    items: list[FeedItem] = Field(..., alias="items", description="새 기록 (id DESC), 없으면 빈 배열")
+    latest_id: Optional[str] = Field(
+        None, alias="latestId", description="다음 폴링에 after로 보낼 최신 기록 ID (기록이 없으면 null)"
+    )
+    truncated: bool = Field(
+        False, description="새 기록이 limit보다 많아 일부만 담김 → 피드 첫 페이지를 다시 불러온다"
+    )
+
+# --- Top menus ---
+
+class TopMenuItem(BaseModel):
+    """인기 메뉴 항목 (SpaceSaving 추정)."""
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    menu_name: str = Field(..., alias="menuName")
+    count: int = Field(..., description="추정 기록 수 (실제 이상, 최대 errorBound만큼 큼)")
+    min_count: int = Field(..., alias="minCount", description="실제 기록 수의 하한")
+
+
+class TopMenusResponse(BaseModel):
+    """커뮤니티 인기 메뉴 (GET /community/top-menus)."""
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    period: str = Field(..., description="week | month")
+    from_date: date = Field(..., alias="from", description="기간 시작일")
+    to_date: date = Field(..., alias="to", description="기간 종료일")
+    category: Optional[str] = Field(None, description="카테고리 필터 (null = 전체)")
+    total: int = Field(..., description="집계된 기록 수 N")
+    error_bound: float = Field(
+        ..., alias="errorBound", description="count의 최대 과대추정 N/m (m = 스케치 크기)"
+    )
+    items: list[TopMenuItem] = Field(..., description="추정 기록 수 내림차순")
+
+
 # --- Reactions ---
 
 class ReactionRequest(BaseModel):
@@ -0,0 +1,63 @@
+"""커뮤니티 피드 공개 페이지 캐시 (Backlog-003).
+
+피드의 items/category/counts는 모든 사용자에게 같고 myReaction만 개인별이다.
+공개 페이지를 (category, cursor, limit) 키로 캐시하고, myReaction은 요청마다 덧씌운다.
+
+무효화 (core.events):
+- 기록 생성: 새 기록은 항상 가장 큰 id라 첫 페이지(cursor 없음)에만 나타난다
+  → 해당 카테고리·전체 피드의 첫 페이지만 제거.
+- 대량 적재: 적재된 기록 id 범위를 알 수 없으므로 전체 제거.
+- 반응 변경: 해당 기록을 포함한 페이지만 제거.
+"""
+
+import os
+from typing import NamedTuple, Optional, Tuple
+
+from core.cache import TTLCache
+from core.events import LUNCH_RECORD_CREATED, LUNCH_RECORDS_IMPORTED, REACTION_CHANGED, subscribe
+from domains.community.schemas import FeedItem
+
+FEED_CACHE_TTL_SECONDS = float(os.getenv("FEED_CACHE_TTL_SECONDS", "10"))
+FEED_CACHE_MAX_ENTRIES = int(os.getenv("FEED_CACHE_MAX_ENTRIES", "512"))
+
+# (category, cursor_id, limit)
+FeedCacheKey = Tuple[Optional[str], Optional[int], int]
+
+
+class FeedPage(NamedTuple):
+    """공개 피드 페이지 (myReaction 제외)."""
+
+    record_ids: Tuple[int, ...]
+    items: Tuple[FeedItem, ...]
+    next_cursor: Optional[str]
+
+
+feed_page_cache = TTLCache(
+    "community.feed",
+    maxsize=FEED_CACHE_MAX_ENTRIES,
+    ttl_seconds=FEED_CACHE_TTL_SECONDS,
+)
+
+
+def feed_cache_key(category: Optional[str], cursor_id: Optional[int], limit: int) -> FeedCacheKey:
+    return (category or None, cursor_id, limit)
+
+
+def _on_lunch_record_created(category: Optional[str] = None, **_: object) -> None:
+    category = category or None
+    feed_page_cache.pop_where(
+        lambda key, _page: key[1] is None and key[0] in (None, category)
+    )
+
+
+def _on_lunch_records_imported(**_: object) -> None:
+    feed_page_cache.clear()
+
+
+def _on_reaction_changed(record_id: int, **_: object) -> None:
+    feed_page_cache.pop_where(lambda _key, page: record_id in page.record_ids)
+
+
+subscribe(LUNCH_RECORD_CREATED, _on_lunch_record_created)
+subscribe(LUNCH_RECORDS_IMPORTED, _on_lunch_records_imported)
+subscribe(REACTION_CHANGED, _on_reaction_changed)
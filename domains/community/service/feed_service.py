@@ -5,7 +5,7 @@ from typing import Optional
 
 from sqlalchemy.orm import Session
 
-from domains.community.schemas import FeedResponse, ReactionResponse
+from domains.community.schemas import FeedNewResponse, FeedResponse, ReactionResponse, TopMenusResponse
 
 
 class FeedServiceInterface(ABC):
@@ -17,8 +17,45 @@ class FeedServiceInterface(ABC):
         limit: int,
         cursor: Optional[str],
         current_user_id: Optional[int],
+        sort: str = "latest",
     ) -> FeedResponse:
-        """커뮤니티 피드 조회 (익명, 카테고리/커서/limit)."""
+        """커뮤니티 피드 조회 (익명, 카테고리/커서/limit). sort: latest(id DESC) | trending(인기 점수)."""
+        ...
+
+    @abstractmethod
+    def get_feed_etag(
+        self,
+        db: Session,
+        category: Optional[str],
+        limit: int,
+        cursor: Optional[str],
+        current_user_id: Optional[int],
+        sort: str = "latest",
+    ) -> str:
+        """피드 조회 없이 계산하는 약한 ETag. 피드 내용이 바뀔 수 있으면 값이 바뀐다."""
+        ...
+
+    @abstractmethod
+    def get_new_since(
+        self,
+        db: Session,
+        category: Optional[str],
+        after_id: int,
+        limit: int,
+        current_user_id: Optional[int],
+    ) -> FeedNewResponse:
+        """after_id보다 큰 id의 새 기록. 새 기록이 없으면 DB를 조회하지 않는다."""
+        ...
+
+    @abstractmethod
+    def get_top_menus(
+        self,
+        db: Session,
+        period: str,
+        category: Optional[str],
+        limit: int,
+    ) -> TopMenusResponse:
+        """이번 주/달 인기 메뉴 (메모리 스케치, DB 조회 없음)."""
         ...
 
     @abstractmethod
@@ -1,24 +1,184 @@
 """Community Feed Service 구현체 (Backlog-003)."""
 
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+import hashlib
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import null, select, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from core.reactions import ALLOWED_REACTION_CODES
-from domains.community.schemas import FeedItem, FeedResponse, ReactionResponse
+from core.events import REACTION_CHANGED, publish
+from core.reactions import ALLOWED_REACTION_CODES, REACTION_CODE_TO_ID, REACTION_ID_TO_CODE
+from domains.community.schemas import (
+    FeedItem,
+    FeedNewResponse,
+    FeedResponse,
+    ReactionResponse,
+    TopMenuItem,
+    TopMenusResponse,
+)
+from domains.community.service.feed_cache import FeedPage, feed_cache_key, feed_page_cache
 from domains.community.service.feed_service import FeedServiceInterface
+from domains.community.service.feed_watermark import feed_watermark
+from domains.community.service.reaction_buffer import RecordNotFound, is_write_behind, reaction_buffer
+from domains.community.service.reaction_counts import (
+    apply_reaction_count_deltas,
+    default_counts,
+    get_reaction_counts,
+)
+from domains.community.service.top_menus import top_menu_sketches
+from domains.community.service.trending import parse_trending_cursor, trending_cursor, trending_tracker
 from models import LunchRecord
-from models.community import Reaction
+from models.community import Reaction, ReactionCount
+
+
+# 반응 토글을 한 문장으로 처리한다 (Backlog-001 §3.2: 1인 1기록당 1건, 같은 반응 재요청 시 취소).
+# - old: 기존 반응 행을 FOR UPDATE로 잠근다 (같은 사용자의 동시 요청 직렬화)
+# - removed/changed/inserted: 셋 중 최대 하나만 행을 바꾼다
+# - result가 NULL이면 동시 요청이 먼저 삽입한 경우 → 호출자가 재시도
+# - :reaction / previous는 reaction_types.id (SMALLINT)
+# - removed_at: 취소된 반응의 created_at (인기 점수에서 그 시각의 가중치를 뺀다)
+_TOGGLE_REACTION_SQL = text(
+    """
+    WITH old AS (
+        SELECT id, reaction_type
+        FROM reactions
+        WHERE lunch_record_id = :record_id AND user_id = :user_id
+        FOR UPDATE
+    ),
+    removed AS (
+        DELETE FROM reactions
+        WHERE id IN (SELECT id FROM old WHERE reaction_type = :reaction)
+        RETURNING id, created_at
+    ),
+    changed AS (
+        UPDATE reactions
+        SET reaction_type = CAST(:reaction AS SMALLINT)
+        WHERE id IN (SELECT id FROM old WHERE reaction_type <> :reaction)
+        RETURNING id
+    ),
+    inserted AS (
+        INSERT INTO reactions (lunch_record_id, user_id, reaction_type, created_at)
+        SELECT CAST(:record_id AS INTEGER), CAST(:user_id AS INTEGER),
+               CAST(:reaction AS SMALLINT), CAST(:created_at AS TIMESTAMP)
+        WHERE NOT EXISTS (SELECT 1 FROM old)
+        ON CONFLICT (lunch_record_id, user_id) DO NOTHING
+        RETURNING id
+    )
+    SELECT
+        CASE
+            WHEN EXISTS (SELECT 1 FROM removed) THEN 'removed'
+            WHEN EXISTS (SELECT 1 FROM changed) THEN 'updated'
+            WHEN EXISTS (SELECT 1 FROM inserted) THEN 'set'
+        END AS result,
+        (SELECT reaction_type FROM old) AS previous,
+        (SELECT created_at FROM removed) AS removed_at
+    """
+)
+_TOGGLE_MAX_ATTEMPTS = 3
+
+
+# 피드 조회 경로: single(기본, 컬럼 프로젝션 + 한 번의 왕복) | multi(기존 3-쿼리, 비교용)
+FEED_QUERY_MODE = os.getenv("FEED_QUERY_MODE", "single")
+
+_KST = timezone(offset=timedelta(hours=9))
 
 
 def _record_id_str(pk: int) -> str:
     return f"rec_{pk}"
 
 
-def _default_counts() -> Dict[str, int]:
-    return {code: 0 for code in ALLOWED_REACTION_CODES}
+def _feed_item(
+    record_id: int,
+    created_at: datetime,
+    recorded_at: date,
+    category: Optional[str],
+    menu_name: Optional[str],
+    reactions: Dict[str, int],
+) -> FeedItem:
+    """피드 항목 (익명: user_id 없음, myReaction은 호출자가 채운다)."""
+    eaten_at = datetime.combine(recorded_at, datetime.min.time()).replace(tzinfo=_KST)
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return FeedItem(
+        record_id=_record_id_str(record_id),
+        created_at=created_at,
+        eaten_at=eaten_at,
+        category=category,
+        menu_name=menu_name,
+        reactions=reactions,
+        my_reaction=None,
+    )
+
+
+def _feed_columns(current_user_id: Optional[int]) -> list:
+    """피드 항목 컬럼.
+
+    - 피드에 필요한 컬럼만 선택 (content 등 제외)
+    - 코드별 반응 수: reaction_counts PK 상관 서브쿼리
+    - myReaction: (lunch_record_id, user_id) 유니크 상관 서브쿼리
+    """
+    count_columns = [
+        select(ReactionCount.count)
+        .where(ReactionCount.lunch_record_id == LunchRecord.id)
+        .where(ReactionCount.reaction_type == REACTION_CODE_TO_ID[code])
+        .scalar_subquery()
+        .label(f"count_{code}")
+        for code in ALLOWED_REACTION_CODES
+    ]
+    if current_user_id is not None:
+        my_reaction = (
+            select(Reaction.reaction_type)
+            .where(Reaction.lunch_record_id == LunchRecord.id)
+            .where(Reaction.user_id == current_user_id)
+            .scalar_subquery()
+        )
+    else:
+        my_reaction = null()
+    return [
+        LunchRecord.id,
+        LunchRecord.created_at,
+        LunchRecord.recorded_at,
+        LunchRecord.category,
+        LunchRecord.menu_name,
+        *count_columns,
+        my_reaction.label("my_reaction"),
+    ]
+
+
+def _feed_page_statement(
+    category: Optional[str],
+    cursor_id: Optional[int],
+    limit: int,
+    current_user_id: Optional[int],
+    after_id: Optional[int] = None,
+):
+    """피드 한 페이지를 한 문장으로 조회한다 (after_id가 있으면 그보다 새 기록만).
+
+    LIMIT 안의 행에 대해서만 서브쿼리가 실행된다.
+    """
+    stmt = (
+        select(*_feed_columns(current_user_id))
+        .order_by(LunchRecord.id.desc())
+        .limit(limit + 1)
+    )
+    if category is not None and category != "":
+        stmt = stmt.where(LunchRecord.category == category)
+    if cursor_id is not None:
+        stmt = stmt.where(LunchRecord.id < cursor_id)
+    if after_id is not None:
+        stmt = stmt.where(LunchRecord.id > after_id)
+    return stmt
+
+
+def _feed_row(row) -> Tuple[FeedItem, Optional[str]]:
+    """_feed_columns 한 행 → (공개 피드 항목, myReaction 코드)."""
+    counts = {code: max(row._mapping[f"count_{code}"] or 0, 0) for code in ALLOWED_REACTION_CODES}
+    item = _feed_item(row.id, row.created_at, row.recorded_at, row.category, row.menu_name, counts)
+    my_reaction = REACTION_ID_TO_CODE.get(row.my_reaction) if row.my_reaction is not None else None
+    return item, my_reaction
 
 
 class FeedServiceImpl(FeedServiceInterface):
@@ -29,8 +189,172 @@ class FeedServiceImpl(FeedServiceInterface):
         limit: int,
         cursor: Optional[str],
         current_user_id: Optional[int],
+        sort: str = "latest",
     ) -> FeedResponse:
+        if sort == "trending":
+            return self._get_trending_feed(db, category, limit, cursor, current_user_id)
+
         # Cursor: last seen record id (exclusive). Order by id DESC.
+        cursor_id: Optional[int] = None
+        if cursor is not None and cursor != "":
+            try:
+                cursor_id = int(cursor)
+            except ValueError:
+                pass
+
+        # 공개 페이지(items/counts)는 캐시, myReaction만 사용자별로 덧씌운다
+        key = feed_cache_key(category, cursor_id, limit)
+        page = feed_page_cache.get(key)
+        my_reactions: Optional[Dict[int, str]] = None
+        if page is None:
+            if FEED_QUERY_MODE == "multi":
+                page = self._load_public_page(db, category, cursor_id, limit)
+            else:
+                page, my_reactions = self._load_page(db, category, cursor_id, limit, current_user_id)
+            feed_page_cache.set(key, page)
+
+        if not page.record_ids:
+            return FeedResponse(items=[], next_cursor=None)
+
+        # Current user's reaction per record (캐시 적중 시에만 별도 조회)
+        if my_reactions is None:
+            my_reactions = self._load_my_reactions(db, page.record_ids, current_user_id)
+
+        items = [
+            item.model_copy(update={"my_reaction": my_reactions.get(rid)})
+            for rid, item in zip(page.record_ids, page.items)
+        ]
+        return FeedResponse(items=items, next_cursor=page.next_cursor)
+
+    def get_feed_etag(
+        self,
+        db: Session,
+        category: Optional[str],
+        limit: int,
+        cursor: Optional[str],
+        current_user_id: Optional[int],
+        sort: str = "latest",
+    ) -> str:
+        """요청 키 + 최신 기록 id + 피드 버전으로 만든다 (페이지 쿼리 없음, 필요하면 max(id) 한 행 조회)."""
+        latest = feed_watermark.latest(category)
+        if latest is None:
+            latest = feed_watermark.refresh(db, category)
+        key = "|".join(
+            str(part)
+            for part in (
+                sort,
+                category or "",
+                cursor or "",
+                limit,
+                current_user_id or "",
+                latest,
+                feed_watermark.version,
+            )
+        )
+        return f'W/"{hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]}"'
+
+    def _load_page(
+        self,
+        db: Session,
+        category: Optional[str],
+        cursor_id: Optional[int],
+        limit: int,
+        current_user_id: Optional[int],
+        after_id: Optional[int] = None,
+    ) -> Tuple[FeedPage, Dict[int, str]]:
+        """한 번의 왕복으로 공개 페이지와 현재 사용자 반응을 함께 조회한다."""
+        rows = db.execute(
+            _feed_page_statement(category, cursor_id, limit, current_user_id, after_id)
+        ).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = str(rows[-1].id) if has_more and rows else None
+
+        items: List[FeedItem] = []
+        my_reactions: Dict[int, str] = {}
+        for row in rows:
+            item, my_reaction = _feed_row(row)
+            items.append(item)
+            if my_reaction is not None:
+                my_reactions[row.id] = my_reaction
+        page = FeedPage(
+            record_ids=tuple(row.id for row in rows),
+            items=tuple(items),
+            next_cursor=next_cursor,
+        )
+        return page, my_reactions
+
+    def _get_trending_feed(
+        self,
+        db: Session,
+        category: Optional[str],
+        limit: int,
+        cursor: Optional[str],
+        current_user_id: Optional[int],
+    ) -> FeedResponse:
+        """인기순 피드. 첫 페이지에서 고정한 순위 스냅샷을 오프셋 커서로 넘긴다."""
+        category = category or None
+        if cursor:
+            parsed = parse_trending_cursor(cursor)
+            snapshot = trending_tracker.get_snapshot(parsed[0]) if parsed else None
+            if snapshot is None or snapshot.category != category:
+                from fastapi import HTTPException
+                raise HTTPException(status_code=400, detail="인기순 커서가 올바르지 않거나 만료되었습니다. 첫 페이지부터 다시 요청하세요.")
+            offset = parsed[1]
+        else:
+            snapshot = trending_tracker.snapshot(db, category)
+            offset = 0
+
+        page_ids = snapshot.record_ids[offset:offset + limit]
+        end = offset + len(page_ids)
+        next_cursor = trending_cursor(snapshot.snapshot_id, end) if end < len(snapshot.record_ids) else None
+        if not page_ids:
+            return FeedResponse(items=[], next_cursor=None)
+
+        rows = db.execute(
+            select(*_feed_columns(current_user_id)).where(LunchRecord.id.in_(page_ids))
+        ).all()
+        by_id = {row.id: _feed_row(row) for row in rows}
+        # 스냅샷 순서 유지 (그 사이 지워진 기록은 건너뛴다)
+        items = [
+            item.model_copy(update={"my_reaction": my_reaction})
+            for item, my_reaction in (by_id[rid] for rid in page_ids if rid in by_id)
+        ]
+        return FeedResponse(items=items, next_cursor=next_cursor)
+
+    def get_new_since(
+        self,
+        db: Session,
+        category: Optional[str],
+        after_id: int,
+        limit: int,
+        current_user_id: Optional[int],
+    ) -> FeedNewResponse:
+        latest = feed_watermark.latest(category)
+        if latest is None:
+            latest = feed_watermark.refresh(db, category)
+        latest_id = _record_id_str(latest) if latest else None
+        # 최신 id가 그대로면 DB 조회 없이 빈 응답
+        if latest <= after_id:
+            return FeedNewResponse(items=[], latest_id=latest_id, truncated=False)
+
+        page, my_reactions = self._load_page(db, category, None, limit, current_user_id, after_id=after_id)
+        items = [
+            item.model_copy(update={"my_reaction": my_reactions.get(rid)})
+            for rid, item in zip(page.record_ids, page.items)
+        ]
+        if page.record_ids:
+            latest_id = _record_id_str(max(latest, page.record_ids[0]))
+        return FeedNewResponse(items=items, latest_id=latest_id, truncated=page.next_cursor is not None)
+
+    def _load_public_page(
+        self,
+        db: Session,
+        category: Optional[str],
+        cursor_id: Optional[int],
+        limit: int,
+    ) -> FeedPage:
+        """FEED_QUERY_MODE=multi: 기록(ORM 전체 컬럼)과 counts를 나눠 조회하는 기존 경로."""
         stmt = (
             select(LunchRecord)
             .order_by(LunchRecord.id.desc())
@@ -38,68 +362,78 @@ class FeedServiceImpl(FeedServiceInterface):
         )
         if category is not None and category != "":
             stmt = stmt.where(LunchRecord.category == category)
-        if cursor is not None and cursor != "":
-            try:
-                cursor_id = int(cursor)
-                stmt = stmt.where(LunchRecord.id < cursor_id)
-            except ValueError:
-                pass
+        if cursor_id is not None:
+            stmt = stmt.where(LunchRecord.id < cursor_id)
         rows = db.execute(stmt).scalars().all()
         has_more = len(rows) > limit
         records = list(rows[:limit])
         next_cursor = str(records[-1].id) if has_more and records else None
 
         if not records:
-            return FeedResponse(items=[], next_cursor=None)
+            return FeedPage(record_ids=(), items=(), next_cursor=None)
 
         record_ids = [r.id for r in records]
 
-        # Reaction counts per record: { record_id: { "like": n, "love": n, "yummy": n } }
-        count_stmt = (
-            select(Reaction.lunch_record_id, Reaction.reaction_type, func.count(Reaction.id))
+        # Reaction counts per record (PK lookup on reaction_counts)
+        counts_by_record = get_reaction_counts(db, record_ids)
+
+        items = [
+            _feed_item(
+                r.id,
+                r.created_at,
+                r.recorded_at,
+                r.category,
+                r.menu_name,
+                counts_by_record.get(r.id, default_counts()),
+            )
+            for r in records
+        ]
+        return FeedPage(record_ids=tuple(record_ids), items=tuple(items), next_cursor=next_cursor)
+
+    def _load_my_reactions(
+        self,
+        db: Session,
+        record_ids: Sequence[int],
+        current_user_id: Optional[int],
+    ) -> Dict[int, str]:
+        my_reactions: Dict[int, str] = {}
+        if current_user_id is None or not record_ids:
+            return my_reactions
+        my_stmt = (
+            select(Reaction.lunch_record_id, Reaction.reaction_type)
             .where(Reaction.lunch_record_id.in_(record_ids))
-            .where(Reaction.reaction_type.in_(ALLOWED_REACTION_CODES))
-            .group_by(Reaction.lunch_record_id, Reaction.reaction_type)
+            .where(Reaction.user_id == current_user_id)
         )
-        count_rows = db.execute(count_stmt).all()
-        counts_by_record: Dict[int, Dict[str, int]] = {}
-        for rid in record_ids:
-            counts_by_record[rid] = _default_counts().copy()
-        for rid, rtype, cnt in count_rows:
-            if rtype in ALLOWED_REACTION_CODES:
-                counts_by_record[rid][rtype] = cnt
-
-        # Current user's reaction per record
-        my_reactions: Dict[int, str] = {}
-        if current_user_id is not None:
-            my_stmt = (
-                select(Reaction.lunch_record_id, Reaction.reaction_type)
-                .where(Reaction.lunch_record_id.in_(record_ids))
-                .where(Reaction.user_id == current_user_id)
-            )
-            for rid, rtype in db.execute(my_stmt).all():
-                my_reactions[rid] = rtype
+        for rid, rtype in db.execute(my_stmt).all():
+            my_reactions[rid] = REACTION_ID_TO_CODE.get(rtype)
+        return my_reactions
 
-        # Build items (anonymous: no user_id)
-        tz = timezone(offset=timedelta(hours=9))
-        items: List[FeedItem] = []
-        for r in records:
-            eaten_at = datetime.combine(r.recorded_at, datetime.min.time()).replace(tzinfo=tz)
-            created_at = r.created_at
-            if created_at.tzinfo is None:
-                created_at = created_at.replace(tzinfo=timezone.utc)
-            items.append(
-                FeedItem(
-                    record_id=_record_id_str(r.id),
-                    created_at=created_at,
-                    eaten_at=eaten_at,
-                    category=r.category,
-                    menu_name=r.menu_name,
-                    reactions=counts_by_record.get(r.id, _default_counts()),
-                    my_reaction=my_reactions.get(r.id),
-                )
+    def get_top_menus(
+        self,
+        db: Session,
+        period: str,
+        category: Optional[str],
+        limit: int,
+    ) -> TopMenusResponse:
+        from_date, to_date, sketch = top_menu_sketches.get(period, category)
+        if sketch is None:
+            return TopMenusResponse(
+                period=period, from_date=from_date, to_date=to_date, category=category or None,
+                total=0, error_bound=0.0, items=[],
             )
-        return FeedResponse(items=items, next_cursor=next_cursor)
+        items = [
+            TopMenuItem(menu_name=hit.item, count=hit.count, min_count=hit.lower_bound)
+            for hit in sketch.top(limit)
+        ]
+        return TopMenusResponse(
+            period=period,
+            from_date=from_date,
+            to_date=to_date,
+            category=category or None,
+            total=sketch.total,
+            error_bound=sketch.error_bound,
+            items=items,
+        )
 
     def set_reaction(
         self,
@@ -108,46 +442,58 @@ class FeedServiceImpl(FeedServiceInterface):
         user_id: int,
         reaction: str,
     ) -> ReactionResponse:
-        # Check record exists
-        record = db.get(LunchRecord, record_id)
-        if record is None:
+        if is_write_behind():
+            return self._set_reaction_buffered(db, record_id, user_id, reaction)
+
+        # 1) 토글 문 1회: 기존 반응 잠금 → 삭제/변경/삽입 중 하나 (uq_reactions_record_user 기준)
+        toggled = None
+        for _ in range(_TOGGLE_MAX_ATTEMPTS):
+            try:
+                toggled = db.execute(
+                    _TOGGLE_REACTION_SQL,
+                    {
+                        "record_id": record_id,
+                        "user_id": user_id,
+                        "reaction": REACTION_CODE_TO_ID[reaction],
+                        "created_at": datetime.utcnow(),
+                    },
+                ).one()
+            except IntegrityError:
+                # lunch_records FK 위반 = 기록 없음 (존재 확인용 SELECT 생략)
+                db.rollback()
+                from fastapi import HTTPException
+                raise HTTPException(status_code=404, detail="Record not found")
+            if toggled.result is not None:
+                break
+            # 동시 요청이 먼저 삽입해 ON CONFLICT DO NOTHING → 새 스냅샷으로 재시도
+        if toggled is None or toggled.result is None:
+            db.rollback()
             from fastapi import HTTPException
-            raise HTTPException(status_code=404, detail="Record not found")
+            raise HTTPException(status_code=409, detail="Concurrent reaction update, retry")
 
-        existing = (
-            db.execute(
-                select(Reaction)
-                .where(Reaction.lunch_record_id == record_id)
-                .where(Reaction.user_id == user_id)
-            )
-        ).scalars().first()
-
-        if existing is None:
-            db.add(Reaction(lunch_record_id=record_id, user_id=user_id, reaction_type=reaction))
-            db.commit()
-            result = "set"
-        elif existing.reaction_type == reaction:
-            # Toggle: remove
-            db.delete(existing)
-            db.commit()
-            result = "removed"
+        result = toggled.result
+        previous = REACTION_ID_TO_CODE.get(toggled.previous) if toggled.previous is not None else None
+        if result == "set":
+            deltas = {reaction: 1}
+        elif result == "removed":
+            deltas = {reaction: -1}
         else:
-            existing.reaction_type = reaction
-            db.add(existing)
-            db.commit()
-            result = "updated"
-
-        # Current counts for this record
-        count_stmt = (
-            select(Reaction.reaction_type, func.count(Reaction.id))
-            .where(Reaction.lunch_record_id == record_id)
-            .where(Reaction.reaction_type.in_(ALLOWED_REACTION_CODES))
-            .group_by(Reaction.reaction_type)
+            deltas = {previous: -1, reaction: 1}
+
+        # 2) 카운터 업서트 1회: 같은 트랜잭션에서 증감 → RETURNING으로 최신 counts
+        counts = apply_reaction_count_deltas(db, record_id, deltas)
+        db.commit()
+
+        publish(
+            REACTION_CHANGED,
+            record_id=record_id,
+            user_id=user_id,
+            reaction=reaction,
+            result=result,
+            previous=previous,
+            counts=counts,
+            removed_at=toggled.removed_at,
         )
-        count_rows = db.execute(count_stmt).all()
-        counts = _default_counts().copy()
-        for rtype, cnt in count_rows:
-            counts[rtype] = cnt
 
         return ReactionResponse(
             record_id=_record_id_str(record_id),
@@ -155,3 +501,37 @@ class FeedServiceImpl(FeedServiceInterface):
             result=result,
             counts=counts,
         )
+
+    def _set_reaction_buffered(
+        self,
+        db: Session,
+        record_id: int,
+        user_id: int,
+        reaction: str,
+    ) -> ReactionResponse:
+        """write_behind 모드: 메모리 상태에 토글하고 바로 응답한다. DB 반영은 flush 루프가 한다."""
+        try:
+            toggled = reaction_buffer.toggle(db, record_id, user_id, reaction)
+        except RecordNotFound:
+            from fastapi import HTTPException
+            raise HTTPException(status_code=404, detail="Record not found")
+        # 상태 로딩에 쓴 읽기 트랜잭션을 닫는다
+        db.rollback()
+
+        publish(
+            REACTION_CHANGED,
+            record_id=record_id,
+            user_id=user_id,
+            reaction=reaction,
+            result=toggled.result,
+            previous=toggled.previous,
+            counts=toggled.counts,
+            removed_at=toggled.removed_at,
+        )
+
+        return ReactionResponse(
+            record_id=_record_id_str(record_id),
+            reaction=reaction,
+            result=toggled.result,
+            counts=toggled.counts,
+        )
@@ -0,0 +1,94 @@
+"""카테고리별 최신 기록 id와 피드 버전 (GET /community/feed/new, 피드 ETag 용).
+
+피드는 id DESC 순이므로 "after 이후 새 기록이 있는가"는 최신 id 하나로 판단할 수 있다.
+- 키: category (None = 전체 피드). 처음 조회 시 DB에서 max(id)를 읽어 둔다
+  (category, id DESC) 인덱스 → 한 행 조회.
+- 기록 생성 이벤트로 즉시 올리고, 대량 적재 이벤트면 전부 버린다.
+- 다른 워커 프로세스의 생성은 이벤트로 보이지 않으므로 FEED_WATERMARK_REFRESH_SECONDS마다 DB에서 다시 읽는다.
+- version: 피드 내용(기록·반응 수·myReaction)이 바뀔 수 있는 이벤트마다 1씩 올린다.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from core.events import LUNCH_RECORD_CREATED, LUNCH_RECORDS_IMPORTED, REACTION_CHANGED, subscribe
+from models import LunchRecord
+
+FEED_WATERMARK_REFRESH_SECONDS = float(os.getenv("FEED_WATERMARK_REFRESH_SECONDS", "5"))
+
+
+class FeedWatermark:
+    """category → (최신 id, DB에서 읽은 시각)."""
+
+    def __init__(self, refresh_seconds: float) -> None:
+        self.refresh_seconds = refresh_seconds
+        self._max_ids: Dict[Optional[str], Tuple[int, float]] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def bump(self) -> None:
+        with self._lock:
+            self._version += 1
+
+    def latest(self, category: Optional[str]) -> Optional[int]:
+        """메모리의 최신 id. 읽은 적 없거나 오래됐으면 None (refresh 필요)."""
+        with self._lock:
+            entry = self._max_ids.get(category or None)
+        if entry is None or time.monotonic() - entry[1] > self.refresh_seconds:
+            return None
+        return entry[0]
+
+    def refresh(self, db: Session, category: Optional[str]) -> int:
+        key = category or None
+        stmt = select(func.max(LunchRecord.id))
+        if key is not None:
+            stmt = stmt.where(LunchRecord.category == key)
+        loaded = db.execute(stmt).scalar() or 0
+        with self._lock:
+            current = self._max_ids.get(key)
+            max_id = max(loaded, current[0]) if current else loaded
+            self._max_ids[key] = (max_id, time.monotonic())
+        return max_id
+
+    def observe(self, record_id: int, category: Optional[str]) -> None:
+        """새 기록 반영. 읽어 둔 키만 올린다 (없는 키는 다음 조회 때 DB에서 읽는다)."""
+        with self._lock:
+            self._version += 1
+            for key in {None, category or None}:
+                entry = self._max_ids.get(key)
+                if entry is not None and record_id > entry[0]:
+                    self._max_ids[key] = (record_id, entry[1])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._max_ids.clear()
+
+
+feed_watermark = FeedWatermark(FEED_WATERMARK_REFRESH_SECONDS)
+
+
+def _on_lunch_record_created(record_id: int, category: Optional[str] = None, **_: object) -> None:
+    feed_watermark.observe(record_id, category)
+
+
+def _on_lunch_records_imported(**_: object) -> None:
+    feed_watermark.clear()
+
+
+def _on_reaction_changed(**_: object) -> None:
+    feed_watermark.bump()
+
+
+subscribe(LUNCH_RECORD_CREATED, _on_lunch_record_created)
+subscribe(LUNCH_RECORDS_IMPORTED, _on_lunch_records_imported)
+subscribe(REACTION_CHANGED, _on_reaction_changed)
@@ -0,0 +1,99 @@
+"""반응 수 실시간 전달 허브 (WebSocket /community/live).
+
+- 구독자는 화면에 보이는 기록 id 집합을 등록한다 (최대 LIVE_MAX_RECORDS_PER_CLIENT개).
+- REACTION_CHANGED 이벤트마다 해당 기록을 구독한 연결의 pending[record_id]를 최신 counts로 덮어쓴다.
+  같은 기록의 변경은 합쳐지고(마지막 값만), pending 크기는 구독 기록 수를 넘지 않는다.
+- 발행자는 잠금 안에서 dict 대입만 하므로 느린 클라이언트 때문에 막히지 않는다.
+  전송은 연결별 flush 루프가 LIVE_FLUSH_INTERVAL_MS마다 pending을 비워서 보낸다.
+- 프로세스 내 이벤트라 같은 워커에서 일어난 반응만 전달된다.
+"""
+
+import os
+import threading
+from typing import Dict, Iterable, Set
+
+from core.events import REACTION_CHANGED, subscribe
+
+LIVE_FLUSH_INTERVAL_MS = int(os.getenv("LIVE_FLUSH_INTERVAL_MS", "250"))
+LIVE_MAX_RECORDS_PER_CLIENT = int(os.getenv("LIVE_MAX_RECORDS_PER_CLIENT", "200"))
+LIVE_SEND_TIMEOUT_SECONDS = float(os.getenv("LIVE_SEND_TIMEOUT_SECONDS", "5"))
+
+
+class LiveSubscriber:
+    """WebSocket 연결 하나의 구독 상태."""
+
+    def __init__(self) -> None:
+        self.record_ids: Set[int] = set()
+        self.pending: Dict[int, Dict[str, int]] = {}
+
+
+class LiveHub:
+    def __init__(self) -> None:
+        self._by_record: Dict[int, Set[LiveSubscriber]] = {}
+        self._subscribers: Set[LiveSubscriber] = set()
+        self._lock = threading.Lock()
+
+    def register(self) -> LiveSubscriber:
+        subscriber = LiveSubscriber()
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unregister(self, subscriber: LiveSubscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+            self._detach(subscriber, subscriber.record_ids)
+            subscriber.record_ids = set()
+            subscriber.pending.clear()
+
+    def set_records(self, subscriber: LiveSubscriber, record_ids: Iterable[int]) -> Set[int]:
+        """구독 기록을 교체한다 (앞에서부터 최대 LIVE_MAX_RECORDS_PER_CLIENT개). 적용된 id 집합을 반환."""
+        wanted: Set[int] = set()
+        for rid in record_ids:
+            if len(wanted) >= LIVE_MAX_RECORDS_PER_CLIENT:
+                break
+            wanted.add(rid)
+        with self._lock:
+            removed = subscriber.record_ids - wanted
+            self._detach(subscriber, removed)
+            for rid in wanted - subscriber.record_ids:
+                self._by_record.setdefault(rid, set()).add(subscriber)
+            subscriber.record_ids = wanted
+            for rid in removed:
+                subscriber.pending.pop(rid, None)
+        return wanted
+
+    def _detach(self, subscriber: LiveSubscriber, record_ids: Iterable[int]) -> None:
+        for rid in record_ids:
+            subscribers = self._by_record.get(rid)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._by_record[rid]
+
+    def publish_counts(self, record_id: int, counts: Dict[str, int]) -> None:
+        with self._lock:
+            for subscriber in self._by_record.get(record_id, ()):
+                subscriber.pending[record_id] = counts
+
+    def drain(self, subscriber: LiveSubscriber) -> Dict[int, Dict[str, int]]:
+        """보낼 변경분을 꺼내고 비운다."""
+        with self._lock:
+            pending, subscriber.pending = subscriber.pending, {}
+        return pending
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+
+live_hub = LiveHub()
+
+
+def _on_reaction_changed(record_id: int, counts: Dict[str, int], **_: object) -> None:
+    live_hub.publish_counts(record_id, counts)
+
+
+subscribe(REACTION_CHANGED, _on_reaction_changed)
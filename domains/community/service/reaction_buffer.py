@@ -0,0 +1,318 @@
+"""반응 write-behind 버퍼 (REACTION_WRITE_MODE=write_behind).
+
+인기 기록에 반응이 몰리면 direct 모드는 같은 카운터 행과 커밋에서 직렬화된다.
+write_behind 모드에서는:
+- 기록별 상태(counts, 건드린 사용자의 현재 반응)를 처음 접근할 때 DB에서 읽어 메모리에 둔다.
+- 토글은 메모리 상태에만 적용하고 바로 최신 counts로 응답한다 (1인 1기록당 1건, 같은 반응 재요청 시 취소).
+- 사용자별 (DB 반영 시점 반응, 현재 반응)만 남기므로 여러 번 토글해도 순변경 1건으로 합쳐진다.
+- flush 루프(앱 lifespan)가 REACTION_FLUSH_INTERVAL_MS마다 순변경을 한 트랜잭션으로
+  reactions 업서트/삭제 + reaction_counts 증감으로 반영한다. 종료 시 마지막 flush를 한다.
+- 피드 counts/myReaction은 flush 전까지 DB 값을 보여준다 (최대 flush 주기만큼 지연).
+
+메모리 상태가 워커 프로세스별이므로 단일 워커(또는 기록별 고정 라우팅)에서만 사용한다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from core.reactions import REACTION_CODE_TO_ID, REACTION_ID_TO_CODE
+from domains.community.service.feed_cache import feed_page_cache
+from domains.community.service.feed_watermark import feed_watermark
+from domains.community.service.reaction_counts import apply_reaction_count_deltas, get_reaction_counts
+from models import LunchRecord
+from models.community import Reaction
+
+logger = logging.getLogger(__name__)
+
+# 반응 쓰기 경로: direct(기본, 요청마다 토글 문 + 커밋) | write_behind
+REACTION_WRITE_MODE = os.getenv("REACTION_WRITE_MODE", "direct")
+REACTION_FLUSH_INTERVAL_MS = int(os.getenv("REACTION_FLUSH_INTERVAL_MS", "500"))
+# 변경이 없는 기록 상태를 메모리에서 내리는 유휴 시간
+REACTION_BUFFER_IDLE_SECONDS = float(os.getenv("REACTION_BUFFER_IDLE_SECONDS", "60"))
+
+# PostgreSQL foreign_key_violation SQLSTATE (flush 사이에 기록이 지워진 경우)
+_FOREIGN_KEY_VIOLATION = "23503"
+
+# 사용자별 (DB에 반영된 반응, 현재 반응). None = 반응 없음
+UserChange = Tuple[Optional[str], Optional[str]]
+
+
+class ToggleResult(NamedTuple):
+    result: str
+    previous: Optional[str]
+    counts: Dict[str, int]
+    removed_at: Optional[datetime]
+
+
+class _RecordState:
+    def __init__(self, counts: Dict[str, int]) -> None:
+        self.counts = counts
+        self.reactions: Dict[int, Optional[str]] = {}
+        # 사용자별 현재 반응의 생성 시각 (flush 시 created_at, 취소 시 이벤트로 전달)
+        self.reacted_at: Dict[int, datetime] = {}
+        self.dirty: Dict[int, UserChange] = {}
+        self.touched_at = time.monotonic()
+
+
+class RecordNotFound(Exception):
+    pass
+
+
+class ReactionBuffer:
+    def __init__(self) -> None:
+        self._records: Dict[int, _RecordState] = {}
+        self._lock = threading.Lock()
+        # flush는 한 번에 하나만 (주기 flush와 종료 flush가 겹치지 않도록)
+        self._flush_lock = threading.Lock()
+
+    def _load_record(self, db: Session, record_id: int) -> _RecordState:
+        with self._lock:
+            state = self._records.get(record_id)
+        if state is not None:
+            return state
+        exists = db.execute(select(LunchRecord.id).where(LunchRecord.id == record_id)).first()
+        if exists is None:
+            raise RecordNotFound(record_id)
+        loaded = _RecordState(get_reaction_counts(db, [record_id])[record_id])
+        with self._lock:
+            return self._records.setdefault(record_id, loaded)
+
+    def _load_user_reaction(self, db: Session, state: _RecordState, record_id: int, user_id: int) -> None:
+        with self._lock:
+            if user_id in state.reactions:
+                return
+        row = db.execute(
+            select(Reaction.reaction_type, Reaction.created_at)
+            .where(Reaction.lunch_record_id == record_id)
+            .where(Reaction.user_id == user_id)
+        ).first()
+        with self._lock:
+            if user_id in state.reactions:
+                return
+            if row is None:
+                state.reactions[user_id] = None
+            else:
+                state.reactions[user_id] = REACTION_ID_TO_CODE.get(row.reaction_type)
+                state.reacted_at[user_id] = row.created_at
+
+    def toggle(self, db: Session, record_id: int, user_id: int, reaction: str) -> ToggleResult:
+        """메모리 상태에 토글을 적용한다. 기록이 없으면 RecordNotFound. (읽기 전용으로 db 사용)"""
+        state = self._load_record(db, record_id)
+        self._load_user_reaction(db, state, record_id, user_id)
+        with self._lock:
+            # flush 중 유휴 정리로 내려갔으면 다시 올린다 (사용자 반응은 이미 DB에 반영됨)
+            state = self._records.setdefault(record_id, state)
+            previous = state.reactions.get(user_id)
+            if previous is None:
+                current, result = reaction, "set"
+            elif previous == reaction:
+                current, result = None, "removed"
+            else:
+                current, result = reaction, "updated"
+            if previous is not None:
+                state.counts[previous] = max(state.counts.get(previous, 0) - 1, 0)
+            if current is not None:
+                state.counts[current] = state.counts.get(current, 0) + 1
+            state.reactions[user_id] = current
+            removed_at = None
+            if result == "set":
+                state.reacted_at[user_id] = datetime.utcnow()
+            elif result == "removed":
+                removed_at = state.reacted_at.pop(user_id, None)
+            original = state.dirty[user_id][0] if user_id in state.dirty else previous
+            state.dirty[user_id] = (original, current)
+            state.touched_at = time.monotonic()
+            counts = dict(state.counts)
+        return ToggleResult(result=result, previous=previous, counts=counts, removed_at=removed_at)
+
+    def _take_dirty(self) -> Tuple[Dict[int, Dict[int, UserChange]], Dict[Tuple[int, int], datetime]]:
+        """순변경과, 반응이 남는 (기록, 사용자)의 반응 시각을 함께 꺼낸다."""
+        with self._lock:
+            batch: Dict[int, Dict[int, UserChange]] = {}
+            reacted_at: Dict[Tuple[int, int], datetime] = {}
+            for record_id, state in self._records.items():
+                if state.dirty:
+                    batch[record_id], state.dirty = state.dirty, {}
+                    for user_id, (_original, current) in batch[record_id].items():
+                        if current is not None and user_id in state.reacted_at:
+                            reacted_at[(record_id, user_id)] = state.reacted_at[user_id]
+            return batch, reacted_at
+
+    def _restore_dirty(self, batch: Dict[int, Dict[int, UserChange]]) -> None:
+        """flush 실패 시 순변경을 되돌려 넣는다 (그 사이 새 토글과 합친다)."""
+        with self._lock:
+            for record_id, changes in batch.items():
+                state = self._records.get(record_id)
+                if state is None:
+                    continue
+                for user_id, (original, current) in changes.items():
+                    newer = state.dirty.get(user_id)
+                    state.dirty[user_id] = (original, newer[1] if newer else current)
+
+    def _evict_idle(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            idle = [
+                rid
+                for rid, state in self._records.items()
+                if not state.dirty and now - state.touched_at > REACTION_BUFFER_IDLE_SECONDS
+            ]
+            for rid in idle:
+                del self._records[rid]
+
+    def _write(
+        self,
+        db: Session,
+        batch: Dict[int, Dict[int, UserChange]],
+        reacted_at: Dict[Tuple[int, int], datetime],
+    ) -> int:
+        """순변경을 DB에 쓴다 (커밋은 호출자). 쓴 (기록, 사용자) 수를 반환."""
+        upserts: List[dict] = []
+        deletes: List[Tuple[int, int]] = []
+        deltas_by_record: Dict[int, Dict[str, int]] = {}
+        now = datetime.utcnow()
+        for record_id, changes in batch.items():
+            deltas: Dict[str, int] = {}
+            for user_id, (original, current) in changes.items():
+                if original == current:
+                    continue
+                if original is not None:
+                    deltas[original] = deltas.get(original, 0) - 1
+                if current is not None:
+                    deltas[current] = deltas.get(current, 0) + 1
+                    upserts.append(
+                        {
+                            "lunch_record_id": record_id,
+                            "user_id": user_id,
+                            "reaction_type": REACTION_CODE_TO_ID[current],
+                            # flush 시각이 아니라 토글 시각 (직접 쓰기 경로와 같은 created_at)
+                            "created_at": reacted_at.get((record_id, user_id), now),
+                        }
+                    )
+                else:
+                    deletes.append((record_id, user_id))
+            if any(deltas.values()):
+                deltas_by_record[record_id] = deltas
+        if deletes:
+            db.execute(
+                delete(Reaction).where(tuple_(Reaction.lunch_record_id, Reaction.user_id).in_(deletes))
+            )
+        if upserts:
+            stmt = pg_insert(Reaction).values(upserts)
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_reactions_record_user",
+                # 취소 후 다시 남긴 반응이면 새 시각, 코드만 바꾼 반응이면 원래 시각이 들어 있다
+                set_={"reaction_type": stmt.excluded.reaction_type, "created_at": stmt.excluded.created_at},
+            )
+            db.execute(stmt)
+        # 카운터 행 잠금 순서를 기록 id 순으로 고정
+        for record_id in sorted(deltas_by_record):
+            apply_reaction_count_deltas(db, record_id, deltas_by_record[record_id])
+        return len(upserts) + len(deletes)
+
+    def _write_per_record(
+        self,
+        db: Session,
+        batch: Dict[int, Dict[int, UserChange]],
+        reacted_at: Dict[Tuple[int, int], datetime],
+    ) -> Tuple[int, List[int]]:
+        """묶음 실패 후 기록별로 다시 쓴다.
+
+        기록이 지워져 외래키를 위반하는 항목은 로그를 남기고 버린다. 그 밖의 오류면 해당 기록과
+        남은 기록을 dirty로 되돌리고 다시 던진다. (쓴 수, 반영된 기록 id)를 반환한다.
+        """
+        written = 0
+        flushed: List[int] = []
+        record_ids = sorted(batch)
+        for i, record_id in enumerate(record_ids):
+            single = {record_id: batch[record_id]}
+            try:
+                written += self._write(db, single, reacted_at)
+                db.commit()
+                flushed.append(record_id)
+            except IntegrityError as e:
+                db.rollback()
+                if getattr(e.orig, "pgcode", None) != _FOREIGN_KEY_VIOLATION:
+                    self._restore_dirty({rid: batch[rid] for rid in record_ids[i:]})
+                    raise
+                logger.warning(
+                    "reaction buffer: dropping %d change(s) for missing lunch_record %s",
+                    len(batch[record_id]),
+                    record_id,
+                )
+                with self._lock:
+                    self._records.pop(record_id, None)
+            except Exception:
+                db.rollback()
+                self._restore_dirty({rid: batch[rid] for rid in record_ids[i:]})
+                raise
+        return written, flushed
+
+    def _after_flush(self, flushed: Iterable[int]) -> None:
+        flushed = set(flushed)
+        if flushed:
+            feed_page_cache.pop_where(lambda _key, page: any(rid in flushed for rid in page.record_ids))
+            # 이벤트는 토글 시점에 나가므로 DB 반영 뒤 피드 ETag도 한 번 더 바꾼다
+            feed_watermark.bump()
+        self._evict_idle()
+
+    def flush(self, db: Session) -> int:
+        """쌓인 순변경을 한 트랜잭션으로 반영하고 커밋한다. 반영한 (기록, 사용자) 수를 반환.
+
+        묶음이 실패하면 기록별로 다시 시도해, 한 기록의 오류가 나머지 반영을 막지 않게 한다.
+        """
+        with self._flush_lock:
+            batch, reacted_at = self._take_dirty()
+            if not batch:
+                self._evict_idle()
+                return 0
+            try:
+                written = self._write(db, batch, reacted_at)
+                db.commit()
+                flushed: Iterable[int] = batch
+            except Exception:
+                db.rollback()
+                logger.warning("reaction buffer: batch flush failed, retrying per record", exc_info=True)
+                try:
+                    written, flushed = self._write_per_record(db, batch, reacted_at)
+                except Exception:
+                    self._evict_idle()
+                    raise
+            self._after_flush(flushed)
+            return written
+
+
+reaction_buffer = ReactionBuffer()
+
+
+def is_write_behind() -> bool:
+    return REACTION_WRITE_MODE == "write_behind"
+
+
+def flush_reaction_buffer() -> int:
+    from core.database import SessionLocal
+
+    with SessionLocal() as db:
+        return reaction_buffer.flush(db)
+
+
+async def run_reaction_flush_loop() -> None:
+    """lifespan에서 실행하는 주기 flush. 실패는 로그만 남기고 다음 주기에 다시 시도한다."""
+    interval = REACTION_FLUSH_INTERVAL_MS / 1000
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(flush_reaction_buffer)
+        except Exception:
+            logger.exception("reaction buffer flush failed")
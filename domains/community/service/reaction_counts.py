@@ -0,0 +1,177 @@
+"""반응 수 비정규화 카운터 (reaction_counts) 조회·증감·재계산.
+
+- 피드/반응 응답의 counts는 reactions 집계 대신 reaction_counts PK 조회로 만든다.
+- 증감은 reactions 변경과 같은 트랜잭션에서 호출해야 한다 (커밋은 호출자 책임).
+- reconcile: reactions에서 카운터를 다시 계산해 드리프트를 보고/복구한다.
+- DB에는 SMALLINT 번호로 저장하고, 이 모듈의 반환값은 코드값(like/love/yummy) 기준이다.
+"""
+
+import logging
+from typing import Dict, Iterable, List, NamedTuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from core.reactions import (
+    ALLOWED_REACTION_CODES,
+    ALLOWED_REACTION_IDS,
+    REACTION_CODE_TO_ID,
+    REACTION_ID_TO_CODE,
+)
+from models.community import Reaction, ReactionCount
+
+logger = logging.getLogger(__name__)
+
+
+class ReactionCountDrift(NamedTuple):
+    """카운터와 실제 reactions 집계가 다른 (기록, 코드) 한 건."""
+
+    lunch_record_id: int
+    reaction_type: str
+    stored: int
+    actual: int
+
+
+def default_counts() -> Dict[str, int]:
+    return {code: 0 for code in ALLOWED_REACTION_CODES}
+
+
+def get_reaction_counts(db: Session, record_ids: Iterable[int]) -> Dict[int, Dict[str, int]]:
+    """기록 ID 목록의 코드별 반응 수. 카운터 행이 없는 기록은 0으로 채운다."""
+    ids = list(record_ids)
+    counts_by_record: Dict[int, Dict[str, int]] = {rid: default_counts() for rid in ids}
+    if not ids:
+        return counts_by_record
+    stmt = (
+        select(ReactionCount.lunch_record_id, ReactionCount.reaction_type, ReactionCount.count)
+        .where(ReactionCount.lunch_record_id.in_(ids))
+        .where(ReactionCount.reaction_type.in_(ALLOWED_REACTION_IDS))
+    )
+    for rid, rtype, cnt in db.execute(stmt).all():
+        counts_by_record[rid][REACTION_ID_TO_CODE[rtype]] = max(cnt, 0)
+    return counts_by_record
+
+
+def apply_reaction_count_deltas(
+    db: Session,
+    record_id: int,
+    deltas: Dict[str, int],
+) -> Dict[str, int]:
+    """기록의 카운터에 코드별 증감을 반영하고, 갱신된 전체 counts를 반환한다.
+
+    허용 코드 전부를 delta 0 포함 한 번의 업서트로 보내므로
+    RETURNING만으로 최신 counts를 얻는다 (별도 SELECT 없음).
+    행 잠금 순서가 ALLOWED_REACTION_CODES 순서로 고정되어 교착이 생기지 않는다.
+
+    결과가 음수면(카운터 드리프트, 없는 행에 감소 포함) 경고를 남기고 같은 트랜잭션에서 0으로 맞춘다.
+    """
+    stmt = pg_insert(ReactionCount).values(
+        [
+            {"lunch_record_id": record_id, "reaction_type": REACTION_CODE_TO_ID[code], "count": deltas.get(code, 0)}
+            for code in ALLOWED_REACTION_CODES
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ReactionCount.lunch_record_id, ReactionCount.reaction_type],
+        set_={"count": ReactionCount.count + stmt.excluded.count},
+    ).returning(ReactionCount.reaction_type, ReactionCount.count)
+    counts = default_counts()
+    negative: List[int] = []
+    for rtype, cnt in db.execute(stmt).all():
+        if cnt < 0:
+            logger.warning(
+                "reaction_counts drift: record %s %s would be %d, clamped to 0",
+                record_id,
+                REACTION_ID_TO_CODE[rtype],
+                cnt,
+            )
+            negative.append(rtype)
+            cnt = 0
+        counts[REACTION_ID_TO_CODE[rtype]] = cnt
+    if negative:
+        db.execute(
+            update(ReactionCount)
+            .where(ReactionCount.lunch_record_id == record_id)
+            .where(ReactionCount.reaction_type.in_(negative))
+            .values(count=0)
+        )
+    return counts
+
+
+def _actual_counts_subquery():
+    return (
+        select(
+            Reaction.lunch_record_id.label("lunch_record_id"),
+            Reaction.reaction_type.label("reaction_type"),
+            func.count(Reaction.id).label("actual"),
+        )
+        .where(Reaction.reaction_type.in_(ALLOWED_REACTION_IDS))
+        .group_by(Reaction.lunch_record_id, Reaction.reaction_type)
+        .subquery("actual_counts")
+    )
+
+
+def find_reaction_count_drift(db: Session) -> List[ReactionCountDrift]:
+    """reactions 집계와 reaction_counts가 다른 (기록, 코드) 목록을 반환한다."""
+    actual = _actual_counts_subquery()
+    record_id = func.coalesce(actual.c.lunch_record_id, ReactionCount.lunch_record_id)
+    reaction_type = func.coalesce(actual.c.reaction_type, ReactionCount.reaction_type)
+    stored = func.coalesce(ReactionCount.count, 0)
+    actual_count = func.coalesce(actual.c.actual, 0)
+    stmt = (
+        select(record_id, reaction_type, stored, actual_count)
+        .select_from(
+            actual.join(
+                ReactionCount.__table__,
+                (ReactionCount.lunch_record_id == actual.c.lunch_record_id)
+                & (ReactionCount.reaction_type == actual.c.reaction_type),
+                full=True,
+            )
+        )
+        .where(stored != actual_count)
+        .order_by(record_id, reaction_type)
+    )
+    return [
+        ReactionCountDrift(rid, REACTION_ID_TO_CODE.get(rtype, str(rtype)), stored_count, actual)
+        for rid, rtype, stored_count, actual in db.execute(stmt).all()
+    ]
+
+
+def rebuild_reaction_counts(db: Session, record_ids: Iterable[int]) -> Dict[int, Dict[str, int]]:
+    """기록별 카운터를 reactions에서 다시 계산해 덮어쓴다. 커밋은 호출자 책임.
+
+    카운터 행을 먼저 FOR UPDATE로 잠근 뒤 재집계하므로,
+    동시에 진행 중인 set_reaction의 증감이 덮어써져 유실되지 않는다.
+    """
+    ids = sorted(set(record_ids))
+    rebuilt: Dict[int, Dict[str, int]] = {}
+    for rid in ids:
+        db.execute(
+            select(ReactionCount.reaction_type)
+            .where(ReactionCount.lunch_record_id == rid)
+            .order_by(ReactionCount.reaction_type)
+            .with_for_update()
+        ).all()
+        counts = default_counts()
+        count_stmt = (
+            select(Reaction.reaction_type, func.count(Reaction.id))
+            .where(Reaction.lunch_record_id == rid)
+            .where(Reaction.reaction_type.in_(ALLOWED_REACTION_IDS))
+            .group_by(Reaction.reaction_type)
+        )
+        for rtype, cnt in db.execute(count_stmt).all():
+            counts[REACTION_ID_TO_CODE[rtype]] = cnt
+        stmt = pg_insert(ReactionCount).values(
+            [
+                {"lunch_record_id": rid, "reaction_type": REACTION_CODE_TO_ID[code], "count": cnt}
+                for code, cnt in counts.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ReactionCount.lunch_record_id, ReactionCount.reaction_type],
+            set_={"count": stmt.excluded.count},
+        )
+        db.execute(stmt)
+        rebuilt[rid] = counts
+    return rebuilt
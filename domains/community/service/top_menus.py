@@ -0,0 +1,225 @@
+"""커뮤니티 인기 메뉴 (GET /community/top-menus).
+
+전체 lunch_records를 요청마다 GROUP BY menu_name 하지 않고,
+(기간, 기간 시작일, 카테고리)별 SpaceSaving 스케치(core.sketches)로 근사한다.
+- 기간: 이번 주(월~일)·이번 달 (KST 기준 오늘이 속한 기간). 카테고리 None = 전체.
+- 갱신: 기록 생성 이벤트(LUNCH_RECORD_CREATED)의 recorded_at이 현재 기간이면 해당 스케치에 +1.
+  기간이 바뀌면 이전 기간 스케치는 버리고 빈 스케치로 시작한다.
+- 재구축: 앱 시작 시와 대량 적재 이벤트 때 현재 기간을 lunch_records에서 한 번 집계해 다시 만든다.
+  대량 적재 이벤트는 요청 처리 중에 발행되므로 백그라운드 스레드에서 재구축한다 (실행 중 요청은 한 번으로 합친다).
+  재구축 중에 들어온 기록 생성은 모아 두었다가, 집계 스냅샷(REPEATABLE READ)에 없던 기록만 교체 전에 더한다.
+- 메모리: 스케치당 최대 TOP_MENUS_SKETCH_CAPACITY(m)개 메뉴 → (기간 2 × (카테고리 수 + 1)) × m.
+- 오차: 스케치의 총 기록 수를 N이라 하면 각 count는 실제보다 최대 N/m 크고(작지는 않음),
+  count - error(minCount)는 실제 빈도의 하한이다. 실제 빈도가 N/m를 넘는 메뉴는 빠지지 않는다.
+
+다른 워커 프로세스에서 생성된 기록은 이벤트로 보이지 않으므로 다음 재구축(재시작) 전까지 빠진다.
+"""
+
+import logging
+import os
+import threading
+from datetime import date
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from core.events import LUNCH_RECORD_CREATED, LUNCH_RECORDS_IMPORTED, subscribe
+from core.report_period import PeriodType, get_period_range, today_kst
+from core.sketches import SpaceSaving
+from models import LunchRecord
+
+logger = logging.getLogger(__name__)
+
+TOP_MENUS_SKETCH_CAPACITY = int(os.getenv("TOP_MENUS_SKETCH_CAPACITY", "1000"))
+
+TOP_MENU_PERIODS: Tuple[PeriodType, ...] = ("week", "month")
+
+# (period, 기간 시작일, category)
+SketchKey = Tuple[str, date, Optional[str]]
+# 재구축 중 들어온 기록 (record_id, recorded_at, category, menu_name)
+PendingRecord = Tuple[Optional[int], date, Optional[str], str]
+
+
+class TopMenuSketches:
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._sketches: Dict[SketchKey, SpaceSaving] = {}
+        self._lock = threading.Lock()
+        # 재구축 중이면 그동안 들어온 기록 목록
+        self._pending: Optional[List[PendingRecord]] = None
+        self._rebuild_lock = threading.Lock()
+
+    @staticmethod
+    def current_range(period: PeriodType) -> Tuple[date, date]:
+        return get_period_range(today_kst(), period)
+
+    def _sketch(self, period: PeriodType, start: date, category: Optional[str]) -> SpaceSaving:
+        """lock 안에서 호출."""
+        key = (period, start, category)
+        sketch = self._sketches.get(key)
+        if sketch is None:
+            # 기간이 넘어갔으면 같은 period의 이전 기간 스케치를 버린다
+            for old in [k for k in self._sketches if k[0] == period and k[1] != start]:
+                del self._sketches[old]
+            sketch = self._sketches[key] = SpaceSaving(self.capacity)
+        return sketch
+
+    def record(
+        self,
+        recorded_at: date,
+        category: Optional[str],
+        menu_name: Optional[str],
+        record_id: Optional[int] = None,
+    ) -> None:
+        """기록 1건 반영. 현재 기간 밖이거나 메뉴명이 비었으면 무시한다."""
+        if not menu_name:
+            return
+        category = category or None
+        # 재구축 교체와 겹쳐 같은 기록이 두 번 들어가지 않도록 lock 안에서 반영한다
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((record_id, recorded_at, category, menu_name))
+            for period in TOP_MENU_PERIODS:
+                start, end = self.current_range(period)
+                if not start <= recorded_at <= end:
+                    continue
+                self._sketch(period, start, None).update(menu_name)
+                if category is not None:
+                    self._sketch(period, start, category).update(menu_name)
+
+    def get(self, period: PeriodType, category: Optional[str]) -> Tuple[date, date, Optional[SpaceSaving]]:
+        start, end = self.current_range(period)
+        with self._lock:
+            return start, end, self._sketches.get((period, start, category or None))
+
+    def _add_to(
+        self,
+        sketches: Dict[SketchKey, SpaceSaving],
+        period: PeriodType,
+        start: date,
+        category: Optional[str],
+        menu_name: str,
+        n: int = 1,
+    ) -> None:
+        targets = [(period, start, None)]
+        if category:
+            targets.append((period, start, category))
+        for key in targets:
+            sketch = sketches.get(key)
+            if sketch is None:
+                sketch = sketches[key] = SpaceSaving(self.capacity)
+            sketch.update(menu_name, n)
+
+    def rebuild(self, db: Session) -> int:
+        """현재 기간 스케치를 lunch_records에서 다시 만든다. 반영한 (카테고리, 메뉴) 행 수를 반환.
+
+        db는 트랜잭션을 시작하지 않은 세션이어야 한다 (집계를 한 스냅샷에서 하려고 REPEATABLE READ로 연다).
+        """
+        with self._rebuild_lock:
+            with self._lock:
+                self._pending = []
+            try:
+                return self._rebuild(db)
+            finally:
+                with self._lock:
+                    self._pending = None
+                db.rollback()
+
+    def _rebuild(self, db: Session) -> int:
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        rebuilt: Dict[SketchKey, SpaceSaving] = {}
+        rows_total = 0
+        ranges = {period: self.current_range(period) for period in TOP_MENU_PERIODS}
+        for period, (start, end) in ranges.items():
+            stmt = (
+                select(LunchRecord.category, LunchRecord.menu_name, func.count())
+                .where(LunchRecord.recorded_at >= start)
+                .where(LunchRecord.recorded_at <= end)
+                .where(LunchRecord.menu_name.is_not(None))
+                .where(LunchRecord.menu_name != "")
+                .group_by(LunchRecord.category, LunchRecord.menu_name)
+                # 많은 메뉴부터 넣어야 축출로 생기는 과대추정이 작다
+                .order_by(func.count().desc())
+            )
+            for category, menu_name, n in db.execute(stmt).all():
+                rows_total += 1
+                self._add_to(rebuilt, period, start, category, menu_name, n)
+
+        # 재구축 중 들어온 기록 중 집계 스냅샷에 없던 것만 더한 뒤 교체한다
+        replayed = 0
+        while True:
+            with self._lock:
+                pending = self._pending[replayed:]
+                if not pending:
+                    self._sketches = rebuilt
+                    return rows_total
+            replayed += len(pending)
+            ids = [rid for rid, *_rest in pending if rid is not None]
+            counted: Set[int] = (
+                set(db.scalars(select(LunchRecord.id).where(LunchRecord.id.in_(ids)))) if ids else set()
+            )
+            for rid, recorded_at, category, menu_name in pending:
+                if rid in counted:
+                    continue
+                for period, (start, end) in ranges.items():
+                    if start <= recorded_at <= end:
+                        self._add_to(rebuilt, period, start, category, menu_name)
+
+
+top_menu_sketches = TopMenuSketches(TOP_MENUS_SKETCH_CAPACITY)
+
+
+def rebuild_top_menus() -> int:
+    from core.database import SessionLocal
+
+    with SessionLocal() as db:
+        return top_menu_sketches.rebuild(db)
+
+
+_rebuild_lock = threading.Lock()
+_rebuild_running = False
+_rebuild_again = False
+
+
+def schedule_top_menus_rebuild() -> None:
+    """재구축을 백그라운드 스레드에 맡긴다. 이미 실행 중이면 끝난 뒤 한 번 더 한다."""
+    global _rebuild_running, _rebuild_again
+    with _rebuild_lock:
+        if _rebuild_running:
+            _rebuild_again = True
+            return
+        _rebuild_running = True
+    threading.Thread(target=_run_scheduled_rebuilds, name="top-menus-rebuild", daemon=True).start()
+
+
+def _run_scheduled_rebuilds() -> None:
+    global _rebuild_running, _rebuild_again
+    while True:
+        try:
+            rebuild_top_menus()
+        except Exception:
+            logger.exception("top menus rebuild failed")
+        with _rebuild_lock:
+            if not _rebuild_again:
+                _rebuild_running = False
+                return
+            _rebuild_again = False
+
+
+def _on_lunch_record_created(
+    recorded_at: date,
+    category: Optional[str] = None,
+    menu_name: Optional[str] = None,
+    record_id: Optional[int] = None,
+    **_: object,
+) -> None:
+    top_menu_sketches.record(recorded_at, category, menu_name, record_id)
+
+
+def _on_lunch_records_imported(**_: object) -> None:
+    schedule_top_menus_rebuild()
+
+
+subscribe(LUNCH_RECORD_CREATED, _on_lunch_record_created)
+subscribe(LUNCH_RECORDS_IMPORTED, _on_lunch_records_imported)
@@ -0,0 +1,451 @@
+"""인기 피드 점수 (GET /community/feed?sort=trending).
+
+점수는 forward decay로 증분 유지한다.
+- 반응 1건의 가중치 w(t) = exp(λ·(t - 기준 시각)), λ = ln2 / 반감기.
+  기록 점수 = Σ w(반응 시각). 최근 반응일수록 가중치가 크고, 모든 기록을 같은 시각 기준으로
+  나누면(= 로그 점수에서 같은 값을 빼면) 현재 시점의 감쇠 점수가 되므로 순위는 로그 점수만으로 정해진다.
+- 지수가 계속 커지므로 로그 공간(log Σ w)에 저장한다. 반응 추가는 logaddexp, 취소는 그 반응
+  시각의 가중치를 빼고(log(e^a - e^b)), 코드 변경(updated)은 점수를 바꾸지 않는다.
+- 반응 변경 이벤트(REACTION_CHANGED)마다 O(1) 갱신. 요청마다 reactions를 집계하지 않는다.
+
+순위·페이지:
+- 카테고리별 상위 TRENDING_TOP_K개를 점수가 바뀔 때마다 갱신해 둔다 (_TopK). 상위권 밖 기록의
+  반응은 O(1), 상위권 진입은 O(K)이고, 상위권 기록의 점수가 하한 아래로 내려가면(취소) 그 카테고리만
+  다음 스냅샷에서 전체 점수로 다시 만든다.
+- 요청 시 상위 K개를 스냅샷으로 고정한다. 스냅샷은 TRENDING_SNAPSHOT_REFRESH_SECONDS 동안
+  첫 페이지 요청끼리 공유한다.
+- 커서는 "스냅샷 id_오프셋"이라 점수가 바뀌어도 페이지 사이에 중복·누락이 없다.
+  스냅샷이 만료(TRENDING_SNAPSHOT_TTL_SECONDS)되면 첫 페이지부터 다시 받아야 한다.
+
+저장 (여러 워커):
+- trending_scores가 워커들이 공유하는 원본이다. 각 워커는 자기가 본 반응의 증감만 모아 두었다가
+  TRENDING_PERSIST_INTERVAL_SECONDS마다 기존 값에 더한다(절대값으로 덮어쓰지 않는다).
+  저장 뒤 그 사이 다른 워커가 바꾼 행을 읽어 메모리에 합치므로 워커 간 차이는 저장 주기 정도다.
+- 가중치가 새 반응 1건의 2^-TRENDING_PRUNE_HALF_LIVES 미만으로 감쇠한 기록은 메모리·테이블에서 내린다.
+- 앱 시작 시 trending_scores에서 복원한다. 테이블이 비어 있으면 최근 반응에서 다시 계산한다.
+"""
+
+import asyncio
+import heapq
+import logging
+import math
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import delete, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from core.cache import TTLCache
+from core.events import REACTION_CHANGED, subscribe
+from models import LunchRecord, TrendingScore
+from models.community import Reaction
+
+logger = logging.getLogger(__name__)
+
+TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "24"))
+TRENDING_TOP_K = int(os.getenv("TRENDING_TOP_K", "500"))
+TRENDING_PERSIST_INTERVAL_SECONDS = float(os.getenv("TRENDING_PERSIST_INTERVAL_SECONDS", "30"))
+TRENDING_SNAPSHOT_TTL_SECONDS = float(os.getenv("TRENDING_SNAPSHOT_TTL_SECONDS", "600"))
+TRENDING_SNAPSHOT_REFRESH_SECONDS = float(os.getenv("TRENDING_SNAPSHOT_REFRESH_SECONDS", "5"))
+# 이 반감기 수보다 오래 감쇠한 점수는 버린다 (10 → 새 반응 1건의 1/1024)
+TRENDING_PRUNE_HALF_LIVES = float(os.getenv("TRENDING_PRUNE_HALF_LIVES", "10"))
+
+# 가중치 기준 시각 (naive UTC, reactions.created_at과 같은 기준). 바꾸면 저장된 점수를 다시 계산해야 한다.
+_EPOCH = datetime(2024, 1, 1)
+_DECAY_RATE = math.log(2) / (TRENDING_HALF_LIFE_HOURS * 3600)
+_PRUNE_LOG_MARGIN = TRENDING_PRUNE_HALF_LIVES * math.log(2)
+# 취소 후 남은 점수가 이보다 작으면(부동소수 오차) 0으로 본다
+_REMOVE_EPSILON = 1e-9
+
+_UNKNOWN = object()
+# 빈 테이블 재계산을 워커 하나만 하도록 잡는 advisory lock 키
+_REBUILD_LOCK_KEY = 0x7472656E64
+
+
+def reaction_log_weight(at: datetime) -> float:
+    """반응 1건의 로그 가중치 λ·(at - 기준 시각)."""
+    return _DECAY_RATE * (at - _EPOCH).total_seconds()
+
+
+def _log_add(a: float, b: float) -> float:
+    if a == -math.inf:
+        return b
+    hi, lo = (a, b) if a >= b else (b, a)
+    return hi + math.log1p(math.exp(lo - hi))
+
+
+def _log_sub(a: float, b: float) -> float:
+    """log(e^a - e^b). 결과가 0 이하면 -inf."""
+    if a == -math.inf or b - a > -_REMOVE_EPSILON:
+        return -math.inf
+    return a + math.log1p(-math.exp(b - a))
+
+
+class TrendingSnapshot(NamedTuple):
+    snapshot_id: str
+    category: Optional[str]
+    record_ids: Tuple[int, ...]
+
+
+class _TopK:
+    """점수 상위 k개 (같은 점수는 큰 id 우선).
+
+    k개가 다 차 있으면 밖의 기록은 모두 하한(최솟값) 이하이고, 덜 차 있으면 밖의 기록이 없다.
+    """
+
+    def __init__(self, k: int, scores: Iterable[Tuple[int, float]]) -> None:
+        self._k = k
+        top = heapq.nlargest(k, ((score, rid) for rid, score in scores if score > -math.inf))
+        self._members: Dict[int, float] = {rid: score for score, rid in top}
+        self._floor: Optional[Tuple[float, int]] = None
+
+    def _floor_key(self) -> Tuple[float, int]:
+        if self._floor is None:
+            self._floor = min((score, rid) for rid, score in self._members.items())
+        return self._floor
+
+    def update(self, rid: int, score: float) -> bool:
+        """rid의 점수 변경을 반영한다. 상위권 기록이 하한 아래로 내려가 다시 만들어야 하면 False."""
+        members = self._members
+        full = len(members) >= self._k
+        if rid in members:
+            if full and (score, rid) < self._floor_key():
+                return False
+            if score > -math.inf:
+                members[rid] = score
+            else:
+                del members[rid]
+            self._floor = None
+        elif score > -math.inf:
+            if full:
+                floor = self._floor_key()
+                if (score, rid) < floor:
+                    return True
+                del members[floor[1]]
+            members[rid] = score
+            self._floor = None
+        return True
+
+    def ranked(self) -> Tuple[int, ...]:
+        return tuple(rid for _score, rid in sorted(((s, r) for r, s in self._members.items()), reverse=True))
+
+
+class TrendingTracker:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._scores: Dict[int, float] = {}
+        self._categories: Dict[int, Optional[str]] = {}
+        # 카테고리를 아직 모르는 기록 (카테고리별 상위권에 넣지 못함)
+        self._uncategorized: Set[int] = set()
+        # category(None = 전체) → 상위 K개. 없으면 다음 스냅샷에서 만든다
+        self._tops: Dict[Optional[str], _TopK] = {}
+        # record_id → [log Σ 추가 가중치, log Σ 취소 가중치] (마지막 저장 이후)
+        self._pending: Dict[int, List[float]] = {}
+        self._synced_at = datetime.utcnow()
+        self._snapshots = TTLCache(
+            "community.trending_snapshots",
+            maxsize=256,
+            ttl_seconds=TRENDING_SNAPSHOT_TTL_SECONDS,
+        )
+        # category → (최근 스냅샷 id, 만든 시각)
+        self._latest: Dict[Optional[str], Tuple[str, float]] = {}
+
+    # --- 갱신 ---
+
+    def _set_score(self, rid: int, score: float) -> None:
+        """점수를 바꾸고 상위 K개에 반영한다 (lock 안에서 호출)."""
+        self._scores[rid] = score
+        self._update_tops(rid, score)
+
+    def _update_tops(self, rid: int, score: float) -> None:
+        category = self._categories.get(rid, _UNKNOWN)
+        if category is _UNKNOWN:
+            self._uncategorized.add(rid)
+            keys: Tuple[Optional[str], ...] = (None,)
+        else:
+            self._uncategorized.discard(rid)
+            keys = (None,) if category is None else (None, category)
+        for key in keys:
+            top = self._tops.get(key)
+            if top is not None and not top.update(rid, score):
+                del self._tops[key]
+
+    def add(self, record_id: int, at: datetime) -> None:
+        with self._lock:
+            current = self._scores.get(record_id, -math.inf)
+            weight = reaction_log_weight(at)
+            self._set_score(record_id, _log_add(current, weight))
+            self._merge_pending({record_id: [weight, -math.inf]})
+
+    def remove(self, record_id: int, at: datetime) -> None:
+        with self._lock:
+            weight = reaction_log_weight(at)
+            current = self._scores.get(record_id)
+            if current is not None:
+                self._set_score(record_id, _log_sub(current, weight))
+            # 이 워커가 모르는 기록이어도 다른 워커가 저장한 점수에서 빼야 한다
+            self._merge_pending({record_id: [-math.inf, weight]})
+
+    # --- 스냅샷 ---
+
+    def _resolve_categories(self, db: Session, record_ids: Iterable[int]) -> None:
+        with self._lock:
+            unknown = [rid for rid in record_ids if rid not in self._categories]
+        if not unknown:
+            return
+        rows = db.execute(
+            select(LunchRecord.id, LunchRecord.category).where(LunchRecord.id.in_(unknown))
+        ).all()
+        with self._lock:
+            # 지워진 기록은 어느 카테고리에도 들지 않으므로 다시 묻지 않는다
+            self._uncategorized.difference_update(unknown)
+            for rid, category in rows:
+                self._categories[rid] = category or None
+                if rid in self._scores:
+                    self._update_tops(rid, self._scores[rid])
+
+    def snapshot(self, db: Session, category: Optional[str]) -> TrendingSnapshot:
+        """카테고리(None = 전체)의 상위 TRENDING_TOP_K 스냅샷. 최근 것이 있으면 재사용한다."""
+        category = category or None
+        with self._lock:
+            latest = self._latest.get(category)
+        if latest is not None and time.monotonic() - latest[1] < TRENDING_SNAPSHOT_REFRESH_SECONDS:
+            cached = self._snapshots.get(latest[0])
+            if cached is not None:
+                return cached
+
+        if category is not None:
+            with self._lock:
+                unknown = list(self._uncategorized)
+            self._resolve_categories(db, unknown)
+        with self._lock:
+            top = self._tops.get(category)
+            if top is None:
+                top = _TopK(
+                    TRENDING_TOP_K,
+                    (
+                        (rid, score)
+                        for rid, score in self._scores.items()
+                        if category is None or self._categories.get(rid, _UNKNOWN) == category
+                    ),
+                )
+                self._tops[category] = top
+            record_ids = top.ranked()
+        snapshot = TrendingSnapshot(
+            snapshot_id=uuid.uuid4().hex[:12],
+            category=category,
+            record_ids=record_ids,
+        )
+        self._snapshots.set(snapshot.snapshot_id, snapshot)
+        with self._lock:
+            self._latest[category] = (snapshot.snapshot_id, time.monotonic())
+        return snapshot
+
+    def get_snapshot(self, snapshot_id: str) -> Optional[TrendingSnapshot]:
+        return self._snapshots.get(snapshot_id)
+
+    # --- 저장/복원 ---
+
+    def _merge_pending(self, pending: Dict[int, List[float]]) -> None:
+        for rid, (added, removed) in pending.items():
+            current = self._pending.get(rid)
+            if current is None:
+                self._pending[rid] = [added, removed]
+            else:
+                current[0] = _log_add(current[0], added)
+                current[1] = _log_add(current[1], removed)
+
+    def _with_pending(self, rid: int, base: float) -> float:
+        """DB 점수 base에 아직 저장하지 않은 이 워커의 증감을 더한 값."""
+        pending = self._pending.get(rid)
+        if pending is None:
+            return base
+        return _log_sub(_log_add(base, pending[0]), pending[1])
+
+    def persist(self, db: Session) -> int:
+        """저장하지 않은 증감을 trending_scores에 더하고 커밋한 뒤, 다른 워커가 바꾼 점수를 받아온다.
+
+        행을 FOR UPDATE로 잠근 채 기존 값에 증감을 더하므로(log_add/log_sub) 여러 워커가 동시에 저장해도
+        서로 덮어쓰지 않는다. 감쇠가 끝난 기록은 메모리·테이블에서 내린다.
+        """
+        now = datetime.utcnow()
+        floor = reaction_log_weight(now) - _PRUNE_LOG_MARGIN
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            stale = [rid for rid, score in self._scores.items() if score < floor and rid not in pending]
+            for rid in stale:
+                self._update_tops(rid, -math.inf)
+                del self._scores[rid]
+                self._categories.pop(rid, None)
+                self._uncategorized.discard(rid)
+            synced_at = self._synced_at
+        ids = sorted(pending)
+        persisted: Dict[int, float] = {}
+        try:
+            if ids:
+                self._resolve_categories(db, ids)
+                with self._lock:
+                    placeholders = [
+                        {
+                            "lunch_record_id": rid,
+                            "category": self._categories.get(rid),
+                            "log_score": -math.inf,
+                            "updated_at": now,
+                        }
+                        for rid in ids
+                    ]
+                db.execute(pg_insert(TrendingScore).values(placeholders).on_conflict_do_nothing())
+                rows = db.execute(
+                    select(TrendingScore.lunch_record_id, TrendingScore.log_score)
+                    .where(TrendingScore.lunch_record_id.in_(ids))
+                    .order_by(TrendingScore.lunch_record_id)
+                    .with_for_update()
+                ).all()
+                for rid, existing in rows:
+                    added, removed = pending[rid]
+                    persisted[rid] = _log_sub(_log_add(existing, added), removed)
+                db.execute(
+                    update(TrendingScore),
+                    [
+                        {"lunch_record_id": rid, "log_score": score, "updated_at": now}
+                        for rid, score in persisted.items()
+                    ],
+                )
+            db.execute(delete(TrendingScore).where(TrendingScore.log_score < floor))
+            db.commit()
+        except Exception:
+            db.rollback()
+            with self._lock:
+                self._merge_pending(pending)
+            raise
+
+        # 저장 주기 사이에 다른 워커가 반영한 점수 (시계 차이를 감안해 한 주기 겹쳐 읽는다)
+        since = synced_at - timedelta(seconds=TRENDING_PERSIST_INTERVAL_SECONDS)
+        remote = db.execute(
+            select(TrendingScore.lunch_record_id, TrendingScore.category, TrendingScore.log_score)
+            .where(TrendingScore.updated_at >= since)
+        ).all()
+        db.rollback()
+        with self._lock:
+            for rid, category, score in remote:
+                if rid not in persisted:
+                    self._categories.setdefault(rid, category or None)
+                    self._set_score(rid, self._with_pending(rid, score))
+            for rid, score in persisted.items():
+                self._set_score(rid, self._with_pending(rid, score))
+            self._synced_at = now
+        return len(persisted) + len(stale)
+
+    def load(self, db: Session) -> int:
+        """trending_scores에서 메모리 상태를 복원한다. 비어 있으면 최근 반응에서 다시 계산한다."""
+        synced_at = datetime.utcnow()
+        if db.scalar(select(func.count()).select_from(TrendingScore)) == 0:
+            self._rebuild(db)
+        rows = db.execute(
+            select(TrendingScore.lunch_record_id, TrendingScore.category, TrendingScore.log_score)
+        ).all()
+        db.rollback()
+        with self._lock:
+            for rid, category, score in rows:
+                self._scores[rid] = self._with_pending(rid, score)
+                self._categories[rid] = category or None
+                self._uncategorized.discard(rid)
+            self._tops.clear()
+            self._synced_at = synced_at
+        return len(rows)
+
+    def _rebuild(self, db: Session) -> None:
+        """최근 반응으로 trending_scores를 채운다. 여러 워커가 동시에 시작해도 한 번만 채운다."""
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _REBUILD_LOCK_KEY})
+        if db.scalar(select(func.count()).select_from(TrendingScore)) > 0:
+            db.commit()
+            return
+        since = datetime.utcnow() - timedelta(hours=TRENDING_HALF_LIFE_HOURS * TRENDING_PRUNE_HALF_LIVES)
+        stmt = (
+            select(Reaction.lunch_record_id, Reaction.created_at, LunchRecord.category)
+            .join(LunchRecord, LunchRecord.id == Reaction.lunch_record_id)
+            .where(Reaction.created_at >= since)
+            .execution_options(yield_per=5000)
+        )
+        scores: Dict[int, float] = {}
+        categories: Dict[int, Optional[str]] = {}
+        for rid, created_at, category in db.execute(stmt):
+            scores[rid] = _log_add(scores.get(rid, -math.inf), reaction_log_weight(created_at))
+            categories[rid] = category or None
+        if scores:
+            now = datetime.utcnow()
+            db.execute(
+                pg_insert(TrendingScore).values(
+                    [
+                        {
+                            "lunch_record_id": rid,
+                            "category": categories[rid],
+                            "log_score": score,
+                            "updated_at": now,
+                        }
+                        for rid, score in sorted(scores.items())
+                    ]
+                ).on_conflict_do_nothing()
+            )
+        db.commit()
+
+
+trending_tracker = TrendingTracker()
+
+
+def _on_reaction_changed(
+    record_id: int,
+    result: str,
+    removed_at: Optional[datetime] = None,
+    **_: object,
+) -> None:
+    if result == "set":
+        trending_tracker.add(record_id, datetime.utcnow())
+    elif result == "removed":
+        # 취소한 반응의 시각을 모르면 지금 시각으로 뺀다 (점수가 실제보다 작아질 수 있음)
+        trending_tracker.remove(record_id, removed_at or datetime.utcnow())
+
+
+subscribe(REACTION_CHANGED, _on_reaction_changed)
+
+
+def parse_trending_cursor(cursor: str) -> Optional[Tuple[str, int]]:
+    """'스냅샷 id_오프셋' → (id, offset). 형식이 다르면 None."""
+    snapshot_id, sep, offset = cursor.partition("_")
+    if not sep or not snapshot_id or not offset.isdigit():
+        return None
+    return snapshot_id, int(offset)
+
+
+def trending_cursor(snapshot_id: str, offset: int) -> str:
+    return f"{snapshot_id}_{offset}"
+
+
+def load_trending_scores() -> int:
+    from core.database import SessionLocal
+
+    with SessionLocal() as db:
+        return trending_tracker.load(db)
+
+
+def persist_trending_scores() -> int:
+    from core.database import SessionLocal
+
+    with SessionLocal() as db:
+        return trending_tracker.persist(db)
+
+
+async def run_trending_persist_loop() -> None:
+    """lifespan에서 실행하는 주기 저장. 실패는 로그만 남기고 다음 주기에 다시 시도한다."""
+    while True:
+        await asyncio.sleep(TRENDING_PERSIST_INTERVAL_SECONDS)
+        try:
+            await run_in_threadpool(persist_trending_scores)
+        except Exception:
+            logger.exception("trending score persist failed")
@@ -1,16 +1,71 @@
 """Lunch records Controller. Service에 위임하며 DB 세션을 주입받는다."""
 
-from sqlalchemy.orm import Session
+from datetime import date
+from typing import IO, Optional
 
-from domains.lunch_records.schemas import LunchRecordCreate, LunchRecordResponse
-from domains.lunch_records.service.lunch_record_service import LunchRecordServiceInterface
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+
+from core.database import DBSession, SessionLocal, run_db, run_db_in_thread
+from domains.lunch_records.schemas import (
+    LunchRecordBulkCreate,
+    LunchRecordBulkCreateResponse,
+    LunchRecordCreate,
+    LunchRecordImportError,
+    LunchRecordImportResponse,
+    LunchRecordPage,
+    LunchRecordResponse,
+)
+from domains.lunch_records.service.record_import import import_lunch_records
+from domains.lunch_records.service.lunch_record_service import InvalidRecordCursor, LunchRecordServiceInterface
 
 
 class LunchRecordController:
-    def __init__(self, service: LunchRecordServiceInterface, db: Session) -> None:
+    def __init__(self, service: LunchRecordServiceInterface, db: DBSession) -> None:
         self._service = service
         self._db = db
 
-    def create(self, user_id: int, body: LunchRecordCreate) -> LunchRecordResponse:
+    async def create(self, user_id: int, body: LunchRecordCreate) -> LunchRecordResponse:
         """점심 기록 생성."""
-        return self._service.create(self._db, user_id=user_id, data=body)
+        return await run_db(self._db, self._service.create, user_id=user_id, data=body)
+
+    async def create_bulk(self, user_id: int, body: LunchRecordBulkCreate) -> LunchRecordBulkCreateResponse:
+        """점심 기록 일괄 생성."""
+        return await run_db_in_thread(self._db, self._service.create_bulk, user_id=user_id, items=body.items)
+
+    async def import_records(self, fp: IO[str], fmt: str) -> LunchRecordImportResponse:
+        """CSV/NDJSON 대량 적재. COPY는 psycopg2 연결이 필요해 DB_MODE와 무관하게 sync 세션을 쓴다."""
+
+        def _import():
+            with SessionLocal() as db:
+                return import_lunch_records(db, fp, fmt)
+
+        result = await run_in_threadpool(_import)
+        return LunchRecordImportResponse(
+            imported=result.imported,
+            rejected=result.rejected,
+            errors=[LunchRecordImportError(line=line, message=msg) for line, msg in result.errors],
+            users=len(result.user_ids),
+        )
+
+    async def list_mine(
+        self,
+        user_id: int,
+        from_date: Optional[date],
+        to_date: Optional[date],
+        cursor: Optional[str],
+        limit: int,
+    ) -> LunchRecordPage:
+        """내 점심 기록 목록 (키셋 페이지)."""
+        try:
+            return await run_db(
+                self._db,
+                self._service.list_mine,
+                user_id=user_id,
+                from_date=from_date,
+                to_date=to_date,
+                cursor=cursor,
+                limit=limit,
+            )
+        except InvalidRecordCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
@@ -1,15 +1,27 @@
-"""Lunch records FastAPI 라우터. DB 세션은 Depends(get_db)로 주입."""
+"""Lunch records FastAPI 라우터. DB 세션은 Depends(get_session)으로 주입."""
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import io
+from datetime import date
+from typing import Optional
 
-from core.database import get_db
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+
+from core.database import DBSession, get_session
+from domains.auth.dependencies import require_admin_token
 from domains.lunch_records.controller.lunch_record_controller import LunchRecordController
-from domains.lunch_records.schemas import LunchRecordCreate, LunchRecordResponse
+from domains.lunch_records.schemas import (
+    LunchRecordBulkCreate,
+    LunchRecordBulkCreateResponse,
+    LunchRecordCreate,
+    LunchRecordImportResponse,
+    LunchRecordPage,
+    LunchRecordResponse,
+)
+from domains.lunch_records.service.record_import import IMPORT_FORMATS, detect_format
 from domains.lunch_records.service.lunch_record_service_impl import LunchRecordServiceImpl
 
 
-def get_controller(db: Session = Depends(get_db)) -> LunchRecordController:
+async def get_controller(db: DBSession = Depends(get_session)) -> LunchRecordController:
     """Controller 의존성. Service 구현체와 DB 세션을 주입."""
     service = LunchRecordServiceImpl()
     return LunchRecordController(service=service, db=db)
@@ -18,12 +30,70 @@ def get_controller(db: Session = Depends(get_db)) -> LunchRecordController:
 router = APIRouter()
 
 
+@router.get(
+    "/",
+    response_model=LunchRecordPage,
+    summary="내 점심 기록 목록",
+    description="식사일 최신순(같은 날은 id 역순) 키셋 페이지. next_cursor를 cursor로 넘기면 다음 페이지입니다.",
+    responses={400: {"description": "cursor 형식 오류"}},
+)
+async def list_my_lunch_records(
+    from_date: Optional[date] = Query(None, alias="from", description="식사일 시작 (포함)"),
+    to_date: Optional[date] = Query(None, alias="to", description="식사일 끝 (포함)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (없으면 첫 페이지)"),
+    limit: int = Query(20, ge=1, le=100, description="페이지당 개수"),
+    controller: LunchRecordController = Depends(get_controller),
+    # TODO: 인증 후 user_id는 JWT 등에서 추출
+    user_id: int = 1,
+) -> LunchRecordPage:
+    """내 기록만 조회합니다. OFFSET을 쓰지 않아 뒤 페이지도 첫 페이지와 비용이 같습니다."""
+    return await controller.list_mine(
+        user_id=user_id, from_date=from_date, to_date=to_date, cursor=cursor, limit=limit
+    )
+
+
 @router.post("/", response_model=LunchRecordResponse, summary="점심 기록 생성")
-def create_lunch_record(
+async def create_lunch_record(
     body: LunchRecordCreate,
     controller: LunchRecordController = Depends(get_controller),
     # TODO: 인증 후 user_id는 JWT 등에서 추출
     user_id: int = 1,
 ) -> LunchRecordResponse:
     """점심 기록을 생성합니다."""
-    return controller.create(user_id=user_id, body=body)
+    return await controller.create(user_id=user_id, body=body)
+
+
+@router.post(
+    "/bulk",
+    response_model=LunchRecordBulkCreateResponse,
+    summary="점심 기록 일괄 생성",
+    description="최대 500건을 한 트랜잭션으로 생성합니다. 검증에 실패한 항목은 건너뛰고 errors에 위치와 사유를 담습니다.",
+)
+async def create_lunch_records_bulk(
+    body: LunchRecordBulkCreate,
+    controller: LunchRecordController = Depends(get_controller),
+    # TODO: 인증 후 user_id는 JWT 등에서 추출
+    user_id: int = 1,
+) -> LunchRecordBulkCreateResponse:
+    """오프라인에서 쌓인 기록을 한 번에 동기화합니다. ids는 items 순서와 같습니다."""
+    return await controller.create_bulk(user_id=user_id, body=body)
+
+
+@router.post(
+    "/import",
+    response_model=LunchRecordImportResponse,
+    summary="점심 기록 대량 적재 (관리자)",
+    description="CSV 또는 NDJSON 파일을 COPY로 적재합니다. X-Admin-Token 헤더가 필요합니다.",
+    dependencies=[Depends(require_admin_token)],
+)
+async def import_lunch_records(
+    file: UploadFile = File(..., description="user_id, recorded_at, category, menu_name, content"),
+    fmt: Optional[str] = Query(None, alias="format", description="csv | ndjson (기본: 파일 확장자)"),
+    controller: LunchRecordController = Depends(get_controller),
+) -> LunchRecordImportResponse:
+    """이전 시스템 데이터 이관용. 끝나면 영향받은 사용자의 일자 집계를 다시 계산합니다."""
+    fmt = fmt or detect_format(file.filename or "")
+    if fmt not in IMPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format은 {', '.join(IMPORT_FORMATS)} 중 하나여야 합니다.")
+    fp = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    return await controller.import_records(fp, fmt)
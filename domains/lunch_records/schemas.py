@@ -1,15 +1,17 @@
 """Lunch records 도메인 요청/응답 스키마."""
 
 from datetime import date
-from typing import Optional
+from typing import Annotated, Any, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, WithJsonSchema
 
 
 class LunchRecordCreate(BaseModel):
     """점심 기록 생성 요청."""
 
     recorded_at: date = Field(..., description="기록한 날짜")
+    category: Optional[str] = Field(None, max_length=50, description="음식 카테고리 예: KOREAN, JAPANESE")
+    menu_name: Optional[str] = Field(None, max_length=200, description="메뉴명")
     content: Optional[str] = Field(None, max_length=2000)
 
 
@@ -19,7 +21,67 @@ class LunchRecordResponse(BaseModel):
     id: int
     user_id: int
     recorded_at: date
+    category: Optional[str] = None
+    menu_name: Optional[str] = None
     content: Optional[str] = None
 
     class Config:
         from_attributes = True
+
+
+
+class LunchRecordPage(BaseModel):
+    """내 점심 기록 목록 한 페이지 (recorded_at DESC, id DESC)."""
+
+    items: List[LunchRecordResponse]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+# POST /lunch-records/bulk 한 요청의 최대 항목 수
+LUNCH_RECORD_BULK_MAX_ITEMS = 500
+
+
+# 일괄 생성 항목: 요청 전체를 422로 거절하지 않도록 검증은 서비스에서 항목별로 한다.
+# OpenAPI 문서에는 LunchRecordCreate 스키마로 노출한다.
+LunchRecordBulkItem = Annotated[Any, WithJsonSchema(LunchRecordCreate.model_json_schema())]
+
+
+class LunchRecordBulkCreate(BaseModel):
+    """점심 기록 일괄 생성 요청.
+
+    항목은 LunchRecordCreate 형식이며, 항목별로 검증해 잘못된 항목만 errors로 돌려준다.
+    """
+
+    items: List[LunchRecordBulkItem] = Field(
+        ..., min_length=1, max_length=LUNCH_RECORD_BULK_MAX_ITEMS, description="LunchRecordCreate 목록"
+    )
+
+
+class LunchRecordBulkItemError(BaseModel):
+    """검증에 실패한 항목."""
+
+    index: int = Field(..., description="items 내 위치 (0부터)")
+    errors: List[str] = Field(..., description="필드별 오류 메시지")
+
+
+class LunchRecordBulkCreateResponse(BaseModel):
+    """점심 기록 일괄 생성 응답."""
+
+    ids: List[Optional[int]] = Field(..., description="items와 같은 순서의 생성된 ID (실패 항목은 null)")
+    created: int = Field(..., description="생성된 기록 수")
+    errors: List[LunchRecordBulkItemError] = Field(default_factory=list)
+
+
+class LunchRecordImportError(BaseModel):
+    """적재에서 제외된 행."""
+
+    line: int = Field(..., description="입력 파일의 행 번호 (CSV는 헤더 다음 행이 1)")
+    message: str
+
+
+class LunchRecordImportResponse(BaseModel):
+    """점심 기록 대량 적재 결과."""
+
+    imported: int = Field(..., description="적재된 행 수")
+    rejected: int = Field(..., description="검증 실패로 제외된 행 수")
+    errors: List[LunchRecordImportError] = Field(..., description="제외 사유 (최대 100건)")
+    users: int = Field(..., description="기록이 추가된 사용자 수 (일자 집계 재계산 대상)")
@@ -2,9 +2,21 @@
 
 from abc import ABC, abstractmethod
 
+from datetime import date
+from typing import Any, List, Optional
+
 from sqlalchemy.orm import Session
 
-from domains.lunch_records.schemas import LunchRecordCreate, LunchRecordResponse
+from domains.lunch_records.schemas import (
+    LunchRecordBulkCreateResponse,
+    LunchRecordCreate,
+    LunchRecordPage,
+    LunchRecordResponse,
+)
+
+
+class InvalidRecordCursor(ValueError):
+    """list_mine cursor 형식 오류."""
 
 
 class LunchRecordServiceInterface(ABC):
@@ -14,3 +26,23 @@ class LunchRecordServiceInterface(ABC):
     ) -> LunchRecordResponse:
         """점심 기록 생성."""
         ...
+
+    @abstractmethod
+    def create_bulk(
+        self, db: Session, user_id: int, items: List[Any]
+    ) -> LunchRecordBulkCreateResponse:
+        """점심 기록 일괄 생성. 유효한 항목만 넣고 항목별 오류를 함께 반환."""
+        ...
+
+    @abstractmethod
+    def list_mine(
+        self,
+        db: Session,
+        user_id: int,
+        from_date: Optional[date],
+        to_date: Optional[date],
+        cursor: Optional[str],
+        limit: int,
+    ) -> LunchRecordPage:
+        """내 기록을 최신 식사일 순으로 키셋 페이지 조회. 잘못된 cursor는 InvalidRecordCursor."""
+        ...
@@ -1,27 +1,180 @@
 """Lunch records Service 구현체."""
 
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select, tuple_
 from sqlalchemy.orm import Session
 
-from domains.lunch_records.schemas import LunchRecordCreate, LunchRecordResponse
-from domains.lunch_records.service.lunch_record_service import LunchRecordServiceInterface
+from core.events import LUNCH_RECORD_CREATED, publish
+from core.writes import insert_returning, returning_columns, schema_from_row
+from domains.lunch_records.schemas import (
+    LunchRecordBulkCreateResponse,
+    LunchRecordBulkItemError,
+    LunchRecordCreate,
+    LunchRecordPage,
+    LunchRecordResponse,
+)
+from domains.lunch_records.service.lunch_record_service import InvalidRecordCursor, LunchRecordServiceInterface
+from domains.reports.service.daily_rollup import add_record_to_daily_rollup, increment_daily_rollup
+from domains.reports.service.report_snapshots import delete_snapshots_covering
 from models import LunchRecord
 
 
+def encode_record_cursor(recorded_at: date, record_id: int) -> str:
+    """목록 커서: 마지막 항목의 (recorded_at, id)."""
+    return f"{recorded_at.isoformat()}_{record_id}"
+
+
+def decode_record_cursor(cursor: str) -> tuple[date, int]:
+    try:
+        day, record_id = cursor.split("_", 1)
+        return date.fromisoformat(day), int(record_id)
+    except ValueError:
+        raise InvalidRecordCursor("cursor 형식이 올바르지 않습니다.")
+
+
 class LunchRecordServiceImpl(LunchRecordServiceInterface):
     def create(
         self, db: Session, user_id: int, data: LunchRecordCreate
     ) -> LunchRecordResponse:
-        record = LunchRecord(
+        now = datetime.utcnow()
+        record = insert_returning(
+            db,
+            LunchRecord,
+            {
+                "user_id": user_id,
+                "recorded_at": data.recorded_at,
+                "category": data.category,
+                "menu_name": data.menu_name,
+                "content": data.content,
+                "created_at": now,
+                "updated_at": now,
+            },
+            LunchRecordResponse,
+        )
+        # 리포트용 일자 집계는 기록과 같은 트랜잭션에서 증가
+        add_record_to_daily_rollup(
+            db,
             user_id=user_id,
-            recorded_at=data.recorded_at,
-            content=data.content,
+            day=data.recorded_at,
+            category=data.category,
+            menu_name=data.menu_name,
         )
-        db.add(record)
+        # 소급 기록이면 해당 기간의 미리 만든 리포트가 낡으므로 함께 삭제
+        delete_snapshots_covering(db, user_id=user_id, day=data.recorded_at)
         db.commit()
-        db.refresh(record)
-        return LunchRecordResponse(
-            id=record.id,
+        publish(
+            LUNCH_RECORD_CREATED,
+            record_id=record.id,
             user_id=record.user_id,
             recorded_at=record.recorded_at,
-            content=record.content,
+            category=record.category,
+            menu_name=record.menu_name,
+        )
+        return record
+
+    def create_bulk(
+        self, db: Session, user_id: int, items: List[Any]
+    ) -> LunchRecordBulkCreateResponse:
+        valid: List[tuple[int, LunchRecordCreate]] = []
+        errors: List[LunchRecordBulkItemError] = []
+        for index, item in enumerate(items):
+            try:
+                valid.append((index, LunchRecordCreate.model_validate(item)))
+            except ValidationError as e:
+                messages = [
+                    f"{'.'.join(str(loc) for loc in err['loc']) or 'item'}: {err['msg']}"
+                    for err in e.errors()
+                ]
+                errors.append(LunchRecordBulkItemError(index=index, errors=messages))
+
+        ids: List[Optional[int]] = [None] * len(items)
+        if not valid:
+            return LunchRecordBulkCreateResponse(ids=ids, created=0, errors=errors)
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "user_id": user_id,
+                "recorded_at": data.recorded_at,
+                "category": data.category,
+                "menu_name": data.menu_name,
+                "content": data.content,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for _, data in valid
+        ]
+        # executemany + RETURNING: 다중 행 INSERT로 묶이며, 반환 순서는 입력 순서와 같다
+        stmt = insert(LunchRecord).returning(
+            *returning_columns(LunchRecord, LunchRecordResponse), sort_by_parameter_order=True
+        )
+        records = [schema_from_row(LunchRecordResponse, row) for row in db.execute(stmt, rows).all()]
+
+        # 일자 집계는 일자별로 한 번씩 증가
+        totals: Counter = Counter()
+        categories: Dict[date, Counter] = defaultdict(Counter)
+        menus: Dict[date, Counter] = defaultdict(Counter)
+        for _, data in valid:
+            totals[data.recorded_at] += 1
+            if data.category:
+                categories[data.recorded_at][data.category] += 1
+            if data.menu_name:
+                menus[data.recorded_at][data.menu_name] += 1
+        for day in sorted(totals):
+            increment_daily_rollup(
+                db,
+                user_id=user_id,
+                day=day,
+                total=totals[day],
+                category_counts=dict(categories[day]),
+                menu_counts=dict(menus[day]),
+            )
+            delete_snapshots_covering(db, user_id=user_id, day=day)
+        db.commit()
+
+        for (index, _), record in zip(valid, records):
+            ids[index] = record.id
+            publish(
+                LUNCH_RECORD_CREATED,
+                record_id=record.id,
+                user_id=record.user_id,
+                recorded_at=record.recorded_at,
+                category=record.category,
+                menu_name=record.menu_name,
+            )
+        return LunchRecordBulkCreateResponse(ids=ids, created=len(records), errors=errors)
+
+    def list_mine(
+        self,
+        db: Session,
+        user_id: int,
+        from_date: Optional[date],
+        to_date: Optional[date],
+        cursor: Optional[str],
+        limit: int,
+    ) -> LunchRecordPage:
+        # (user_id, recorded_at DESC, id DESC) 인덱스 범위 스캔. 몇 번째 페이지든 비용이 같다 (OFFSET 없음)
+        stmt = (
+            select(*returning_columns(LunchRecord, LunchRecordResponse))
+            .where(LunchRecord.user_id == user_id)
+            .order_by(LunchRecord.recorded_at.desc(), LunchRecord.id.desc())
+            .limit(limit + 1)
         )
+        if from_date is not None:
+            stmt = stmt.where(LunchRecord.recorded_at >= from_date)
+        if to_date is not None:
+            stmt = stmt.where(LunchRecord.recorded_at <= to_date)
+        if cursor:
+            cursor_day, cursor_id = decode_record_cursor(cursor)
+            stmt = stmt.where(tuple_(LunchRecord.recorded_at, LunchRecord.id) < tuple_(cursor_day, cursor_id))
+        rows = db.execute(stmt).all()
+        items = [schema_from_row(LunchRecordResponse, row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = encode_record_cursor(last.recorded_at, last.id)
+        return LunchRecordPage(items=items, next_cursor=next_cursor)
@@ -0,0 +1,190 @@
+"""점심 기록 대량 적재 (CSV / NDJSON → COPY).
+
+- 입력을 chunk_size 행씩 읽어 검증하고, 청크를 CSV 버퍼로 만들어 psycopg2 copy_expert로 적재한다
+  (메모리는 청크 크기로 제한).
+- 검증: LunchRecordCreate 규칙(날짜 형식, category ≤ 50, menu_name ≤ 200, content ≤ 2000)과
+  user_id(정수, 존재하는 사용자). 잘못된 행은 건너뛰고 (행 번호, 사유)로 보고한다.
+- 전체 적재는 한 트랜잭션이다. 끝나면 영향받은 사용자의 user_daily_rollup을 다시 계산하고
+  리포트 스냅샷을 지운다. 새 기록에는 반응이 없으므로 reaction_counts는 바뀌지 않는다.
+- 커밋 직전에 적재한 행의 updated_at을 다시 찍어 적재 중 동기화한 클라이언트도 GET /sync로 받게 한다.
+- psycopg2 연결이 필요하므로 sync 엔진 세션(SessionLocal)으로 호출한다.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from core.events import LUNCH_RECORDS_IMPORTED, publish
+from domains.lunch_records.schemas import LunchRecordCreate
+from domains.reports.service.daily_rollup import rebuild_daily_rollup
+from domains.reports.service.report_snapshots import delete_user_snapshots
+from models import LunchRecord, User
+
+IMPORT_FORMATS = ("csv", "ndjson")
+DEFAULT_IMPORT_CHUNK_SIZE = 10_000
+# 응답/출력에 담는 오류 행 수 상한
+MAX_REPORTED_ERRORS = 100
+
+_COPY_COLUMNS = ("user_id", "recorded_at", "category", "menu_name", "content", "created_at", "updated_at")
+_COPY_SQL = (
+    f"COPY {LunchRecord.__tablename__} ({', '.join(_COPY_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+)
+
+
+class ImportResult(NamedTuple):
+    imported: int
+    rejected: int
+    errors: List[Tuple[int, str]]
+    user_ids: List[int]
+
+
+def detect_format(filename: str) -> str:
+    return "ndjson" if filename.endswith((".ndjson", ".jsonl")) else "csv"
+
+
+def _iter_source(fp: IO[str], fmt: str) -> Iterator[Tuple[int, Any]]:
+    """(행 번호, 원본 dict)를 흘려보낸다. 행 번호는 1부터 (CSV는 헤더 다음 행이 1)."""
+    if fmt == "csv":
+        for line_no, raw in enumerate(csv.DictReader(fp), start=1):
+            yield line_no, raw
+        return
+    for line_no, line in enumerate(fp, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, e
+
+
+def _validate(raw: Any) -> Tuple[Optional[Tuple[int, LunchRecordCreate]], Optional[str]]:
+    if isinstance(raw, Exception):
+        return None, f"JSON 형식 오류: {raw}"
+    if not isinstance(raw, dict):
+        return None, "객체가 아닙니다."
+    # CSV의 빈 칸은 NULL
+    item: Dict[str, Any] = {k: (None if v == "" else v) for k, v in raw.items() if k}
+    try:
+        user_id = int(item.pop("user_id"))
+    except (KeyError, TypeError, ValueError):
+        return None, "user_id: 정수가 필요합니다."
+    try:
+        return (user_id, LunchRecordCreate.model_validate(item)), None
+    except ValidationError as e:
+        return None, "; ".join(
+            f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+        )
+
+
+def _copy_field(value: Any) -> str:
+    """COPY CSV 필드. NULL만 따옴표 없는 \\N으로 쓰고 값은 항상 따옴표로 감싼다.
+
+    COPY는 따옴표 안의 값을 NULL 문자열과 비교하지 않으므로 본문이 \\N인 텍스트도 그대로 들어간다.
+    """
+    if value is None:
+        return "\\N"
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_chunk(db: Session, rows: List[Tuple[int, LunchRecordCreate]], now: datetime) -> None:
+    buf = io.StringIO()
+    for user_id, data in rows:
+        fields = (user_id, data.recorded_at.isoformat(), data.category, data.menu_name, data.content, now, now)
+        buf.write(",".join(_copy_field(v) for v in fields))
+        buf.write("\n")
+    buf.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(_COPY_SQL, buf)
+    finally:
+        cursor.close()
+
+
+def _restamp_imported(db: Session, user_ids: List[int], started_at: datetime) -> None:
+    """적재한 행의 updated_at을 커밋 직전 시각으로 다시 찍는다.
+
+    적재 시작 시각 그대로 커밋하면 적재 중에 동기화한 클라이언트의 토큰이 이미 그 시각을 지나
+    GET /sync에서 이 행들을 받지 못한다.
+    """
+    db.execute(
+        text(
+            "UPDATE lunch_records SET updated_at = clock_timestamp() AT TIME ZONE 'utc' "
+            "WHERE user_id = ANY(:user_ids) AND created_at = :started_at AND updated_at = :started_at"
+        ),
+        {"user_ids": user_ids, "started_at": started_at},
+    )
+
+
+def import_lunch_records(
+    db: Session,
+    fp: IO[str],
+    fmt: str,
+    chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE,
+    on_progress=None,
+) -> ImportResult:
+    """fp의 기록을 검증해 COPY로 적재하고 파생 집계를 다시 만든다. 커밋까지 수행한다.
+
+    on_progress(imported, rejected)는 청크마다 호출된다.
+    """
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+    now = datetime.utcnow()
+    imported = rejected = 0
+    errors: List[Tuple[int, str]] = []
+    affected: Set[int] = set()
+    known_users: Set[int] = set()
+
+    def reject(line_no: int, message: str) -> None:
+        nonlocal rejected
+        rejected += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append((line_no, message))
+
+    def flush(chunk: List[Tuple[int, Tuple[int, LunchRecordCreate]]]) -> None:
+        nonlocal imported
+        unknown = {uid for _, (uid, _) in chunk} - known_users
+        if unknown:
+            known_users.update(db.execute(select(User.id).where(User.id.in_(unknown))).scalars())
+        rows = []
+        for line_no, (uid, data) in chunk:
+            if uid in known_users:
+                rows.append((uid, data))
+            else:
+                reject(line_no, f"user_id: 존재하지 않는 사용자입니다 ({uid}).")
+        if rows:
+            _copy_chunk(db, rows, now)
+            imported += len(rows)
+            affected.update(uid for uid, _ in rows)
+        if on_progress is not None:
+            on_progress(imported, rejected)
+
+    chunk: List[Tuple[int, Tuple[int, LunchRecordCreate]]] = []
+    for line_no, raw in _iter_source(fp, fmt):
+        row, error = _validate(raw)
+        if error is not None:
+            reject(line_no, error)
+            continue
+        chunk.append((line_no, row))
+        if len(chunk) >= chunk_size:
+            flush(chunk)
+            chunk = []
+    if chunk:
+        flush(chunk)
+
+    user_ids = sorted(affected)
+    if user_ids:
+        rebuild_daily_rollup(db, user_ids)
+        delete_user_snapshots(db, user_ids)
+        _restamp_imported(db, user_ids, now)
+    db.commit()
+    if user_ids:
+        publish(LUNCH_RECORDS_IMPORTED, user_ids=user_ids)
+    return ImportResult(imported=imported, rejected=rejected, errors=errors, user_ids=user_ids)
@@ -0,0 +1 @@
+# domains.metrics package (프로세스 내 운영 지표)
@@ -0,0 +1,19 @@
+"""Metrics FastAPI 라우터. 프로세스 내 캐시 카운터 등 운영 지표를 노출한다 (워커 프로세스별 값)."""
+
+from fastapi import APIRouter
+
+from core.cache import cache_stats
+from domains.metrics.schemas import CacheStats, CacheStatsResponse
+
+router = APIRouter()
+
+
+@router.get(
+    "/caches",
+    response_model=CacheStatsResponse,
+    summary="캐시 지표",
+    description="프로세스 내 캐시별 hit/miss/eviction 카운터를 반환합니다. 값은 이 워커 프로세스 기준입니다.",
+)
+async def get_cache_stats() -> CacheStatsResponse:
+    """등록된 캐시의 카운터를 반환한다."""
+    return CacheStatsResponse(caches=[CacheStats(**s) for s in cache_stats()])
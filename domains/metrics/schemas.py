@@ -0,0 +1,26 @@
+"""Metrics 도메인 응답 스키마."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CacheStats(BaseModel):
+    """프로세스 내 캐시 하나의 카운터 (core.cache.TTLCache)."""
+
+    name: str = Field(..., description="캐시 이름 예: community.feed")
+    size: int = Field(..., description="현재 항목 수")
+    maxsize: int = Field(..., description="최대 항목 수 (초과 시 LRU 축출)")
+    ttl_seconds: Optional[float] = Field(None, description="기본 TTL(초), null이면 만료 없음")
+    hits: int
+    misses: int
+    hit_rate: float = Field(..., description="hits / (hits + misses)")
+    evictions: int = Field(..., description="용량 초과로 축출된 수")
+    expirations: int = Field(..., description="TTL 만료로 제거된 수")
+    invalidations: int = Field(..., description="이벤트 등으로 명시적으로 제거된 수")
+
+
+class CacheStatsResponse(BaseModel):
+    """GET /metrics/caches 응답."""
+
+    caches: List[CacheStats]
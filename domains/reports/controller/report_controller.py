@@ -2,19 +2,18 @@
 
 from datetime import date
 
-from sqlalchemy.orm import Session
-
+from core.database import DBSession, run_db_in_thread
 from core.report_period import PERIOD_TYPES, PeriodType
-from domains.reports.schemas import PeriodReportResponse
+from domains.reports.schemas import PeriodReportResponse, TrendReportResponse
 from domains.reports.service.report_service import ReportServiceInterface
 
 
 class ReportController:
-    def __init__(self, service: ReportServiceInterface, db: Session) -> None:
+    def __init__(self, service: ReportServiceInterface, db: DBSession) -> None:
         self._service = service
         self._db = db
 
-    def get_period_report(
+    async def get_period_report(
         self,
         user_id: int,
         period: PeriodType,
@@ -22,10 +21,30 @@ class ReportController:
         top_n: int = 5,
     ) -> PeriodReportResponse:
         """기준일이 속한 주/월/연 식습관 리포트 조회."""
-        return self._service.get_period_report(
+        return await run_db_in_thread(
+            self._db,
+            self._service.get_period_report,
+            user_id=user_id,
+            period=period,
+            reference_date=reference_date,
+            top_n=top_n,
+        )
+
+    async def get_trend_report(
+        self,
+        user_id: int,
+        period: PeriodType,
+        reference_date: date,
+        count: int,
+        top_n: int = 5,
+    ) -> TrendReportResponse:
+        """기준일이 속한 기간까지 연속된 count개 기간의 리포트 조회."""
+        return await run_db_in_thread(
             self._db,
+            self._service.get_trend_report,
             user_id=user_id,
             period=period,
             reference_date=reference_date,
+            count=count,
             top_n=top_n,
         )
@@ -1,18 +1,18 @@
 """Reports FastAPI 라우터 (Backlog-002)."""
 
 from datetime import date
+from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
 
-from core.database import get_db
-from core.report_period import PeriodType
+from core.database import DBSession, get_session
+from core.report_period import PeriodType, today_kst
 from domains.reports.controller.report_controller import ReportController
-from domains.reports.schemas import PeriodReportResponse
+from domains.reports.schemas import PeriodReportResponse, TrendReportResponse
 from domains.reports.service.report_service_impl import ReportServiceImpl
 
 
-def get_controller(db: Session = Depends(get_db)) -> ReportController:
+async def get_controller(db: DBSession = Depends(get_session)) -> ReportController:
     """Controller 의존성."""
     return ReportController(service=ReportServiceImpl(), db=db)
 
@@ -30,7 +30,7 @@ router = APIRouter()
         400: {"description": "period 또는 date 형식 오류"},
     },
 )
-def get_period_report(
+async def get_period_report(
     period: PeriodType = Query(..., description="week | month | year"),
     date_param: date = Query(..., alias="date", description="기준일 (YYYY-MM-DD)"),
     top_n: int = Query(5, ge=1, le=20, description="Top 메뉴 개수"),
@@ -39,9 +39,38 @@ def get_period_report(
     user_id: int = 1,
 ) -> PeriodReportResponse:
     """기준일이 포함된 기간의 내 기록만 집계: 카테고리 비중 + 메뉴 빈도 Top N."""
-    return controller.get_period_report(
+    return await controller.get_period_report(
         user_id=user_id,
         period=period,
         reference_date=date_param,
         top_n=top_n,
     )
+
+
+@router.get(
+    "/trend",
+    response_model=TrendReportResponse,
+    summary="주/월/연 식습관 추이",
+    description="기준일이 속한 기간까지 연속된 count개 주/월/연 리포트를 한 번에 반환합니다.",
+    responses={
+        200: {"description": "기간별 리포트 (오래된 순, 기록 없는 기간은 totalRecords=0)"},
+        400: {"description": "period, date 또는 count 형식 오류"},
+    },
+)
+async def get_trend_report(
+    period: PeriodType = Query(..., description="week | month | year"),
+    count: int = Query(12, ge=1, le=60, description="기간 개수"),
+    date_param: Optional[date] = Query(None, alias="date", description="기준일 (YYYY-MM-DD, 기본 오늘)"),
+    top_n: int = Query(5, ge=1, le=20, description="기간별 Top 메뉴 개수"),
+    controller: ReportController = Depends(get_controller),
+    # TODO: 인증 후 user_id는 JWT 등에서 추출, 미인증 시 401
+    user_id: int = 1,
+) -> TrendReportResponse:
+    """전체 구간을 한 쿼리로 읽어 기간별로 버킷팅: 기간마다 카테고리 비중 + Top N 메뉴."""
+    return await controller.get_trend_report(
+        user_id=user_id,
+        period=period,
+        reference_date=date_param or today_kst(),
+        count=count,
+        top_n=top_n,
+    )
@@ -48,6 +48,16 @@ class PeriodReportResponse(BaseModel):
     )
 
 
+class TrendReportResponse(BaseModel):
+    """연속된 N개 주/월/연 리포트 (GET /reports/trend)."""
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    period: str = Field(..., description="week | month | year")
+    range: PeriodRange = Field(..., description="전체 구간 (첫 버킷 시작일 ~ 마지막 버킷 종료일)")
+    buckets: List[PeriodReportResponse] = Field(..., description="기간별 리포트 (오래된 순)")
+
+
 # --- 하위 호환용 (기존 start_date/end_date 방식 사용 시) ---
 
 
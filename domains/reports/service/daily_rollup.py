@@ -0,0 +1,169 @@
+"""사용자·일자별 집계 (user_daily_rollup) 증가·합산·재계산.
+
+- 증가: 기록 생성과 같은 트랜잭션에서 호출 (커밋은 호출자 책임).
+- 합산: 리포트 기간의 일자 행(최대 366개)을 더해 총 기록 수·카테고리·메뉴 빈도를 만든다.
+- 재계산: lunch_records에서 다시 집계해 덮어쓴다 (백필/복구용).
+"""
+
+import json
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from models import UserDailyRollup
+
+
+def _merge_counts_sql(column: str) -> str:
+    """ON CONFLICT 갱신 시 기존 JSONB 카운트와 EXCLUDED 카운트를 키별로 더하는 식."""
+    return f"""(
+        SELECT coalesce(jsonb_object_agg(key, total), '{{}}'::jsonb)
+        FROM (
+            SELECT key, sum(value::int) AS total
+            FROM (
+                SELECT * FROM jsonb_each_text(user_daily_rollup.{column})
+                UNION ALL
+                SELECT * FROM jsonb_each_text(EXCLUDED.{column})
+            ) AS merged
+            GROUP BY key
+        ) AS summed
+    )"""
+
+
+_INCREMENT_SQL = text(
+    f"""
+    INSERT INTO user_daily_rollup (user_id, day, total, category_counts, menu_counts, updated_at)
+    VALUES (:user_id, :day, :total, CAST(:category_counts AS JSONB), CAST(:menu_counts AS JSONB), :now)
+    ON CONFLICT (user_id, day) DO UPDATE SET
+        total = user_daily_rollup.total + EXCLUDED.total,
+        category_counts = {_merge_counts_sql("category_counts")},
+        menu_counts = {_merge_counts_sql("menu_counts")},
+        updated_at = EXCLUDED.updated_at
+    """
+)
+
+# lunch_records에서 일자별로 다시 집계한다. {where}는 user_id 필터 (전체면 TRUE).
+_REBUILD_SQL = """
+    INSERT INTO user_daily_rollup (user_id, day, total, category_counts, menu_counts, updated_at)
+    SELECT
+        d.user_id,
+        d.day,
+        d.total,
+        coalesce((
+            SELECT jsonb_object_agg(c.category, c.n)
+            FROM (
+                SELECT category, count(*) AS n FROM lunch_records
+                WHERE user_id = d.user_id AND recorded_at = d.day
+                  AND category IS NOT NULL AND category <> ''
+                GROUP BY category
+            ) AS c
+        ), '{{}}'::jsonb),
+        coalesce((
+            SELECT jsonb_object_agg(m.menu_name, m.n)
+            FROM (
+                SELECT menu_name, count(*) AS n FROM lunch_records
+                WHERE user_id = d.user_id AND recorded_at = d.day
+                  AND menu_name IS NOT NULL AND menu_name <> ''
+                GROUP BY menu_name
+            ) AS m
+        ), '{{}}'::jsonb),
+        :now
+    FROM (
+        SELECT user_id, recorded_at AS day, count(*) AS total
+        FROM lunch_records
+        WHERE {where}
+        GROUP BY user_id, recorded_at
+    ) AS d
+    ON CONFLICT (user_id, day) DO UPDATE SET
+        total = EXCLUDED.total,
+        category_counts = EXCLUDED.category_counts,
+        menu_counts = EXCLUDED.menu_counts,
+        updated_at = EXCLUDED.updated_at
+"""
+
+
+def increment_daily_rollup(
+    db: Session,
+    user_id: int,
+    day: date,
+    total: int,
+    category_counts: Dict[str, int],
+    menu_counts: Dict[str, int],
+) -> None:
+    """(user_id, day) 집계에 기록 수와 카테고리/메뉴별 수를 더한다."""
+    db.execute(
+        _INCREMENT_SQL,
+        {
+            "user_id": user_id,
+            "day": day,
+            "total": total,
+            "category_counts": json.dumps(category_counts, ensure_ascii=False),
+            "menu_counts": json.dumps(menu_counts, ensure_ascii=False),
+            "now": datetime.utcnow(),
+        },
+    )
+
+
+def add_record_to_daily_rollup(
+    db: Session,
+    user_id: int,
+    day: date,
+    category: Optional[str],
+    menu_name: Optional[str],
+) -> None:
+    """기록 1건을 집계에 반영한다 (빈 category/menu_name은 총 수에만 포함)."""
+    increment_daily_rollup(
+        db,
+        user_id=user_id,
+        day=day,
+        total=1,
+        category_counts={category: 1} if category else {},
+        menu_counts={menu_name: 1} if menu_name else {},
+    )
+
+
+def sum_daily_rollup(
+    db: Session,
+    user_id: int,
+    from_date: date,
+    to_date: date,
+) -> Tuple[int, Counter, Counter]:
+    """기간 내 일자 집계를 합산해 (총 기록 수, 카테고리별 수, 메뉴별 수)를 반환한다."""
+    stmt = (
+        select(UserDailyRollup.total, UserDailyRollup.category_counts, UserDailyRollup.menu_counts)
+        .where(UserDailyRollup.user_id == user_id)
+        .where(UserDailyRollup.day >= from_date)
+        .where(UserDailyRollup.day <= to_date)
+    )
+    total = 0
+    categories: Counter = Counter()
+    menus: Counter = Counter()
+    for day_total, category_counts, menu_counts in db.execute(stmt).all():
+        total += day_total
+        categories.update(category_counts or {})
+        menus.update(menu_counts or {})
+    return total, categories, menus
+
+
+def rebuild_daily_rollup(db: Session, user_ids: Optional[Iterable[int]] = None) -> int:
+    """lunch_records에서 일자 집계를 다시 만든다 (user_ids 없으면 전체). 커밋은 호출자 책임.
+
+    재계산 동안 user_daily_rollup을 EXCLUSIVE로 잠가(조회는 허용) 동시에 생성되는
+    기록의 증가분이 덮어써지지 않게 한다. 반환값은 다시 쓴 (user, day) 행 수.
+    """
+    db.execute(text("LOCK TABLE user_daily_rollup IN EXCLUSIVE MODE"))
+    params: Dict[str, object] = {"now": datetime.utcnow()}
+    if user_ids is None:
+        db.execute(text("DELETE FROM user_daily_rollup"))
+        where = "TRUE"
+    else:
+        params["user_ids"] = sorted(set(user_ids))
+        db.execute(
+            text("DELETE FROM user_daily_rollup WHERE user_id = ANY(:user_ids)"),
+            {"user_ids": params["user_ids"]},
+        )
+        where = "user_id = ANY(:user_ids)"
+    result = db.execute(text(_REBUILD_SQL.format(where=where)), params)
+    return result.rowcount
@@ -0,0 +1,61 @@
+"""기간 리포트 결과 캐시 (Backlog-002).
+
+키: (user_id, period, from_date, top_n)
+- 지난 기간(종료일 < 오늘, KST): 기록이 추가되지 않는 한 바뀌지 않으므로 만료 없이 보관 (LRU로만 축출).
+- 현재 기간: 짧은 TTL.
+- 무효화: 기록 생성 이벤트의 recorded_at이 캐시된 기간 [from, to] 안에 있는 해당 사용자 항목만 제거
+  (소급 기록이면 지난 기간 항목도 정확히 제거된다).
+
+무효화는 프로세스 내 이벤트라 워커가 여러 개면 다른 워커의 캐시는 지워지지 않는다.
+그런 배포에서는 REPORT_CACHE_CLOSED_TTL_SECONDS로 지난 기간에도 TTL을 둔다.
+"""
+
+import os
+from datetime import date
+from typing import List, Optional, Tuple
+
+from core.cache import TTLCache
+from core.events import LUNCH_RECORD_CREATED, LUNCH_RECORDS_IMPORTED, subscribe
+from core.report_period import PeriodType, today_kst
+from domains.reports.schemas import PeriodReportResponse
+
+REPORT_CACHE_MAX_ENTRIES = int(os.getenv("REPORT_CACHE_MAX_ENTRIES", "4096"))
+REPORT_CACHE_OPEN_TTL_SECONDS = float(os.getenv("REPORT_CACHE_OPEN_TTL_SECONDS", "30"))
+_closed_ttl = os.getenv("REPORT_CACHE_CLOSED_TTL_SECONDS")
+REPORT_CACHE_CLOSED_TTL_SECONDS: Optional[float] = float(_closed_ttl) if _closed_ttl else None
+
+# (user_id, period, from_date, top_n)
+ReportCacheKey = Tuple[int, str, date, int]
+
+report_cache = TTLCache(
+    "reports.period",
+    maxsize=REPORT_CACHE_MAX_ENTRIES,
+    ttl_seconds=REPORT_CACHE_OPEN_TTL_SECONDS,
+)
+
+
+def report_cache_key(user_id: int, period: PeriodType, from_date: date, top_n: int) -> ReportCacheKey:
+    return (user_id, period, from_date, top_n)
+
+
+def cache_report(key: ReportCacheKey, report: PeriodReportResponse) -> None:
+    """지난 기간은 만료 없이(또는 REPORT_CACHE_CLOSED_TTL_SECONDS), 현재 기간은 짧은 TTL로 저장."""
+    if report.range.to < today_kst():
+        report_cache.set(key, report, ttl=REPORT_CACHE_CLOSED_TTL_SECONDS)
+    else:
+        report_cache.set(key, report)
+
+
+def _on_lunch_record_created(user_id: int, recorded_at: date, **_: object) -> None:
+    report_cache.pop_where(
+        lambda key, report: key[0] == user_id and report.range.from_ <= recorded_at <= report.range.to
+    )
+
+
+def _on_lunch_records_imported(user_ids: List[int], **_: object) -> None:
+    affected = set(user_ids)
+    report_cache.pop_where(lambda key, _report: key[0] in affected)
+
+
+subscribe(LUNCH_RECORD_CREATED, _on_lunch_record_created)
+subscribe(LUNCH_RECORDS_IMPORTED, _on_lunch_records_imported)
@@ -6,7 +6,7 @@ from datetime import date
 from sqlalchemy.orm import Session
 
 from core.report_period import PeriodType
-from domains.reports.schemas import PeriodReportResponse
+from domains.reports.schemas import PeriodReportResponse, TrendReportResponse
 
 
 class ReportServiceInterface(ABC):
@@ -21,3 +21,16 @@ class ReportServiceInterface(ABC):
     ) -> PeriodReportResponse:
         """기준일이 속한 주/월/연의 식습관 리포트 조회 (카테고리 비중 + Top 메뉴)."""
         ...
+
+    @abstractmethod
+    def get_trend_report(
+        self,
+        db: Session,
+        user_id: int,
+        period: PeriodType,
+        reference_date: date,
+        count: int,
+        top_n: int = 5,
+    ) -> TrendReportResponse:
+        """기준일이 속한 기간까지 연속된 count개 기간의 리포트 (오래된 순)."""
+        ...
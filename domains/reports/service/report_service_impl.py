@@ -1,21 +1,36 @@
 """Reports Service 구현체 (Backlog-002)."""
 
+import os
 from datetime import date
-from typing import List
+from typing import List, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import Session
 
-from core.report_period import PeriodType, get_period_range
+from core.report_period import PeriodType, get_period_range, today_kst
 from domains.reports.schemas import (
     CategoryShareItem,
     PeriodRange,
     PeriodReportResponse,
     TopMenuItem,
+    TrendReportResponse,
 )
+from domains.reports.service.daily_rollup import sum_daily_rollup
+from domains.reports.service.report_cache import cache_report, report_cache, report_cache_key
 from domains.reports.service.report_service import ReportServiceInterface
+from domains.reports.service.report_snapshots import get_report_snapshot
+from domains.reports.service.trend import bucket_reports, period_buckets
 from models import LunchRecord
 
+# 리포트 집계 경로:
+# - rollup (기본): user_daily_rollup 합산
+# - onepass: lunch_records를 GROUPING SETS 한 문장으로 집계
+# - raw: lunch_records 3-쿼리 (기존 경로, 비교용)
+REPORT_QUERY_MODE = os.getenv("REPORT_QUERY_MODE", "rollup")
+
+# (총 기록 수, [(카테고리, 수)], [(메뉴명, 수)] Top N)
+Aggregates = Tuple[int, List[Tuple[str, int]], List[Tuple[str, int]]]
+
 
 class ReportServiceImpl(ReportServiceInterface):
     def get_period_report(
@@ -28,53 +43,48 @@ class ReportServiceImpl(ReportServiceInterface):
     ) -> PeriodReportResponse:
         from_date, to_date = get_period_range(reference_date, period)
 
-        # 전체 기록 수 (기간 내 내 기록)
-        count_stmt = (
-            select(func.count(LunchRecord.id))
-            .where(LunchRecord.user_id == user_id)
-            .where(LunchRecord.recorded_at >= from_date)
-            .where(LunchRecord.recorded_at <= to_date)
-        )
-        total_records = db.scalar(count_stmt) or 0
+        key = report_cache_key(user_id, period, from_date, top_n)
+        cached = report_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # 지난 기간은 배치가 미리 만든 스냅샷이 있으면 그대로 사용
+        if to_date < today_kst():
+            snapshot = get_report_snapshot(db, user_id, period, from_date, top_n)
+            if snapshot is not None:
+                cache_report(key, snapshot)
+                return snapshot
+
+        report = self.build_period_report(db, user_id, period, from_date, to_date, top_n)
+        cache_report(key, report)
+        return report
+
+    def build_period_report(
+        self,
+        db: Session,
+        user_id: int,
+        period: PeriodType,
+        from_date: date,
+        to_date: date,
+        top_n: int = 5,
+    ) -> PeriodReportResponse:
+        """캐시·스냅샷 없이 기간을 집계해 리포트를 만든다 (스냅샷 배치에서도 사용)."""
+        if REPORT_QUERY_MODE == "raw":
+            total_records, categories, menus = self._aggregate_raw(db, user_id, from_date, to_date, top_n)
+        elif REPORT_QUERY_MODE == "onepass":
+            total_records, categories, menus = self._aggregate_onepass(db, user_id, from_date, to_date, top_n)
+        else:
+            total_records, categories, menus = self._aggregate_rollup(db, user_id, from_date, to_date, top_n)
 
         category_share: List[CategoryShareItem] = []
         top_menus: List[TopMenuItem] = []
-
         if total_records > 0:
-            # 카테고리별 집계 (category가 있는 기록만)
-            cat_stmt = (
-                select(LunchRecord.category, func.count(LunchRecord.id))
-                .where(LunchRecord.user_id == user_id)
-                .where(LunchRecord.recorded_at >= from_date)
-                .where(LunchRecord.recorded_at <= to_date)
-                .where(LunchRecord.category.isnot(None))
-                .where(LunchRecord.category != "")
-                .group_by(LunchRecord.category)
-            )
-            rows = db.execute(cat_stmt).all()
-            for category, count in rows:
-                ratio = round(count / total_records, 4)
-                category_share.append(
-                    CategoryShareItem(category=category, count=count, ratio=ratio)
-                )
-            # ratio 합계 ≈ 1 되도록 정렬 후 유지 (반올림 오차 허용)
-
-            # 메뉴명별 빈도 Top N (menu_name이 있는 기록만)
-            menu_stmt = (
-                select(LunchRecord.menu_name, func.count(LunchRecord.id))
-                .where(LunchRecord.user_id == user_id)
-                .where(LunchRecord.recorded_at >= from_date)
-                .where(LunchRecord.recorded_at <= to_date)
-                .where(LunchRecord.menu_name.isnot(None))
-                .where(LunchRecord.menu_name != "")
-                .group_by(LunchRecord.menu_name)
-                .order_by(func.count(LunchRecord.id).desc())
-                .limit(top_n)
-            )
-            menu_rows = db.execute(menu_stmt).all()
-            top_menus = [
-                TopMenuItem(menu_name=name, count=cnt) for name, cnt in menu_rows
+            # ratio 합계 ≈ 1 (반올림 오차 허용)
+            category_share = [
+                CategoryShareItem(category=category, count=count, ratio=round(count / total_records, 4))
+                for category, count in categories
             ]
+            top_menus = [TopMenuItem(menu_name=name, count=cnt) for name, cnt in menus]
 
         return PeriodReportResponse(
             period=period,
@@ -83,3 +93,127 @@ class ReportServiceImpl(ReportServiceInterface):
             category_share=category_share,
             top_menus=top_menus,
         )
+
+    def get_trend_report(
+        self,
+        db: Session,
+        user_id: int,
+        period: PeriodType,
+        reference_date: date,
+        count: int,
+        top_n: int = 5,
+    ) -> TrendReportResponse:
+        buckets = period_buckets(reference_date, period, count)
+        from_date, to_date = buckets[0][0], buckets[-1][1]
+
+        # 전체 구간을 한 번만 읽는다 (user_id, recorded_at) INCLUDE (category, menu_name)
+        stmt = (
+            select(LunchRecord.recorded_at, LunchRecord.category, LunchRecord.menu_name)
+            .where(LunchRecord.user_id == user_id)
+            .where(LunchRecord.recorded_at >= from_date)
+            .where(LunchRecord.recorded_at <= to_date)
+        )
+        rows = db.execute(stmt).all()
+        return TrendReportResponse(
+            period=period,
+            range=PeriodRange(from_=from_date, to=to_date),
+            buckets=bucket_reports(rows, buckets, period, top_n),
+        )
+
+    def _aggregate_rollup(
+        self,
+        db: Session,
+        user_id: int,
+        from_date: date,
+        to_date: date,
+        top_n: int,
+    ) -> Aggregates:
+        """user_daily_rollup의 기간 내 일자 행(최대 366개)을 합산한다."""
+        total_records, categories, menus = sum_daily_rollup(db, user_id, from_date, to_date)
+        category_rows = sorted(categories.items(), key=lambda kv: (-kv[1], kv[0]))
+        menu_rows = sorted(menus.items(), key=lambda kv: (-kv[1], kv[0]))[:top_n]
+        return total_records, category_rows, menu_rows
+
+    def _aggregate_onepass(
+        self,
+        db: Session,
+        user_id: int,
+        from_date: date,
+        to_date: date,
+        top_n: int,
+    ) -> Aggregates:
+        """기간 내 기록을 한 번 읽어 카테고리별·메뉴별 수를 GROUPING SETS로 함께 집계한다.
+
+        GROUPING(category, menu_name): 1 = (category) 집합, 2 = (menu_name) 집합.
+        (category) 집합의 합(NULL/빈 카테고리 포함)이 총 기록 수다.
+        """
+        grouping = func.grouping(LunchRecord.category, LunchRecord.menu_name)
+        stmt = (
+            select(LunchRecord.category, LunchRecord.menu_name, func.count(LunchRecord.id), grouping)
+            .where(LunchRecord.user_id == user_id)
+            .where(LunchRecord.recorded_at >= from_date)
+            .where(LunchRecord.recorded_at <= to_date)
+            .group_by(
+                func.grouping_sets(tuple_(LunchRecord.category), tuple_(LunchRecord.menu_name))
+            )
+        )
+        total_records = 0
+        categories: List[Tuple[str, int]] = []
+        menus: List[Tuple[str, int]] = []
+        for category, menu_name, count, group in db.execute(stmt).all():
+            if group == 1:
+                total_records += count
+                if category:
+                    categories.append((category, count))
+            elif menu_name:
+                menus.append((menu_name, count))
+        categories.sort(key=lambda kv: (-kv[1], kv[0]))
+        menus.sort(key=lambda kv: (-kv[1], kv[0]))
+        return total_records, categories, menus[:top_n]
+
+    def _aggregate_raw(
+        self,
+        db: Session,
+        user_id: int,
+        from_date: date,
+        to_date: date,
+        top_n: int,
+    ) -> Aggregates:
+        """lunch_records를 직접 집계한다 (총 수 / 카테고리 / 메뉴 각 1쿼리)."""
+        # 전체 기록 수 (기간 내 내 기록)
+        count_stmt = (
+            select(func.count(LunchRecord.id))
+            .where(LunchRecord.user_id == user_id)
+            .where(LunchRecord.recorded_at >= from_date)
+            .where(LunchRecord.recorded_at <= to_date)
+        )
+        total_records = db.scalar(count_stmt) or 0
+        if total_records == 0:
+            return 0, [], []
+
+        # 카테고리별 집계 (category가 있는 기록만)
+        cat_stmt = (
+            select(LunchRecord.category, func.count(LunchRecord.id))
+            .where(LunchRecord.user_id == user_id)
+            .where(LunchRecord.recorded_at >= from_date)
+            .where(LunchRecord.recorded_at <= to_date)
+            .where(LunchRecord.category.isnot(None))
+            .where(LunchRecord.category != "")
+            .group_by(LunchRecord.category)
+        )
+        category_rows = [(category, count) for category, count in db.execute(cat_stmt).all()]
+
+        # 메뉴명별 빈도 Top N (menu_name이 있는 기록만)
+        menu_stmt = (
+            select(LunchRecord.menu_name, func.count(LunchRecord.id))
+            .where(LunchRecord.user_id == user_id)
+            .where(LunchRecord.recorded_at >= from_date)
+            .where(LunchRecord.recorded_at <= to_date)
+            .where(LunchRecord.menu_name.isnot(None))
+            .where(LunchRecord.menu_name != "")
+            .group_by(LunchRecord.menu_name)
+            .order_by(func.count(LunchRecord.id).desc())
+            .limit(top_n)
+        )
+        menu_rows = [(name, cnt) for name, cnt in db.execute(menu_stmt).all()]
+        return total_records, category_rows, menu_rows
@@ -0,0 +1,112 @@
+"""지난 기간 리포트 스냅샷 (report_snapshots) 조회·저장·무효화.
+
+- 배치(scripts/generate_report_snapshots.py)가 리포트 알림 사용자의 직전 기간 리포트를 미리 만든다.
+- 조회: 요청 top_n이 저장된 top_n 이하이면 topMenus를 잘라 그대로 응답한다.
+- 무효화: 기록 생성과 같은 트랜잭션에서 recorded_at을 포함하는 스냅샷을 지운다 (소급 기록).
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from core.report_period import PeriodType, get_period_range
+from domains.reports.schemas import PeriodReportResponse
+from models import ReportSnapshot
+
+
+def previous_period_range(today: date, period: PeriodType) -> Tuple[date, date]:
+    """today가 속한 기간의 바로 앞 기간 (from, to)."""
+    from_date, _ = get_period_range(today, period)
+    return get_period_range(from_date - timedelta(days=1), period)
+
+
+def get_report_snapshot(
+    db: Session,
+    user_id: int,
+    period: PeriodType,
+    from_date: date,
+    top_n: int,
+) -> Optional[PeriodReportResponse]:
+    """저장된 스냅샷이 있고 top_n을 만족하면 리포트를, 아니면 None."""
+    row = db.execute(
+        select(ReportSnapshot.top_n, ReportSnapshot.payload)
+        .where(ReportSnapshot.user_id == user_id)
+        .where(ReportSnapshot.period == period)
+        .where(ReportSnapshot.from_date == from_date)
+    ).first()
+    if row is None or row.top_n < top_n:
+        return None
+    report = PeriodReportResponse.model_validate(row.payload)
+    report.top_menus = report.top_menus[:top_n]
+    return report
+
+
+def save_report_snapshots(
+    db: Session,
+    reports: Iterable[Tuple[int, PeriodReportResponse]],
+    top_n: int,
+) -> int:
+    """(user_id, 리포트) 목록을 한 번의 업서트로 저장한다. 커밋은 호출자 책임."""
+    now = datetime.utcnow()
+    values = [
+        {
+            "user_id": user_id,
+            "period": report.period,
+            "from_date": report.range.from_,
+            "to_date": report.range.to,
+            "top_n": top_n,
+            "payload": report.model_dump(mode="json", by_alias=True),
+            "generated_at": now,
+        }
+        for user_id, report in reports
+    ]
+    if not values:
+        return 0
+    stmt = pg_insert(ReportSnapshot).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ReportSnapshot.user_id, ReportSnapshot.period, ReportSnapshot.from_date],
+        set_={
+            "to_date": stmt.excluded.to_date,
+            "top_n": stmt.excluded.top_n,
+            "payload": stmt.excluded.payload,
+            "generated_at": stmt.excluded.generated_at,
+        },
+    )
+    db.execute(stmt)
+    return len(values)
+
+
+def existing_snapshot_user_ids(
+    db: Session,
+    user_ids: List[int],
+    period: PeriodType,
+    from_date: date,
+) -> Set[int]:
+    """이미 스냅샷이 있는 사용자 (배치 재개 시 건너뛰기용)."""
+    if not user_ids:
+        return set()
+    stmt = (
+        select(ReportSnapshot.user_id)
+        .where(ReportSnapshot.user_id.in_(user_ids))
+        .where(ReportSnapshot.period == period)
+        .where(ReportSnapshot.from_date == from_date)
+    )
+    return set(db.execute(stmt).scalars().all())
+
+
+def delete_snapshots_covering(db: Session, user_id: int, day: date) -> None:
+    """day를 포함하는 사용자의 스냅샷을 지운다. 커밋은 호출자 책임."""
+    db.execute(
+        delete(ReportSnapshot)
+        .where(ReportSnapshot.user_id == user_id)
+        .where(ReportSnapshot.from_date <= day)
+        .where(ReportSnapshot.to_date >= day)
+    )
+
+
+def delete_user_snapshots(db: Session, user_ids: List[int]) -> None:
+    """사용자들의 스냅샷을 모두 지운다 (대량 적재 후). 커밋은 호출자 책임."""
+    db.execute(delete(ReportSnapshot).where(ReportSnapshot.user_id.in_(user_ids)))
@@ -0,0 +1,91 @@
+"""다기간 추이 리포트 버킷 집계 (GET /reports/trend).
+
+- 버킷 경계는 core.report_period.get_period_range로 만든다 (주=ISO 월~일, 월=1일~말일, 연=1/1~12/31).
+- 기록 → 버킷 배정은 버킷 시작일 배열에 대한 np.searchsorted로 벡터화한다.
+- 카테고리/메뉴 빈도는 pandas groupby(bucket, key).size()로 한 번에 센다.
+"""
+
+from datetime import date, timedelta
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.report_period import PeriodType, get_period_range
+from domains.reports.schemas import (
+    CategoryShareItem,
+    PeriodRange,
+    PeriodReportResponse,
+    TopMenuItem,
+)
+
+Bucket = Tuple[date, date]
+
+
+def period_buckets(reference_date: date, period: PeriodType, count: int) -> List[Bucket]:
+    """기준일이 속한 기간을 마지막으로 하는 연속된 count개 기간 (오래된 순)."""
+    buckets: List[Bucket] = []
+    from_date, to_date = get_period_range(reference_date, period)
+    for _ in range(count):
+        buckets.append((from_date, to_date))
+        from_date, to_date = get_period_range(from_date - timedelta(days=1), period)
+    buckets.reverse()
+    return buckets
+
+
+def _value_counts(df: pd.DataFrame, column: str) -> pd.Series:
+    """버킷별·값별 수. 빈 값(NULL/"")은 제외. index = (bucket, value)."""
+    valid = df[df[column].notna() & (df[column] != "")]
+    return valid.groupby(["bucket", column]).size()
+
+
+def _sorted_counts(counts: pd.Series, bucket: int) -> List[Tuple[str, int]]:
+    if bucket not in counts.index.get_level_values(0):
+        return []
+    items = [(str(name), int(n)) for name, n in counts.loc[bucket].items()]
+    items.sort(key=lambda kv: (-kv[1], kv[0]))
+    return items
+
+
+def bucket_reports(
+    rows: Iterable[Sequence],
+    buckets: List[Bucket],
+    period: PeriodType,
+    top_n: int,
+) -> List[PeriodReportResponse]:
+    """(recorded_at, category, menu_name) 행을 버킷별 리포트로 집계한다."""
+    df = pd.DataFrame(list(rows), columns=["recorded_at", "category", "menu_name"])
+    starts = np.array([b[0] for b in buckets], dtype="datetime64[D]")
+    if df.empty:
+        totals = np.zeros(len(buckets), dtype=np.int64)
+        categories = menus = pd.Series(dtype=np.int64)
+    else:
+        days = pd.to_datetime(df["recorded_at"]).to_numpy(dtype="datetime64[D]")
+        df["bucket"] = np.searchsorted(starts, days, side="right") - 1
+        totals = np.bincount(df["bucket"].to_numpy(), minlength=len(buckets))
+        categories = _value_counts(df, "category")
+        menus = _value_counts(df, "menu_name")
+
+    reports: List[PeriodReportResponse] = []
+    for i, (from_date, to_date) in enumerate(buckets):
+        total = int(totals[i])
+        category_share: List[CategoryShareItem] = []
+        top_menus: List[TopMenuItem] = []
+        if total > 0:
+            category_share = [
+                CategoryShareItem(category=name, count=n, ratio=round(n / total, 4))
+                for name, n in _sorted_counts(categories, i)
+            ]
+            top_menus = [
+                TopMenuItem(menu_name=name, count=n) for name, n in _sorted_counts(menus, i)[:top_n]
+            ]
+        reports.append(
+            PeriodReportResponse(
+                period=period,
+                range=PeriodRange(from_=from_date, to=to_date),
+                total_records=total,
+                category_share=category_share,
+                top_menus=top_menus,
+            )
+        )
+    return reports
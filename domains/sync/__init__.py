@@ -0,0 +1 @@
+# domains.sync package (모바일 증분 동기화)
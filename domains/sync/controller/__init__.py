@@ -0,0 +1 @@
+# domains.sync.controller
@@ -0,0 +1,22 @@
+"""Sync Controller. Service에 위임하며 DB 세션을 주입받는다."""
+
+from typing import Optional
+
+from fastapi import HTTPException
+
+from core.database import DBSession, run_db
+from domains.sync.schemas import SyncResponse
+from domains.sync.service.sync_service import InvalidSyncToken, SyncServiceInterface
+
+
+class SyncController:
+    def __init__(self, service: SyncServiceInterface, db: DBSession) -> None:
+        self._service = service
+        self._db = db
+
+    async def get_changes(self, user_id: int, since: Optional[str], limit: int) -> SyncResponse:
+        """since 이후 변경분 한 페이지."""
+        try:
+            return await run_db(self._db, self._service.get_changes, user_id=user_id, since=since, limit=limit)
+        except InvalidSyncToken as e:
+            raise HTTPException(status_code=400, detail=str(e))
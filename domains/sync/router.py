@@ -0,0 +1,36 @@
+"""Sync FastAPI 라우터. DB 세션은 Depends(get_session)으로 주입."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from core.database import DBSession, get_session
+from domains.sync.controller.sync_controller import SyncController
+from domains.sync.schemas import SyncResponse
+from domains.sync.service.sync_service_impl import SyncServiceImpl
+
+
+async def get_controller(db: DBSession = Depends(get_session)) -> SyncController:
+    """Controller 의존성."""
+    return SyncController(service=SyncServiceImpl(), db=db)
+
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=SyncResponse,
+    summary="증분 동기화",
+    description="since 토큰 이후 변경된 내 기록과 설정만 반환합니다. 첫 동기화는 since 없이 호출합니다.",
+    responses={400: {"description": "since 토큰 형식 오류"}},
+)
+async def get_changes(
+    since: Optional[str] = Query(None, description="직전 응답의 next_token (없으면 처음부터)"),
+    limit: int = Query(500, ge=1, le=1000, description="페이지당 최대 기록 수"),
+    controller: SyncController = Depends(get_controller),
+    # TODO: 인증 후 user_id는 JWT 등에서 추출
+    user_id: int = 1,
+) -> SyncResponse:
+    """has_more가 false가 될 때까지 next_token으로 이어서 호출하고, 마지막 next_token을 보관합니다."""
+    return await controller.get_changes(user_id=user_id, since=since, limit=limit)
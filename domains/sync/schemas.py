@@ -0,0 +1,24 @@
+"""Sync 도메인 응답 스키마."""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from domains.lunch_records.schemas import LunchRecordResponse
+from domains.users.schemas import UserRead
+
+
+class SyncRecord(LunchRecordResponse):
+    """변경된 점심 기록 (마지막 변경 시각 포함)."""
+
+    updated_at: datetime
+
+
+class SyncResponse(BaseModel):
+    """GET /sync 응답. has_more가 true이면 next_token으로 바로 다시 요청한다."""
+
+    records: List[SyncRecord] = Field(..., description="since 이후 변경된 내 기록 (updated_at, id 오름차순)")
+    settings: Optional[UserRead] = Field(None, description="since 이후 변경된 내 설정 (변경 없으면 null)")
+    next_token: str = Field(..., description="다음 동기화에 since로 보낼 토큰")
+    has_more: bool = Field(..., description="이번 페이지 이후 남은 변경이 있는지")
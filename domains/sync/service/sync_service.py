@@ -0,0 +1,19 @@
+"""Sync Service Interface."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from domains.sync.schemas import SyncResponse
+
+
+class InvalidSyncToken(ValueError):
+    """since 토큰 형식 오류."""
+
+
+class SyncServiceInterface(ABC):
+    @abstractmethod
+    def get_changes(self, db: Session, user_id: int, since: Optional[str], limit: int) -> SyncResponse:
+        """since 토큰 이후 변경된 기록·설정 한 페이지. 잘못된 토큰은 InvalidSyncToken."""
+        ...
@@ -0,0 +1,85 @@
+"""Sync Service 구현체 (updated_at 기반 증분 동기화).
+
+토큰 = base64url("기록 updated_at|기록 id|설정 updated_at"): 클라이언트가 마지막으로 받은 지점.
+- 기록: (updated_at, id) > 토큰 지점을 키셋으로 limit개씩 (user_id, updated_at, id) 인덱스로 조회.
+- 설정: users.updated_at > 토큰의 설정 시각이면 포함.
+- 안전 지연: 커밋이 늦은 트랜잭션은 이미 지나간 updated_at으로 나타날 수 있으므로,
+  now - SYNC_SAFETY_LAG_SECONDS 이전에 변경된 행만 돌려준다 (나머지는 다음 동기화에서).
+  대량 적재(record_import)는 이 지연보다 길게 걸리므로 커밋 직전에 적재한 행의 updated_at을 다시 찍는다.
+"""
+
+import base64
+import os
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from core.writes import returning_columns, schema_from_row
+from domains.sync.schemas import SyncRecord, SyncResponse
+from domains.sync.service.sync_service import InvalidSyncToken, SyncServiceInterface
+from domains.users.schemas import UserRead
+from models import LunchRecord, User
+
+SYNC_SAFETY_LAG_SECONDS = float(os.getenv("SYNC_SAFETY_LAG_SECONDS", "5"))
+
+_EPOCH = datetime(1970, 1, 1)
+
+# (기록 updated_at, 기록 id, 설정 updated_at)
+SyncToken = Tuple[datetime, int, datetime]
+
+
+def encode_sync_token(token: SyncToken) -> str:
+    record_ts, record_id, settings_ts = token
+    raw = f"{record_ts.isoformat()}|{record_id}|{settings_ts.isoformat()}"
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_sync_token(value: Optional[str]) -> SyncToken:
+    """빈 토큰은 처음부터."""
+    if not value:
+        return (_EPOCH, 0, _EPOCH)
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode("ascii")
+        record_ts, record_id, settings_ts = raw.split("|")
+        return (datetime.fromisoformat(record_ts), int(record_id), datetime.fromisoformat(settings_ts))
+    except ValueError:
+        raise InvalidSyncToken("since 토큰이 올바르지 않습니다.")
+
+
+class SyncServiceImpl(SyncServiceInterface):
+    def get_changes(self, db: Session, user_id: int, since: Optional[str], limit: int) -> SyncResponse:
+        record_ts, record_id, settings_ts = decode_sync_token(since)
+        horizon = datetime.utcnow() - timedelta(seconds=SYNC_SAFETY_LAG_SECONDS)
+
+        stmt = (
+            select(*returning_columns(LunchRecord, SyncRecord))
+            .where(LunchRecord.user_id == user_id)
+            .where(tuple_(LunchRecord.updated_at, LunchRecord.id) > tuple_(record_ts, record_id))
+            .where(LunchRecord.updated_at <= horizon)
+            .order_by(LunchRecord.updated_at, LunchRecord.id)
+            .limit(limit + 1)
+        )
+        rows = db.execute(stmt).all()
+        records = [schema_from_row(SyncRecord, row) for row in rows[:limit]]
+        if records:
+            record_ts, record_id = records[-1].updated_at, records[-1].id
+
+        settings: Optional[UserRead] = None
+        settings_row = db.execute(
+            select(*returning_columns(User, UserRead), User.updated_at)
+            .where(User.id == user_id)
+            .where(User.updated_at > settings_ts)
+            .where(User.updated_at <= horizon)
+        ).first()
+        if settings_row is not None:
+            settings = schema_from_row(UserRead, settings_row)
+            settings_ts = settings_row.updated_at
+
+        return SyncResponse(
+            records=records,
+            settings=settings,
+            next_token=encode_sync_token((record_ts, record_id, settings_ts)),
+            has_more=len(rows) > limit,
+        )
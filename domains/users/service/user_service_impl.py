@@ -1,7 +1,12 @@
 """Users Service 구현체. DB 세션을 받아 조회/변경한다."""
 
+from datetime import datetime
+
 from sqlalchemy.orm import Session
 
+from core.events import USER_UPDATED, publish
+from core.writes import update_returning
+
 from domains.users.schemas import UserRead, UserResponse, UserUpdate
 from domains.users.service.user_service import UserServiceInterface
 from models import User
@@ -35,24 +40,11 @@ class UserServiceImpl(UserServiceInterface):
         )
 
     def update_settings(self, db: Session, user_id: int, data: UserUpdate) -> UserRead | None:
-        user = db.get(User, user_id)
-        if not user:
+        values = data.model_dump(exclude_none=True)
+        values["updated_at"] = datetime.utcnow()
+        user = update_returning(db, User, User.id == user_id, values, UserRead)
+        if user is None:
             return None
-        if data.nickname is not None:
-            user.nickname = data.nickname
-        if data.is_lunch_alarm_on is not None:
-            user.is_lunch_alarm_on = data.is_lunch_alarm_on
-        if data.is_report_alarm_on is not None:
-            user.is_report_alarm_on = data.is_report_alarm_on
-        db.add(user)
         db.commit()
-        db.refresh(user)
-        return UserRead(
-            id=user.id,
-            kakao_id=user.kakao_id,
-            email=user.email,
-            nickname=user.nickname,
-            profile_image_url=user.profile_image_url,
-            is_lunch_alarm_on=user.is_lunch_alarm_on,
-            is_report_alarm_on=user.is_report_alarm_on,
-        )
+        publish(USER_UPDATED, user_id=user.id)
+        return user
@@ -1,24 +1,70 @@
 """FastAPI 애플리케이션 엔트리포인트. 환경 변수 로딩 후 앱을 시작한다."""
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 
 from config.env import load_env
-from core.database import create_db_and_tables
-from domains.auth.router import router as auth_router
-from domains.community.feed import feed_router, reactions_router
-from domains.lunch_records.router import router as lunch_records_router
-from domains.reports.router import router as reports_router
-from domains.users.router import router as users_router
+
+# DATABASE_URL, DB_MODE 등은 core.database import 시점에 읽으므로 라우터 import 전에 1회 로드
+load_env()
+
+from core.database import create_db_and_tables, dispose_engines  # noqa: E402
+from domains.auth.router import router as auth_router  # noqa: E402
+from domains.auth.service.kakao_client import kakao_http_client  # noqa: E402
+from domains.community.feed import feed_router, reactions_router  # noqa: E402
+from domains.community.live import live_router  # noqa: E402
+from domains.community.service.reaction_buffer import (  # noqa: E402
+    flush_reaction_buffer,
+    is_write_behind,
+    run_reaction_flush_loop,
+)
+from domains.community.service.top_menus import rebuild_top_menus  # noqa: E402
+from domains.community.service.trending import (  # noqa: E402
+    load_trending_scores,
+    persist_trending_scores,
+    run_trending_persist_loop,
+)
+from domains.lunch_records.router import router as lunch_records_router  # noqa: E402
+from domains.metrics.router import router as metrics_router  # noqa: E402
+from domains.reports.router import router as reports_router  # noqa: E402
+from domains.sync.router import router as sync_router  # noqa: E402
+from domains.users.router import router as users_router  # noqa: E402
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """애플리케이션 시작 시 .env를 1회 로드하고, DB 테이블을 생성한다."""
-    load_env()
+    """애플리케이션 시작 시 DB 테이블과 Kakao HTTP 클라이언트를 준비하고, 종료 시 커넥션 풀을 정리한다.
+
+    REACTION_WRITE_MODE=write_behind면 반응 flush 루프를 돌리고, 종료 시 남은 반응을 flush한 뒤 풀을 닫는다.
+    인기 피드 점수는 시작 시 복원하고 주기적으로 저장하며, 종료 시 한 번 더 저장한다.
+    인기 메뉴 스케치는 시작 시 lunch_records에서 다시 만든다.
+    """
     create_db_and_tables()
+    await kakao_http_client.start()
+    await asyncio.to_thread(load_trending_scores)
+    await asyncio.to_thread(rebuild_top_menus)
+    trending_task = asyncio.create_task(run_trending_persist_loop())
+    flush_task = asyncio.create_task(run_reaction_flush_loop()) if is_write_behind() else None
     yield
+    trending_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await trending_task
+    try:
+        if flush_task is not None:
+            flush_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await flush_task
+            # 마지막 flush는 예외를 삼키지 않는다 (유실 가능성을 종료 로그에 남긴다)
+            await asyncio.to_thread(flush_reaction_buffer)
+    finally:
+        # flush나 점수 저장이 실패해도 나머지 종료 처리는 끝까지 한다
+        try:
+            await asyncio.to_thread(persist_trending_scores)
+        finally:
+            await kakao_http_client.aclose()
+            await dispose_engines()
 
 
 app = FastAPI(
@@ -27,14 +73,16 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# 모든 도메인에서 DB 세션은 Depends(get_db)로 주입
-# auth: Kakao OAuth (DB 미사용), 나머지: get_db 사용
+# 모든 도메인에서 DB 세션은 Depends(get_session)으로 주입 (DB_MODE=sync|async)
 app.include_router(auth_router, prefix="/auth", tags=["auth"])
 app.include_router(users_router, prefix="/users", tags=["users"])
 app.include_router(lunch_records_router, prefix="/lunch-records", tags=["lunch-records"])
 app.include_router(reports_router, prefix="/reports", tags=["reports"])
 app.include_router(feed_router, prefix="/community", tags=["community"])
 app.include_router(reactions_router, tags=["community"])
+app.include_router(live_router, prefix="/community", tags=["community"])
+app.include_router(sync_router, prefix="/sync", tags=["sync"])
+app.include_router(metrics_router, prefix="/metrics", tags=["metrics"])
 
 
 if __name__ == "__main__":
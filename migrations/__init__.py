@@ -0,0 +1 @@
+"""DB 마이그레이션 (core.migrations가 실행). 버전 모듈은 migrations/versions/ 에 둔다."""
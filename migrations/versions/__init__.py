@@ -0,0 +1 @@
+"""버전별 마이그레이션 모듈: vNNNN_<설명>.py (VERSION, DESCRIPTION, upgrade(conn))."""
@@ -0,0 +1,35 @@
+"""reactions (lunch_record_id, user_id) 유니크 제약 (1인 1기록당 반응 1건).
+
+중복 행은 가장 최근(id가 큰) 것만 남기고 지운 뒤,
+유니크 인덱스를 CONCURRENTLY로 만들고 그 인덱스로 제약을 붙인다 (테이블 잠금 최소화).
+create_all로 새로 만든 DB에는 이미 제약이 있으므로 건너뛴다.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from core.migrations import constraint_exists
+
+VERSION = 1
+DESCRIPTION = "reactions unique (lunch_record_id, user_id)"
+TRANSACTIONAL = False
+
+_NAME = "uq_reactions_record_user"
+
+
+def upgrade(conn: Connection) -> None:
+    if constraint_exists(conn, _NAME):
+        return
+    conn.execute(
+        text(
+            """
+            DELETE FROM reactions a USING reactions b
+            WHERE a.lunch_record_id = b.lunch_record_id
+              AND a.user_id = b.user_id
+              AND a.id < b.id
+            """
+        )
+    )
+    conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{_NAME}"'))
+    conn.execute(text(f'CREATE UNIQUE INDEX CONCURRENTLY "{_NAME}" ON reactions (lunch_record_id, user_id)'))
+    conn.execute(text(f'ALTER TABLE reactions ADD CONSTRAINT "{_NAME}" UNIQUE USING INDEX "{_NAME}"'))
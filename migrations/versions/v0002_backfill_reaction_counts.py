@@ -0,0 +1,42 @@
+"""reaction_counts 카운터를 reactions에서 채운다 (카운터 도입 이전 데이터).
+
+reaction_type 컬럼 타입은 DB가 어느 시점에 만들어졌는지에 따라 두 테이블이 다를 수 있다.
+- 카운터 도입 이전 DB를 올리면: reactions는 아직 VARCHAR 코드값(v0007에서 변환),
+  reaction_counts는 create_all로 새로 만들어져 SMALLINT → reaction_types로 코드값을 번호로 바꾼다.
+- 그 외(둘 다 VARCHAR 또는 둘 다 SMALLINT)는 그대로 옮긴다.
+코드표에 없는 코드값은 건너뛴다 (v0007에서 지워지는 행).
+
+운영 중 드리프트 점검/복구는 scripts/reconcile_reaction_counts.py 를 사용한다.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from core.migrations import column_data_type
+
+VERSION = 2
+DESCRIPTION = "backfill reaction_counts from reactions"
+
+_SMALLINT = "smallint"
+
+
+def upgrade(conn: Connection) -> None:
+    source = column_data_type(conn, "reactions", "reaction_type")
+    target = column_data_type(conn, "reaction_counts", "reaction_type")
+    if (source == _SMALLINT) == (target == _SMALLINT):
+        select_type, join = "r.reaction_type", ""
+    elif target == _SMALLINT:
+        select_type, join = "t.id", "JOIN reaction_types t ON t.code = r.reaction_type"
+    else:
+        select_type, join = "t.code", "JOIN reaction_types t ON t.id = r.reaction_type"
+    conn.execute(
+        text(
+            f"""
+            INSERT INTO reaction_counts (lunch_record_id, reaction_type, count)
+            SELECT r.lunch_record_id, {select_type}, count(*)
+            FROM reactions r {join}
+            GROUP BY r.lunch_record_id, {select_type}
+            ON CONFLICT (lunch_record_id, reaction_type) DO UPDATE SET count = EXCLUDED.count
+            """
+        )
+    )
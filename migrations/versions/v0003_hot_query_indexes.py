@@ -0,0 +1,33 @@
+"""피드·리포트·myReaction 조회용 복합/커버링 인덱스.
+
+- 피드: WHERE category = ? AND id < ? ORDER BY id DESC
+- 리포트: WHERE user_id = ? AND recorded_at BETWEEN ? AND ? → category / menu_name 집계
+  (INCLUDE로 힙 접근 없이 index-only scan)
+- myReaction: WHERE user_id = ? AND lunch_record_id IN (...)
+"""
+
+from sqlalchemy.engine import Connection
+
+from core.migrations import create_index_concurrently
+
+VERSION = 3
+DESCRIPTION = "feed / report / my_reaction indexes"
+TRANSACTIONAL = False
+
+
+def upgrade(conn: Connection) -> None:
+    create_index_concurrently(
+        conn,
+        "ix_lunch_records_category_id",
+        "ON lunch_records (category, id DESC)",
+    )
+    create_index_concurrently(
+        conn,
+        "ix_lunch_records_user_recorded",
+        "ON lunch_records (user_id, recorded_at) INCLUDE (category, menu_name)",
+    )
+    create_index_concurrently(
+        conn,
+        "ix_reactions_user_record",
+        "ON reactions (user_id, lunch_record_id) INCLUDE (reaction_type)",
+    )
@@ -0,0 +1,55 @@
+"""user_daily_rollup을 기존 lunch_records에서 채운다 (리포트 일자 집계 도입).
+
+마이그레이션은 고정된 시점의 스키마 기준이므로 앱 코드(daily_rollup)를 가져오지 않고 SQL을 그대로 둔다.
+재계산 동안 user_daily_rollup을 EXCLUSIVE로 잠가(조회는 허용) 동시에 생성되는 기록의 증가분이
+덮어써지지 않게 한다. 운영 중 재계산은 scripts/backfill_daily_rollup.py 를 사용한다.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+VERSION = 4
+DESCRIPTION = "backfill user_daily_rollup from lunch_records"
+
+_BACKFILL_SQL = """
+    INSERT INTO user_daily_rollup (user_id, day, total, category_counts, menu_counts, updated_at)
+    SELECT
+        d.user_id,
+        d.day,
+        d.total,
+        coalesce((
+            SELECT jsonb_object_agg(c.category, c.n)
+            FROM (
+                SELECT category, count(*) AS n FROM lunch_records
+                WHERE user_id = d.user_id AND recorded_at = d.day
+                  AND category IS NOT NULL AND category <> ''
+                GROUP BY category
+            ) AS c
+        ), '{}'::jsonb),
+        coalesce((
+            SELECT jsonb_object_agg(m.menu_name, m.n)
+            FROM (
+                SELECT menu_name, count(*) AS n FROM lunch_records
+                WHERE user_id = d.user_id AND recorded_at = d.day
+                  AND menu_name IS NOT NULL AND menu_name <> ''
+                GROUP BY menu_name
+            ) AS m
+        ), '{}'::jsonb),
+        now() AT TIME ZONE 'utc'
+    FROM (
+        SELECT user_id, recorded_at AS day, count(*) AS total
+        FROM lunch_records
+        GROUP BY user_id, recorded_at
+    ) AS d
+    ON CONFLICT (user_id, day) DO UPDATE SET
+        total = EXCLUDED.total,
+        category_counts = EXCLUDED.category_counts,
+        menu_counts = EXCLUDED.menu_counts,
+        updated_at = EXCLUDED.updated_at
+"""
+
+
+def upgrade(conn: Connection) -> None:
+    conn.execute(text("LOCK TABLE user_daily_rollup IN EXCLUSIVE MODE"))
+    conn.execute(text("DELETE FROM user_daily_rollup"))
+    conn.execute(text(_BACKFILL_SQL))
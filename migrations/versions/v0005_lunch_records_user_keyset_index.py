@@ -0,0 +1,21 @@
+"""내 기록 목록 키셋 페이지네이션 인덱스.
+
+- GET /lunch-records: WHERE user_id = ? AND (recorded_at, id) < (?, ?)
+  ORDER BY recorded_at DESC, id DESC LIMIT ? → 인덱스 범위 스캔 (OFFSET 없음)
+"""
+
+from sqlalchemy.engine import Connection
+
+from core.migrations import create_index_concurrently
+
+VERSION = 5
+DESCRIPTION = "lunch_records (user_id, recorded_at DESC, id DESC) index"
+TRANSACTIONAL = False
+
+
+def upgrade(conn: Connection) -> None:
+    create_index_concurrently(
+        conn,
+        "ix_lunch_records_user_recorded_id",
+        "ON lunch_records (user_id, recorded_at DESC, id DESC)",
+    )
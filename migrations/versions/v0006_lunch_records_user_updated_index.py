@@ -0,0 +1,20 @@
+"""증분 동기화 인덱스.
+
+- GET /sync: WHERE user_id = ? AND (updated_at, id) > (?, ?) ORDER BY updated_at, id LIMIT ?
+"""
+
+from sqlalchemy.engine import Connection
+
+from core.migrations import create_index_concurrently
+
+VERSION = 6
+DESCRIPTION = "lunch_records (user_id, updated_at, id) index"
+TRANSACTIONAL = False
+
+
+def upgrade(conn: Connection) -> None:
+    create_index_concurrently(
+        conn,
+        "ix_lunch_records_user_updated_id",
+        "ON lunch_records (user_id, updated_at, id)",
+    )
@@ -0,0 +1,61 @@
+"""reactions / reaction_counts의 reaction_type을 VARCHAR 코드값에서 SMALLINT 번호로 바꾼다.
+
+- 번호는 이 버전 시점의 reaction_types 코드표를 그대로 둔다 (앱 코드를 가져오지 않는다).
+- 허용 코드가 아닌 행은 API에서 보이지 않던 데이터이므로 지운다.
+- ALTER COLUMN TYPE은 테이블을 다시 쓰며 그동안 쓰기가 막힌다 (reactions 크기에 비례).
+  PK·INCLUDE 인덱스(ix_reactions_user_record)는 함께 다시 만들어진다.
+- create_all로 새로 만든 DB는 이미 SMALLINT이므로 외래키 확인만 한다.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from core.migrations import column_data_type, constraint_exists
+
+VERSION = 7
+DESCRIPTION = "reaction_type VARCHAR -> SMALLINT (reaction_types)"
+
+_TABLES = ("reactions", "reaction_counts")
+
+# 마이그레이션은 고정된 시점의 스키마 기준이므로 코드표도 값 그대로 둔다 (core.reactions가 바뀌어도 그대로)
+_CODE_TO_ID = {"like": 1, "love": 2, "yummy": 3}
+
+
+def upgrade(conn: Connection) -> None:
+    conn.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS reaction_types (
+                id SMALLINT PRIMARY KEY,
+                code VARCHAR(20) NOT NULL UNIQUE
+            )
+            """
+        )
+    )
+    for code, rid in _CODE_TO_ID.items():
+        conn.execute(
+            text("INSERT INTO reaction_types (id, code) VALUES (:id, :code) ON CONFLICT DO NOTHING"),
+            {"id": rid, "code": code},
+        )
+
+    cases = " ".join(f"WHEN '{code}' THEN {rid}" for code, rid in _CODE_TO_ID.items())
+    for table in _TABLES:
+        if column_data_type(conn, table, "reaction_type") != "smallint":
+            conn.execute(
+                text(f"DELETE FROM {table} WHERE reaction_type <> ALL(:codes)"),
+                {"codes": list(_CODE_TO_ID)},
+            )
+            conn.execute(
+                text(
+                    f"ALTER TABLE {table} ALTER COLUMN reaction_type TYPE SMALLINT "
+                    f"USING (CASE reaction_type {cases} END)"
+                )
+            )
+        fk = f"{table}_reaction_type_fkey"
+        if not constraint_exists(conn, fk):
+            conn.execute(
+                text(
+                    f'ALTER TABLE {table} ADD CONSTRAINT "{fk}" '
+                    "FOREIGN KEY (reaction_type) REFERENCES reaction_types (id)"
+                )
+            )
@@ -1,7 +1,10 @@
-"""SQLModel 기반 DB 모델. ERD: User, LunchRecord, Reaction."""
+"""SQLModel 기반 DB 모델. ERD: User, LunchRecord, ReactionType, Reaction, ReactionCount, UserDailyRollup, ReportSnapshot, TrendingScore."""
 
-from models.community import Reaction
+from models.community import Reaction, ReactionCount, ReactionType
 from models.lunch_record import LunchRecord
+from models.report_snapshot import ReportSnapshot
+from models.trending_score import TrendingScore
 from models.user import User
+from models.user_daily_rollup import UserDailyRollup
 
-__all__ = ["User", "LunchRecord", "Reaction"]
+__all__ = ["User", "LunchRecord", "ReactionType", "Reaction", "ReactionCount", "UserDailyRollup", "ReportSnapshot", "TrendingScore"]
@@ -1,23 +1,57 @@
-"""Reaction 테이블 (점심 기록에 대한 반응)."""
+"""커뮤니티 반응 테이블: ReactionType(코드표), Reaction, ReactionCount."""
 
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Column, ForeignKey, SmallInteger, UniqueConstraint
 from sqlmodel import Field, SQLModel
 
 
+class ReactionType(SQLModel, table=True):
+    """반응 코드표. core.reactions.REACTION_CODE_TO_ID와 같게 앱 시작 시 채워진다."""
+
+    __tablename__ = "reaction_types"
+
+    id: int = Field(sa_column=Column(SmallInteger, primary_key=True, autoincrement=False))
+    code: str = Field(max_length=20, unique=True, description="코드값: like, love, yummy")
+
+
 class Reaction(SQLModel, table=True):
     """점심 기록에 대한 반응 (좋아요 등).
 
     규격: docs/backlog-001-report-period-and-reactions.md §3
-    - reaction_type: 허용 코드값만 사용 (core.reactions.ALLOWED_REACTION_CODES).
-    - 동일 (lunch_record_id, user_id, reaction_type) 중복 불가 — 업서트/유니크 제약 권장.
+    - reaction_type: reaction_types.id (SMALLINT). API 코드값과의 변환은 core.reactions.
+    - 1인 1기록당 반응 1건: (lunch_record_id, user_id) 유니크 제약으로 강제한다.
     """
 
     __tablename__ = "reactions"
+    __table_args__ = (
+        UniqueConstraint("lunch_record_id", "user_id", name="uq_reactions_record_user"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     lunch_record_id: int = Field(foreign_key="lunch_records.id", index=True)
     user_id: int = Field(foreign_key="users.id", index=True)
-    reaction_type: str = Field(max_length=50, description="코드값: like, love, yummy (Backlog-001)")
+    reaction_type: int = Field(
+        sa_column=Column("reaction_type", SmallInteger, ForeignKey("reaction_types.id"), nullable=False),
+        description="reaction_types.id (1=like, 2=love, 3=yummy)",
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ReactionCount(SQLModel, table=True):
+    """기록별·반응 코드별 반응 수 (reactions의 비정규화 카운터).
+
+    - set_reaction이 reactions 변경과 같은 트랜잭션에서 증감한다.
+    - 피드/반응 응답의 counts는 이 테이블의 PK 조회로 만든다.
+    - 드리프트 점검·복구: scripts/reconcile_reaction_counts.py
+    """
+
+    __tablename__ = "reaction_counts"
+
+    lunch_record_id: int = Field(foreign_key="lunch_records.id", primary_key=True)
+    reaction_type: int = Field(
+        sa_column=Column("reaction_type", SmallInteger, ForeignKey("reaction_types.id"), primary_key=True),
+        description="reaction_types.id",
+    )
+    count: int = Field(default=0, description="해당 코드 반응 수")
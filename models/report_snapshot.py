@@ -0,0 +1,30 @@
+"""ReportSnapshot 테이블 (미리 생성한 지난 기간 리포트)."""
+
+from datetime import date, datetime
+from typing import Any, Dict
+
+from sqlalchemy import Column
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+
+class ReportSnapshot(SQLModel, table=True):
+    """사용자·기간별 리포트 스냅샷.
+
+    - 생성: scripts/generate_report_snapshots.py (리포트 알림 ON 사용자, 지난 기간)
+    - 조회: 지난 기간 리포트 요청 시 라이브 집계 대신 사용 (top_n ≤ 저장된 top_n)
+    - 무효화: 해당 기간에 소급 기록이 생성되면 같은 트랜잭션에서 삭제
+    """
+
+    __tablename__ = "report_snapshots"
+
+    user_id: int = Field(foreign_key="users.id", primary_key=True)
+    period: str = Field(primary_key=True, max_length=10, description="week | month | year")
+    from_date: date = Field(primary_key=True, description="기간 시작일")
+    to_date: date = Field(description="기간 종료일")
+    top_n: int = Field(description="payload의 Top 메뉴 개수")
+    payload: Dict[str, Any] = Field(
+        sa_column=Column(JSONB, nullable=False),
+        description="PeriodReportResponse (by_alias JSON)",
+    )
+    generated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,21 @@
+"""TrendingScore 테이블 (기록별 시간 감쇠 반응 점수)."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+
+class TrendingScore(SQLModel, table=True):
+    """기록별 인기 점수 (forward decay, 로그 공간).
+
+    - 계산·보관: domains/community/service/trending.py (메모리가 원본, 이 테이블은 주기 저장본)
+    - 앱 시작 시 이 테이블에서 메모리 상태를 복원한다 (비어 있으면 reactions에서 재계산)
+    """
+
+    __tablename__ = "trending_scores"
+
+    lunch_record_id: int = Field(foreign_key="lunch_records.id", primary_key=True)
+    category: Optional[str] = Field(default=None, max_length=50, description="기록 카테고리 (피드 필터용)")
+    log_score: float = Field(description="log Σ exp(λ·(반응 시각 - 기준 시각))")
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,34 @@
+"""UserDailyRollup 테이블 (사용자·일자별 점심 기록 집계)."""
+
+from datetime import date, datetime
+from typing import Dict
+
+from sqlalchemy import Column, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+
+class UserDailyRollup(SQLModel, table=True):
+    """사용자별 하루 단위 기록 수·카테고리별 수·메뉴별 수.
+
+    - LunchRecordServiceImpl.create가 기록 생성과 같은 트랜잭션에서 증가시킨다.
+    - 주/월/연 리포트는 이 행(최대 366개)을 합산한다.
+    - 재계산: scripts/backfill_daily_rollup.py
+    """
+
+    __tablename__ = "user_daily_rollup"
+
+    user_id: int = Field(foreign_key="users.id", primary_key=True)
+    day: date = Field(primary_key=True, description="식사일 (LunchRecord.recorded_at)")
+    total: int = Field(default=0, description="해당 일 기록 수")
+    category_counts: Dict[str, int] = Field(
+        default_factory=dict,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'{}'::jsonb")),
+        description="카테고리별 기록 수 (category가 있는 기록만)",
+    )
+    menu_counts: Dict[str, int] = Field(
+        default_factory=dict,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'{}'::jsonb")),
+        description="메뉴명별 기록 수 (menu_name이 있는 기록만)",
+    )
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
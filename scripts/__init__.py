@@ -0,0 +1 @@
+# scripts package (운영용 CLI: python3 -m scripts.<name>)
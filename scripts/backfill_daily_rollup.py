@@ -0,0 +1,28 @@
+"""user_daily_rollup(리포트 일자 집계) 재계산 CLI.
+
+    python3 -m scripts.backfill_daily_rollup                  # 전체 사용자
+    python3 -m scripts.backfill_daily_rollup --user-id 1 2    # 특정 사용자만
+"""
+
+import argparse
+
+from config.env import load_env
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="user_daily_rollup 재계산")
+    parser.add_argument("--user-id", type=int, nargs="*", help="대상 사용자 ID (없으면 전체)")
+    args = parser.parse_args()
+
+    load_env()
+    from core.database import SessionLocal
+    from domains.reports.service.daily_rollup import rebuild_daily_rollup
+
+    with SessionLocal() as db:
+        rows = rebuild_daily_rollup(db, args.user_id or None)
+        db.commit()
+    print(f"rebuilt: {rows} (user, day) rows")
+
+
+if __name__ == "__main__":
+    main()
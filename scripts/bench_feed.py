@@ -0,0 +1,133 @@
+"""피드 조회 벤치마크 CLI: FEED_QUERY_MODE(multi/single) × 공개 페이지 캐시(off/on).
+
+첫 페이지부터 next_cursor를 따라 --pages 페이지를 --rounds번 읽고, 페이지당 지연(ms)과
+tracemalloc 최대 할당량(KiB)을 출력한다. 캐시 on은 첫 round가 캐시를 채우므로 나머지 round가 적중 수치다.
+
+    python3 -m scripts.bench_feed                       # 현재 DB 데이터로 측정
+    python3 -m scripts.bench_feed --seed 20000          # 합성 데이터를 넣고 측정 (개발/테스트 DB에서만)
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from typing import List, Optional, Tuple
+
+from config.env import load_env
+
+_SEED_KAKAO_ID_BASE = 9_000_000_000
+
+
+def _seed(db, records: int, users: int) -> None:
+    from sqlalchemy import text
+
+    from domains.community.service.reaction_counts import rebuild_reaction_counts
+
+    user_ids = [
+        db.execute(
+            text(
+                "INSERT INTO users (kakao_id, nickname, is_lunch_alarm_on, is_report_alarm_on, created_at, updated_at) "
+                "VALUES (:k, :n, true, true, now(), now()) "
+                "ON CONFLICT (kakao_id) DO UPDATE SET updated_at = now() RETURNING id"
+            ),
+            {"k": _SEED_KAKAO_ID_BASE + i, "n": f"bench-{i}"},
+        ).scalar_one()
+        for i in range(users)
+    ]
+    db.execute(
+        text(
+            """
+            INSERT INTO lunch_records (user_id, recorded_at, category, menu_name, content, created_at, updated_at)
+            SELECT (CAST(:users AS INTEGER[]))[1 + g % :n], current_date - (g % 365),
+                   (ARRAY['KOREAN', 'JAPANESE', 'CHINESE', 'WESTERN'])[1 + g % 4],
+                   'menu-' || (g % 200), repeat('memo ', 20), now(), now()
+            FROM generate_series(1, :records) AS g
+            """
+        ).bindparams(users=user_ids, n=users, records=records),
+    )
+    db.commit()
+    db.execute(
+        text(
+            """
+            INSERT INTO reactions (lunch_record_id, user_id, reaction_type, created_at)
+            SELECT r.id, (CAST(:users AS INTEGER[]))[1 + (r.id * k) % :n], t.id, now()
+            FROM (SELECT id FROM lunch_records ORDER BY id DESC LIMIT :records) AS r
+            CROSS JOIN generate_series(1, 3) AS k
+            CROSS JOIN LATERAL (SELECT id FROM reaction_types ORDER BY id LIMIT 1) AS t
+            ON CONFLICT DO NOTHING
+            """
+        ).bindparams(users=user_ids, n=users, records=records),
+    )
+    record_ids = db.execute(
+        text("SELECT id FROM lunch_records ORDER BY id DESC LIMIT :records"), {"records": records}
+    ).scalars().all()
+    rebuild_reaction_counts(db, list(record_ids))
+    db.commit()
+
+
+def _walk(db, pages: int, limit: int, user_id: Optional[int], clear_cache: bool) -> List[Tuple[float, int]]:
+    from domains.community.service.feed_cache import feed_page_cache
+    from domains.community.service.feed_service_impl import FeedServiceImpl
+
+    service = FeedServiceImpl()
+    samples: List[Tuple[float, int]] = []
+    cursor: Optional[str] = None
+    for _ in range(pages):
+        if clear_cache:
+            feed_page_cache.clear()
+        tracemalloc.start()
+        started = time.perf_counter()
+        page = service.get_feed(db, None, limit, cursor, user_id)
+        elapsed = time.perf_counter() - started
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        samples.append((elapsed * 1000, peak))
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="피드 조회 벤치마크")
+    parser.add_argument("--pages", type=int, default=20, help="round마다 읽을 페이지 수")
+    parser.add_argument("--limit", type=int, default=20, help="페이지 크기")
+    parser.add_argument("--rounds", type=int, default=5, help="같은 페이지들을 다시 읽는 횟수")
+    parser.add_argument("--user-id", type=int, help="myReaction을 붙일 사용자 ID (없으면 익명)")
+    parser.add_argument("--seed", type=int, default=0, help="측정 전에 넣을 합성 기록 수")
+    parser.add_argument("--seed-users", type=int, default=200, help="합성 사용자 수")
+    args = parser.parse_args()
+
+    load_env()
+    from core.database import SessionLocal
+    from domains.community.service import feed_service_impl
+    from domains.community.service.feed_cache import feed_page_cache
+
+    with SessionLocal() as db:
+        if args.seed:
+            _seed(db, args.seed, args.seed_users)
+            print(f"seeded: {args.seed} records")
+
+        print(f"{'mode':<8}{'cache':<7}{'pages':>7}{'p50 ms':>9}{'p95 ms':>9}{'mean ms':>9}{'peak KiB':>10}")
+        for mode in ("multi", "single"):
+            feed_service_impl.FEED_QUERY_MODE = mode
+            for cache in ("off", "on"):
+                feed_page_cache.clear()
+                # 커넥션·문장 캐시 워밍업
+                _walk(db, 1, args.limit, args.user_id, clear_cache=True)
+                feed_page_cache.clear()
+                samples: List[Tuple[float, int]] = []
+                for _ in range(args.rounds):
+                    samples += _walk(db, args.pages, args.limit, args.user_id, clear_cache=cache == "off")
+                    db.rollback()
+                latencies = sorted(ms for ms, _peak in samples)
+                p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+                peak_kib = statistics.mean(peak for _ms, peak in samples) / 1024
+                print(
+                    f"{mode:<8}{cache:<7}{len(samples):>7}{statistics.median(latencies):>9.2f}"
+                    f"{p95:>9.2f}{statistics.mean(latencies):>9.2f}{peak_kib:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""쓰기 경로 벤치마크 CLI: commit 후 refresh() vs INSERT/UPDATE ... RETURNING (core.writes).
+
+점심 기록 생성과 사용자 설정 변경을 두 방식으로 --iterations번씩 실행해
+쓰기 1건당 지연(p50/p95/평균 ms)과 DB로 보낸 SQL 문장 수(COMMIT 제외)를 출력한다.
+벤치용 사용자 1명과 그 기록을 만들고 끝나면 지운다 (개발/테스트 DB에서만).
+
+    python3 -m scripts.bench_writes
+    python3 -m scripts.bench_writes --iterations 2000
+"""
+
+import argparse
+import statistics
+import time
+from datetime import date, datetime
+from typing import Callable, List
+
+from config.env import load_env
+
+_BENCH_KAKAO_ID = 9_100_000_000
+
+
+def _measure(write: Callable[[int], None], iterations: int) -> List[float]:
+    samples: List[float] = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        write(i)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="refresh vs RETURNING 쓰기 벤치마크")
+    parser.add_argument("--iterations", type=int, default=500, help="방식별 쓰기 횟수")
+    args = parser.parse_args()
+
+    load_env()
+    from sqlalchemy import delete, event
+
+    from core.database import SessionLocal, engine
+    from core.writes import insert_returning, update_returning
+    from domains.lunch_records.schemas import LunchRecordResponse
+    from domains.users.schemas import UserRead
+    from models import LunchRecord, User
+
+    statements = [0]
+
+    def count(*_args: object) -> None:
+        statements[0] += 1
+
+    with SessionLocal() as db:
+        user = User(kakao_id=_BENCH_KAKAO_ID, nickname="bench-writes")
+        db.add(user)
+        db.commit()
+        user_id = user.id
+
+        def record_refresh(i: int) -> None:
+            now = datetime.utcnow()
+            record = LunchRecord(
+                user_id=user_id,
+                recorded_at=date.today(),
+                menu_name=f"menu-{i}",
+                created_at=now,
+                updated_at=now,
+            )
+            db.add(record)
+            db.commit()
+            db.refresh(record)
+            LunchRecordResponse.model_validate(record, from_attributes=True)
+
+        def record_returning(i: int) -> None:
+            now = datetime.utcnow()
+            insert_returning(
+                db,
+                LunchRecord,
+                {
+                    "user_id": user_id,
+                    "recorded_at": date.today(),
+                    "menu_name": f"menu-{i}",
+                    "created_at": now,
+                    "updated_at": now,
+                },
+                LunchRecordResponse,
+            )
+            db.commit()
+
+        def settings_refresh(i: int) -> None:
+            row = db.get(User, user_id)
+            row.is_lunch_alarm_on = i % 2 == 0
+            row.updated_at = datetime.utcnow()
+            db.commit()
+            db.refresh(row)
+            UserRead.model_validate(row, from_attributes=True)
+
+        def settings_returning(i: int) -> None:
+            update_returning(
+                db,
+                User,
+                User.id == user_id,
+                {"is_lunch_alarm_on": i % 2 == 0, "updated_at": datetime.utcnow()},
+                UserRead,
+            )
+            db.commit()
+
+        cases = [
+            ("record create", "refresh", record_refresh),
+            ("record create", "returning", record_returning),
+            ("user settings", "refresh", settings_refresh),
+            ("user settings", "returning", settings_returning),
+        ]
+        print(f"{'write':<15}{'path':<11}{'p50 ms':>9}{'p95 ms':>9}{'mean ms':>9}{'stmts':>7}")
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            for name, path, write in cases:
+                # 커넥션·문장 캐시 워밍업
+                _measure(write, 10)
+                db.expunge_all()
+                statements[0] = 0
+                samples = sorted(_measure(write, args.iterations))
+                per_write = statements[0] / args.iterations
+                p95 = samples[max(0, int(len(samples) * 0.95) - 1)]
+                print(
+                    f"{name:<15}{path:<11}{statistics.median(samples):>9.3f}"
+                    f"{p95:>9.3f}{statistics.mean(samples):>9.3f}{per_write:>7.1f}"
+                )
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+            db.rollback()
+            db.execute(delete(LunchRecord).where(LunchRecord.user_id == user_id))
+            db.execute(delete(User).where(User.id == user_id))
+            db.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""로그인 부하 테스트용 로컬 Kakao 대역 서버.
+
+    python3 -m scripts.fake_kakao_server --port 9000 --latency-ms 30
+
+앱은 다음 환경 변수로 이 서버를 바라보게 한다:
+
+    KAKAO_AUTH_BASE_URL=http://localhost:9000
+    KAKAO_API_BASE_URL=http://localhost:9000
+    KAKAO_CLIENT_ID=fake KAKAO_CLIENT_SECRET=fake KAKAO_REDIRECT_URI=http://localhost/cb
+
+- POST /oauth/token: 어떤 인가 코드든 액세스 토큰 "fake-<kakao_id>"를 발급한다.
+  코드가 숫자면 그 값을, 아니면 코드의 crc32를 kakao_id로 쓴다 (같은 코드 → 같은 사용자).
+- GET /v2/user/me: 토큰의 kakao_id로 사용자 정보를 돌려준다.
+- --latency-ms로 Kakao 응답 지연을, --error-rate로 5xx 비율을 흉내 낸다 (재시도·서킷 브레이커 확인용).
+"""
+
+import argparse
+import asyncio
+import random
+import zlib
+
+import uvicorn
+from fastapi import FastAPI, Form, Header, HTTPException
+
+app = FastAPI(title="fake kakao")
+_latency_seconds = 0.0
+_error_rate = 0.0
+
+
+async def _simulate() -> None:
+    if _latency_seconds > 0:
+        await asyncio.sleep(_latency_seconds)
+    if _error_rate > 0 and random.random() < _error_rate:
+        raise HTTPException(status_code=503, detail="fake kakao unavailable")
+
+
+@app.post("/oauth/token")
+async def issue_token(code: str = Form(...), grant_type: str = Form("authorization_code")) -> dict:
+    await _simulate()
+    kakao_id = int(code) if code.isdigit() else zlib.crc32(code.encode("utf-8"))
+    return {
+        "access_token": f"fake-{kakao_id}",
+        "token_type": "bearer",
+        "refresh_token": f"fake-refresh-{kakao_id}",
+        "expires_in": 21599,
+    }
+
+
+@app.get("/v2/user/me")
+async def user_me(authorization: str = Header("")) -> dict:
+    await _simulate()
+    token = authorization.removeprefix("Bearer ").strip()
+    if not token.startswith("fake-") or not token[5:].isdigit():
+        raise HTTPException(status_code=401, detail="invalid token")
+    kakao_id = int(token[5:])
+    return {
+        "id": kakao_id,
+        "kakao_account": {
+            "email": f"user{kakao_id}@example.com",
+            "profile": {
+                "nickname": f"user{kakao_id}",
+                "profile_image_url": f"http://localhost/profile/{kakao_id}.png",
+            },
+        },
+    }
+
+
+def main() -> None:
+    global _latency_seconds, _error_rate
+    parser = argparse.ArgumentParser(description="로컬 Kakao 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율 0~1")
+    args = parser.parse_args()
+
+    _latency_seconds = args.latency_ms / 1000
+    _error_rate = args.error_rate
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
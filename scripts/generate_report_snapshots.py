@@ -0,0 +1,127 @@
+"""리포트 알림 사용자의 직전 기간 리포트 스냅샷 일괄 생성 CLI.
+
+    python3 -m scripts.generate_report_snapshots                     # 지난주
+    python3 -m scripts.generate_report_snapshots --period month      # 지난달
+    python3 -m scripts.generate_report_snapshots --workers 8 --chunk-size 1000
+    python3 -m scripts.generate_report_snapshots --force             # 이미 있는 스냅샷도 다시 생성
+
+- is_report_alarm_on 사용자를 id 키셋으로 청크 단위 스트리밍하고, 청크를 프로세스 풀에서 집계한다.
+- 청크마다 커밋하며 기존 스냅샷은 건너뛰므로, 중단 후 다시 실행하면 남은 사용자부터 이어간다.
+- 청크 완료 시마다 누적 처리량(users/sec)을 출력한다.
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from datetime import date
+from typing import List, Set, Tuple
+
+from config.env import load_env
+
+
+def _init_worker() -> None:
+    load_env()
+
+
+def _generate_chunk(
+    user_ids: List[int],
+    period: str,
+    from_date: date,
+    to_date: date,
+    top_n: int,
+    force: bool,
+) -> Tuple[int, int]:
+    """워커: 청크의 사용자별 리포트를 집계해 저장한다. (생성 수, 건너뛴 수)."""
+    from core.database import SessionLocal
+    from domains.reports.service.report_service_impl import ReportServiceImpl
+    from domains.reports.service.report_snapshots import (
+        existing_snapshot_user_ids,
+        save_report_snapshots,
+    )
+
+    service = ReportServiceImpl()
+    with SessionLocal() as db:
+        skip: Set[int] = set() if force else existing_snapshot_user_ids(db, user_ids, period, from_date)
+        reports = [
+            (uid, service.build_period_report(db, uid, period, from_date, to_date, top_n))
+            for uid in user_ids
+            if uid not in skip
+        ]
+        written = save_report_snapshots(db, reports, top_n)
+        db.commit()
+    return written, len(skip)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="리포트 스냅샷 일괄 생성")
+    parser.add_argument("--period", choices=["week", "month", "year"], default="week")
+    parser.add_argument("--date", type=date.fromisoformat, help="기준일 (기본 오늘, 그 직전 기간을 생성)")
+    parser.add_argument("--top-n", type=int, default=5, help="저장할 Top 메뉴 개수 (이하 요청에 사용)")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--force", action="store_true", help="기존 스냅샷도 다시 생성")
+    args = parser.parse_args()
+
+    load_env()
+    from sqlalchemy import select
+
+    from core.database import SessionLocal
+    from core.report_period import today_kst
+    from domains.reports.service.report_snapshots import previous_period_range
+    from models import User
+
+    from_date, to_date = previous_period_range(args.date or today_kst(), args.period)
+    print(f"{args.period} {from_date}~{to_date}, workers={args.workers}, chunk={args.chunk_size}")
+
+    written = skipped = 0
+    started = time.monotonic()
+    # spawn: 부모의 DB 커넥션 풀을 자식이 물려받지 않도록
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=ctx, initializer=_init_worker) as pool:
+        pending: Set[Future] = set()
+
+        def drain(block_until: int) -> None:
+            nonlocal pending, written, skipped
+            while len(pending) > block_until:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    w, s = future.result()
+                    written += w
+                    skipped += s
+                elapsed = time.monotonic() - started
+                rate = (written + skipped) / elapsed if elapsed > 0 else 0.0
+                print(f"written={written} skipped={skipped} {rate:.1f} users/sec")
+
+        last_id = 0
+        with SessionLocal() as db:
+            while True:
+                user_ids = list(
+                    db.execute(
+                        select(User.id)
+                        .where(User.is_report_alarm_on.is_(True))
+                        .where(User.id > last_id)
+                        .order_by(User.id)
+                        .limit(args.chunk_size)
+                    ).scalars()
+                )
+                if not user_ids:
+                    break
+                last_id = user_ids[-1]
+                pending.add(
+                    pool.submit(
+                        _generate_chunk, user_ids, args.period, from_date, to_date, args.top_n, args.force
+                    )
+                )
+                # 제출 대기열을 워커 수의 2배로 제한해 사용자 목록을 메모리에 쌓지 않는다
+                drain(args.workers * 2)
+        drain(0)
+
+    elapsed = time.monotonic() - started
+    rate = (written + skipped) / elapsed if elapsed > 0 else 0.0
+    print(f"done: written={written} skipped={skipped} in {elapsed:.1f}s ({rate:.1f} users/sec)")
+
+
+if __name__ == "__main__":
+    main()
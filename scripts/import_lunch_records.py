@@ -0,0 +1,53 @@
+"""점심 기록 대량 적재 CLI (CSV / NDJSON → COPY).
+
+    python3 -m scripts.import_lunch_records data/lunch_records.csv
+    python3 -m scripts.import_lunch_records data/lunch_records.ndjson --chunk-size 50000
+
+컬럼(키): user_id, recorded_at(YYYY-MM-DD), category, menu_name, content
+전체가 한 트랜잭션이며, 끝나면 영향받은 사용자의 user_daily_rollup을 다시 계산한다.
+"""
+
+import argparse
+import sys
+import time
+
+from config.env import load_env
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="점심 기록 대량 적재")
+    parser.add_argument("path", help="CSV 또는 NDJSON 파일 (- 이면 표준 입력)")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="기본: 확장자로 판단 (.ndjson/.jsonl → ndjson)")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    load_env()
+    from core.database import SessionLocal
+    from domains.lunch_records.service.record_import import detect_format, import_lunch_records
+
+    fmt = args.format or detect_format(args.path)
+    started = time.monotonic()
+
+    def progress(imported: int, rejected: int) -> None:
+        elapsed = time.monotonic() - started
+        rate = imported / elapsed if elapsed > 0 else 0.0
+        print(f"imported={imported} rejected={rejected} {rate:.0f} rows/sec", file=sys.stderr)
+
+    fp = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8", newline="")
+    try:
+        with SessionLocal() as db:
+            result = import_lunch_records(db, fp, fmt, chunk_size=args.chunk_size, on_progress=progress)
+    finally:
+        if fp is not sys.stdin:
+            fp.close()
+
+    for line_no, message in result.errors:
+        print(f"line {line_no}: {message}")
+    print(
+        f"done: imported={result.imported} rejected={result.rejected} "
+        f"users={len(result.user_ids)} in {time.monotonic() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""DB 마이그레이션 CLI.
+
+    python3 -m scripts.migrate            # 없는 테이블 생성 + 미적용 마이그레이션 적용
+    python3 -m scripts.migrate --status   # 적용/미적용 버전 목록만 출력
+"""
+
+import argparse
+
+from config.env import load_env
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DB 마이그레이션 적용/상태 조회")
+    parser.add_argument("--status", action="store_true", help="적용 여부만 출력")
+    args = parser.parse_args()
+
+    load_env()
+    from core.database import create_db_and_tables, engine
+    from core.migrations import applied_versions, load_migrations
+
+    if not args.status:
+        create_db_and_tables()
+
+    with engine.connect() as conn:
+        done = applied_versions(conn)
+        conn.commit()
+    for m in load_migrations():
+        mark = "applied" if m.version in done else "pending"
+        print(f"v{m.version:04d} [{mark}] {m.description}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""reaction_counts 카운터 점검/복구 CLI.
+
+reactions에서 기록별·코드별 반응 수를 다시 집계해 reaction_counts와 비교한다.
+
+    python3 -m scripts.reconcile_reaction_counts          # 드리프트 보고만
+    python3 -m scripts.reconcile_reaction_counts --fix    # 드리프트 난 기록의 카운터 재계산
+"""
+
+import argparse
+
+from config.env import load_env
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="reaction_counts 드리프트 점검/복구")
+    parser.add_argument("--fix", action="store_true", help="드리프트 난 기록의 카운터를 reactions 기준으로 덮어쓴다")
+    parser.add_argument("--batch-size", type=int, default=500, help="복구 시 한 트랜잭션에서 처리할 기록 수")
+    args = parser.parse_args()
+
+    # DATABASE_URL이 .env에 있을 수 있으므로 core.database import 전에 로드
+    load_env()
+    from core.database import SessionLocal
+    from domains.community.service.reaction_counts import (
+        find_reaction_count_drift,
+        rebuild_reaction_counts,
+    )
+
+    with SessionLocal() as db:
+        drifts = find_reaction_count_drift(db)
+        for d in drifts:
+            print(f"rec_{d.lunch_record_id} {d.reaction_type}: stored={d.stored} actual={d.actual}")
+        record_ids = sorted({d.lunch_record_id for d in drifts})
+        print(f"drift: {len(drifts)} rows / {len(record_ids)} records")
+
+        if not args.fix or not record_ids:
+            return
+        for i in range(0, len(record_ids), args.batch_size):
+            rebuild_reaction_counts(db, record_ids[i : i + args.batch_size])
+            db.commit()
+        print(f"fixed: {len(record_ids)} records")
+
+
+if __name__ == "__main__":
+    main()
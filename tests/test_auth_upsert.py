@@ -0,0 +1,73 @@
+"""Kakao 로그인 사용자 upsert: 첫 로그인 폭주에도 행은 하나, 프로필이 그대로면 갱신하지 않는다."""
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from sqlalchemy import text
+
+from core.database import SessionLocal, engine
+from domains.auth.service.kakao_oauth_service_impl import KakaoOAuthServiceImpl
+
+_CALLERS = 24
+_KAKAO_ID = 9_000_000_001
+
+
+def test_parallel_first_logins_create_one_user(db):
+    service = KakaoOAuthServiceImpl()
+    barrier = Barrier(_CALLERS)
+
+    def login(i: int):
+        with SessionLocal() as session:
+            barrier.wait()
+            return service._find_or_create_user(
+                session,
+                kakao_id=_KAKAO_ID,
+                nickname=f"user-{i}",
+                email=None,
+                profile_image_url=None,
+            )
+
+    with ThreadPoolExecutor(max_workers=_CALLERS) as pool:
+        results = list(pool.map(login, range(_CALLERS)))
+
+    assert sum(1 for _user, created in results if created) == 1
+    assert len({user.id for user, _created in results}) == 1
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT count(*) FROM users WHERE kakao_id = :k"), {"k": _KAKAO_ID}
+        ).scalar_one()
+    assert rows == 1
+
+
+
+def test_relogin_with_same_profile_does_not_touch_user(db, monkeypatch):
+    from domains.auth.service import kakao_oauth_service_impl
+
+    service = KakaoOAuthServiceImpl()
+    published = []
+    monkeypatch.setattr(kakao_oauth_service_impl, "publish", lambda event, **payload: published.append(payload))
+
+    def login(nickname: str, email=None):
+        with SessionLocal() as session:
+            return service._find_or_create_user(
+                session, kakao_id=_KAKAO_ID, nickname=nickname, email=email, profile_image_url=None
+            )
+
+    def updated_at():
+        with engine.connect() as conn:
+            return conn.execute(
+                text("SELECT updated_at FROM users WHERE kakao_id = :k"), {"k": _KAKAO_ID}
+            ).scalar_one()
+
+    user, created = login("momo", "momo@example.com")
+    assert created
+    stamped = updated_at()
+
+    # 같은 프로필(또는 Kakao가 비운 항목)로 다시 로그인하면 행도 이벤트도 그대로
+    again, created = login("momo")
+    assert not created and again == user
+    assert updated_at() == stamped and published == []
+
+    changed, created = login("momo2")
+    assert not created and changed.nickname == "momo2"
+    assert updated_at() > stamped and published == [{"user_id": user.id}]
@@ -0,0 +1,37 @@
+"""GET /community/feed 조건부 요청: ETag가 같으면 페이지 쿼리 없이 304, 반응이 바뀌면 새 ETag."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from domains.community.feed import feed_router, reactions_router
+from domains.community.service.feed_service_impl import FeedServiceImpl
+
+app = FastAPI()
+app.include_router(feed_router, prefix="/community")
+app.include_router(reactions_router)
+
+
+def test_feed_etag_short_circuits_before_query(db, make_user, make_record, monkeypatch):
+    record_id = make_record(make_user(1))
+    with TestClient(app) as client:
+        first = client.get("/community/feed")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("304이면 피드를 조회하지 않아야 한다")
+
+        with monkeypatch.context() as m:
+            m.setattr(FeedServiceImpl, "get_feed", fail)
+            cached = client.get("/community/feed", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+
+        # 다른 요청 키는 다른 ETag
+        assert client.get("/community/feed", params={"limit": 5}).headers["ETag"] != etag
+
+        assert client.post(f"/records/{record_id}/reactions", json={"reaction": "like"}).status_code == 200
+        changed = client.get("/community/feed", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json()["items"][0]["myReaction"] == "like"
@@ -0,0 +1,54 @@
+"""Kakao HTTP 클라이언트 서킷 브레이커: half-open 시험 호출이 어떻게 끝나든 슬롯이 풀려야 한다."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from domains.auth.service.kakao_client import CircuitBreaker, KakaoHttpClient
+
+
+def _half_open_client(handler) -> KakaoHttpClient:
+    client = KakaoHttpClient()
+    client.breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+    client.breaker.record_failure()  # 열림 → reset 0초라 바로 half-open
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_decoding_error_counts_as_failure_and_frees_trial():
+    def handler(request):
+        raise httpx.DecodingError("bad body", request=request)
+
+    client = _half_open_client(handler)
+    with pytest.raises(httpx.DecodingError):
+        asyncio.run(client.request("POST", "https://kauth.test/oauth/token"))
+    assert client.breaker._trial_in_flight is False
+    # 다음 시험 호출이 다시 허용된다
+    assert client.breaker.allow() is True
+
+
+def test_cancelled_trial_is_released_without_failure():
+    async def handler(request):
+        await asyncio.sleep(10)
+        return httpx.Response(200)
+
+    client = _half_open_client(handler)
+
+    async def run():
+        task = asyncio.create_task(client.request("GET", "https://kapi.test/v2/user/me"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert client.breaker._trial_in_flight is False
+    assert client.breaker.allow() is True
+
+
+def test_success_closes_half_open_breaker():
+    client = _half_open_client(lambda request: httpx.Response(200, json={}))
+    response = asyncio.run(client.request("GET", "https://kapi.test/v2/user/me"))
+    assert response.status_code == 200
+    assert client.breaker.state == "closed"
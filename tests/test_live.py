@@ -0,0 +1,24 @@
+"""WS /community/live: 잘못된 입력에는 error 프레임으로 답하고 연결은 유지한다."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from domains.community.live import live_router
+
+app = FastAPI()
+app.include_router(live_router, prefix="/community")
+
+
+def test_invalid_frames_get_error_and_connection_stays_open():
+    with TestClient(app) as client, client.websocket_connect("/community/live") as ws:
+        ws.send_text("not json")
+        assert ws.receive_json()["type"] == "error"
+
+        ws.send_bytes(b"\x00\x01")
+        assert ws.receive_json()["type"] == "error"
+
+        ws.send_json({"type": "hello"})
+        assert ws.receive_json()["type"] == "error"
+
+        ws.send_json({"type": "subscribe", "recordIds": ["rec_2", "1"]})
+        assert ws.receive_json() == {"type": "subscribed", "recordIds": ["rec_1", "rec_2"]}
@@ -0,0 +1,70 @@
+"""점심 기록 서비스 단위 테스트."""
+
+from datetime import date
+
+import pytest
+
+from domains.lunch_records.service.lunch_record_service import InvalidRecordCursor
+from domains.lunch_records.service.lunch_record_service_impl import (
+    decode_record_cursor,
+    encode_record_cursor,
+)
+
+
+def test_record_cursor_round_trip():
+    assert decode_record_cursor(encode_record_cursor(date(2026, 1, 2), 42)) == (date(2026, 1, 2), 42)
+
+
+@pytest.mark.parametrize("cursor", ["garbage", "2026-01-02", "2026-13-01_1", "2026-01-02_x"])
+def test_invalid_record_cursor(cursor):
+    with pytest.raises(InvalidRecordCursor):
+        decode_record_cursor(cursor)
+
+
+def test_bulk_items_are_validated_per_index():
+    from domains.lunch_records.service.lunch_record_service_impl import LunchRecordServiceImpl
+
+    result = LunchRecordServiceImpl().create_bulk(
+        None,
+        user_id=1,
+        items=[{"recorded_at": "not-a-date"}, "oops", {"recorded_at": "2026-01-02", "menu_name": "x" * 201}],
+    )
+    assert result.created == 0
+    assert result.ids == [None, None, None]
+    assert [e.index for e in result.errors] == [0, 1, 2]
+    assert result.errors[0].errors[0].startswith("recorded_at:")
+    assert result.errors[1].errors[0].startswith("item:")
+    assert result.errors[2].errors[0].startswith("menu_name:")
+
+
+def test_bulk_items_documented_as_lunch_record_create():
+    from domains.lunch_records.schemas import LunchRecordBulkCreate
+
+    items = LunchRecordBulkCreate.model_json_schema()["properties"]["items"]["items"]
+    assert items["title"] == "LunchRecordCreate"
+    assert "recorded_at" in items["required"]
+
+
+def test_import_keeps_backslash_n_and_special_characters(db, make_user):
+    import io
+    import json
+
+    from sqlalchemy import select
+
+    from core.database import SessionLocal
+    from domains.lunch_records.service.record_import import import_lunch_records
+    from models import LunchRecord
+
+    user_id = make_user(1)
+    contents = ["\\N", 'say "hi", ok', "line1\nline2", "C:\\temp\\new", None]
+    ndjson = "".join(
+        '{"user_id": %d, "recorded_at": "2026-01-02", "content": %s}\n'
+        % (user_id, "null" if c is None else json.dumps(c))
+        for c in contents
+    )
+    with SessionLocal() as session:
+        result = import_lunch_records(session, io.StringIO(ndjson), "ndjson")
+    assert result.imported == len(contents)
+    with SessionLocal() as session:
+        stored = session.execute(select(LunchRecord.content).order_by(LunchRecord.id)).scalars().all()
+    assert stored == contents
@@ -0,0 +1,118 @@
+"""마이그레이션: 마이그레이션 도입 이전(baseline) 스키마 DB를 최신으로 올린다."""
+
+from sqlalchemy import text
+
+from core.database import create_db_and_tables, engine
+from core.migrations import column_data_type, load_migrations
+
+# 마이그레이션 도입 이전 스키마 (reactions.reaction_type이 VARCHAR 코드값, 카운터/집계 테이블 없음)
+_BASELINE_DDL = """
+CREATE TABLE users (
+    id SERIAL PRIMARY KEY,
+    kakao_id BIGINT NOT NULL UNIQUE,
+    email VARCHAR(255),
+    nickname VARCHAR(100),
+    profile_image_url VARCHAR(512),
+    is_lunch_alarm_on BOOLEAN NOT NULL,
+    is_report_alarm_on BOOLEAN NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
+CREATE TABLE lunch_records (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    recorded_at DATE NOT NULL,
+    category VARCHAR(50),
+    menu_name VARCHAR(200),
+    content VARCHAR(2000),
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
+CREATE TABLE reactions (
+    id SERIAL PRIMARY KEY,
+    lunch_record_id INTEGER NOT NULL REFERENCES lunch_records (id),
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    reaction_type VARCHAR(50) NOT NULL,
+    created_at TIMESTAMP NOT NULL
+);
+"""
+
+
+def _seed_baseline(conn) -> dict:
+    user_ids = [
+        conn.execute(
+            text(
+                "INSERT INTO users (kakao_id, is_lunch_alarm_on, is_report_alarm_on, created_at, updated_at) "
+                "VALUES (:k, true, true, now(), now()) RETURNING id"
+            ),
+            {"k": 1000 + i},
+        ).scalar_one()
+        for i in range(4)
+    ]
+    record_id = conn.execute(
+        text(
+            "INSERT INTO lunch_records (user_id, recorded_at, category, menu_name, created_at, updated_at) "
+            "VALUES (:u, current_date, 'KOREAN', '비빔밥', now(), now()) RETURNING id"
+        ),
+        {"u": user_ids[0]},
+    ).scalar_one()
+    rows = [
+        (user_ids[0], "like"),
+        (user_ids[0], "yummy"),  # 같은 사용자 중복 → v0001이 최신 것만 남긴다
+        (user_ids[1], "like"),
+        (user_ids[2], "love"),
+        (user_ids[3], "bogus"),  # 허용되지 않은 코드 → v0007이 지운다
+    ]
+    for user_id, code in rows:
+        conn.execute(
+            text(
+                "INSERT INTO reactions (lunch_record_id, user_id, reaction_type, created_at) "
+                "VALUES (:r, :u, :t, now())"
+            ),
+            {"r": record_id, "u": user_id, "t": code},
+        )
+    return {"record_id": record_id}
+
+
+def test_upgrade_baseline_schema_to_head(empty_db):
+    with engine.begin() as conn:
+        conn.execute(text(_BASELINE_DDL))
+        seeded = _seed_baseline(conn)
+
+    create_db_and_tables()
+
+    with engine.connect() as conn:
+        applied = {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+        assert applied == {m.version for m in load_migrations()}
+        assert column_data_type(conn, "reactions", "reaction_type") == "smallint"
+        assert column_data_type(conn, "reaction_counts", "reaction_type") == "smallint"
+
+        reactions = conn.execute(
+            text(
+                "SELECT t.code, count(*) FROM reactions r JOIN reaction_types t ON t.id = r.reaction_type "
+                "WHERE r.lunch_record_id = :r GROUP BY t.code"
+            ),
+            {"r": seeded["record_id"]},
+        ).all()
+        assert dict(reactions) == {"yummy": 1, "like": 1, "love": 1}
+
+        counts = conn.execute(
+            text(
+                "SELECT t.code, c.count FROM reaction_counts c JOIN reaction_types t ON t.id = c.reaction_type "
+                "WHERE c.lunch_record_id = :r AND c.count > 0"
+            ),
+            {"r": seeded["record_id"]},
+        ).all()
+        assert dict(counts) == {"yummy": 1, "like": 1, "love": 1}
+
+        rollup = conn.execute(text("SELECT sum(total) FROM user_daily_rollup")).scalar_one()
+        assert rollup == 1
+
+
+def test_fresh_database_is_idempotent(empty_db):
+    create_db_and_tables()
+    # 두 번째 시작은 적용할 마이그레이션이 없어야 한다
+    create_db_and_tables()
+    with engine.connect() as conn:
+        applied = conn.execute(text("SELECT count(*) FROM schema_migrations")).scalar_one()
+    assert applied == len(load_migrations())
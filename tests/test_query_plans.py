@@ -0,0 +1,140 @@
+"""핫 쿼리 실행 계획: 피드·리포트·myReaction 조회가 마이그레이션 인덱스와 일자 집계를 쓰는지 EXPLAIN으로 확인한다.
+
+작은 테스트 테이블에서는 플래너가 순차 스캔을 고르므로 enable_seqscan=off로
+"이 인덱스가 쿼리 형태에 맞는가"를 본다 (맞지 않으면 순차 스캔이 그대로 남는다).
+"""
+
+from datetime import date, timedelta
+from typing import Callable, List, Set
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from core.database import SessionLocal, engine
+from domains.community.service.feed_service_impl import FeedServiceImpl, _feed_page_statement
+from domains.reports.service.daily_rollup import rebuild_daily_rollup, sum_daily_rollup
+from domains.reports.service.report_service_impl import ReportServiceImpl
+
+
+def _seed(conn) -> int:
+    user_ids = [
+        conn.execute(
+            text(
+                "INSERT INTO users (kakao_id, is_lunch_alarm_on, is_report_alarm_on, created_at, updated_at) "
+                "VALUES (:k, true, true, now(), now()) RETURNING id"
+            ),
+            {"k": 7000 + i},
+        ).scalar_one()
+        for i in range(200)
+    ]
+    conn.execute(
+        text(
+            """
+            INSERT INTO lunch_records (user_id, recorded_at, category, menu_name, created_at, updated_at)
+            SELECT (CAST(:users AS INTEGER[]))[1 + g % 200], current_date - (g % 3000),
+                   CASE WHEN g % 100 = 0 THEN 'THAI'
+                        ELSE (ARRAY['KOREAN', 'JAPANESE', 'CHINESE'])[1 + g % 3] END,
+                   'menu-' || (g % 50), now(), now()
+            FROM generate_series(1, 20000) AS g
+            """
+        ).bindparams(users=user_ids),
+    )
+    conn.execute(
+        text(
+            """
+            INSERT INTO reactions (lunch_record_id, user_id, reaction_type, created_at)
+            SELECT r.id, (CAST(:users AS INTEGER[]))[1 + (r.id * k) % 200], 1, now()
+            FROM (SELECT id FROM lunch_records ORDER BY id DESC LIMIT 5000) AS r
+            CROSS JOIN generate_series(1, 3) AS k
+            ON CONFLICT DO NOTHING
+            """
+        ).bindparams(users=user_ids),
+    )
+    return user_ids[0]
+
+
+def _index_names(plan: dict) -> Set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", ()):
+        names |= _index_names(child)
+    return names
+
+
+def _plans_of(fn: Callable[[Session], object]) -> List[dict]:
+    """fn이 실행한 SELECT를 잡아 같은 파라미터로 EXPLAIN한다."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with SessionLocal() as db:
+            fn(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.execute("SET enable_seqscan = off")
+        plans = []
+        for statement, parameters in captured:
+            cursor.execute("EXPLAIN (FORMAT JSON) " + statement, parameters)
+            plans.append(cursor.fetchone()[0][0]["Plan"])
+        return plans
+    finally:
+        raw.rollback()
+        raw.close()
+
+
+def _all_indexes(plans: List[dict]) -> Set[str]:
+    names: Set[str] = set()
+    for plan in plans:
+        names |= _index_names(plan)
+    return names
+
+
+def _prepare(seed_conn_fn) -> int:
+    with engine.begin() as conn:
+        user_id = seed_conn_fn(conn)
+    with SessionLocal() as db:
+        rebuild_daily_rollup(db)
+        db.commit()
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        # 가시성 맵까지 채워야 INCLUDE 인덱스의 index-only scan이 비용에 반영된다
+        conn.execute(text("VACUUM ANALYZE"))
+    return user_id
+
+
+def test_category_feed_uses_category_id_index(db):
+    user_id = _prepare(_seed)
+    plans = _plans_of(lambda s: s.execute(_feed_page_statement("THAI", None, 20, user_id)).all())
+    indexes = _all_indexes(plans)
+    assert "ix_lunch_records_category_id" in indexes
+    # myReaction 상관 서브쿼리는 (record, user) / (user, record) 인덱스 중 하나로 한 행 조회
+    assert indexes & {"uq_reactions_record_user", "ix_reactions_user_record"}
+
+
+def test_my_reactions_lookup_uses_user_record_index(db):
+    user_id = _prepare(_seed)
+    with SessionLocal() as s:
+        record_ids = [r[0] for r in s.execute(text("SELECT id FROM lunch_records ORDER BY id DESC LIMIT 20"))]
+    plans = _plans_of(lambda s: FeedServiceImpl()._load_my_reactions(s, record_ids, user_id))
+    assert _all_indexes(plans) & {"ix_reactions_user_record", "uq_reactions_record_user"}
+
+
+def test_period_report_reads_daily_rollup_by_primary_key(db):
+    user_id = _prepare(_seed)
+    today = date.today()
+    plans = _plans_of(lambda s: sum_daily_rollup(s, user_id, today - timedelta(days=365), today))
+    assert "user_daily_rollup_pkey" in _all_indexes(plans)
+
+
+def test_trend_report_uses_user_recorded_index(db):
+    user_id = _prepare(_seed)
+    plans = _plans_of(
+        lambda s: ReportServiceImpl().get_trend_report(s, user_id, "month", date.today(), 12)
+    )
+    assert _all_indexes(plans) & {"ix_lunch_records_user_recorded", "ix_lunch_records_user_recorded_id"}
@@ -0,0 +1,67 @@
+"""write-behind 반응 버퍼 flush."""
+
+import time
+from datetime import datetime
+
+from sqlalchemy import delete, select
+
+from core.database import SessionLocal
+from domains.community.service.reaction_buffer import ReactionBuffer
+from models import LunchRecord
+from models.community import Reaction
+
+
+def _created_at(record_id: int, user_id: int) -> datetime:
+    with SessionLocal() as session:
+        return session.execute(
+            select(Reaction.created_at)
+            .where(Reaction.lunch_record_id == record_id)
+            .where(Reaction.user_id == user_id)
+        ).scalar_one()
+
+
+def test_flush_writes_toggle_time_as_created_at(db, make_user, make_record):
+    user_id = make_user(1)
+    record_id = make_record(user_id)
+    buffer = ReactionBuffer()
+
+    before = datetime.utcnow()
+    with SessionLocal() as session:
+        assert buffer.toggle(session, record_id, user_id, "like").result == "set"
+    toggled = datetime.utcnow()
+    time.sleep(0.3)
+    with SessionLocal() as session:
+        assert buffer.flush(session) == 1
+    assert before <= _created_at(record_id, user_id) <= toggled
+
+    # 코드만 바꾸면 원래 시각을 유지한다
+    original = _created_at(record_id, user_id)
+    with SessionLocal() as session:
+        assert buffer.toggle(session, record_id, user_id, "love").result == "updated"
+        buffer.flush(session)
+    assert _created_at(record_id, user_id) == original
+
+
+def test_flush_drops_changes_for_deleted_record(db, make_user, make_record):
+    user_id = make_user(1)
+    kept_id = make_record(user_id)
+    deleted_id = make_record(user_id)
+    buffer = ReactionBuffer()
+
+    with SessionLocal() as session:
+        buffer.toggle(session, kept_id, user_id, "like")
+        buffer.toggle(session, deleted_id, user_id, "like")
+    with SessionLocal() as session:
+        session.execute(delete(LunchRecord).where(LunchRecord.id == deleted_id))
+        session.commit()
+
+    # 지워진 기록의 변경만 버리고 나머지는 반영한다
+    with SessionLocal() as session:
+        assert buffer.flush(session) == 1
+    _created_at(kept_id, user_id)
+
+    # 다음 flush도 막히지 않는다
+    with SessionLocal() as session:
+        assert buffer.flush(session) == 0
+        buffer.toggle(session, kept_id, user_id, "love")
+        assert buffer.flush(session) == 1
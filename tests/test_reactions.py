@@ -0,0 +1,98 @@
+"""반응 카운터: 동시 토글에도 카운터와 유니크 제약이 맞고, 드리프트로 음수가 되면 0으로 맞추고 경고한다."""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from core.database import SessionLocal, engine
+from core.reactions import ALLOWED_REACTION_CODES
+from domains.community.service.feed_service_impl import FeedServiceImpl
+
+_THREADS = 16
+_TOGGLES_PER_THREAD = 40
+# 사용자 수를 스레드 수보다 적게 두어 같은 (기록, 사용자)에 동시 요청이 겹치게 한다
+_USERS = 6
+
+
+def _hammer(record_id: int, user_ids: list, seed: int) -> dict:
+    rnd = random.Random(seed)
+    service = FeedServiceImpl()
+    outcome = {"ok": 0, "conflict": 0}
+    for _ in range(_TOGGLES_PER_THREAD):
+        with SessionLocal() as db:
+            try:
+                service.set_reaction(
+                    db,
+                    record_id=record_id,
+                    user_id=rnd.choice(user_ids),
+                    reaction=rnd.choice(ALLOWED_REACTION_CODES),
+                )
+                outcome["ok"] += 1
+            except HTTPException as exc:
+                # 재시도 한도를 넘긴 경합은 409로 끝나야 한다 (500/유니크 위반이 아니라)
+                assert exc.status_code == 409
+                outcome["conflict"] += 1
+    return outcome
+
+
+def test_concurrent_toggles_keep_counts_and_uniqueness(db, make_user, make_record):
+    user_ids = [make_user(kakao_id=5000 + i) for i in range(_USERS)]
+    record_id = make_record(user_ids[0])
+
+    with ThreadPoolExecutor(max_workers=_THREADS) as pool:
+        results = list(pool.map(lambda seed: _hammer(record_id, user_ids, seed), range(_THREADS)))
+    assert sum(r["ok"] for r in results) > 0
+
+    with engine.connect() as conn:
+        duplicates = conn.execute(
+            text(
+                "SELECT user_id FROM reactions WHERE lunch_record_id = :r "
+                "GROUP BY user_id HAVING count(*) > 1"
+            ),
+            {"r": record_id},
+        ).all()
+        assert duplicates == []
+
+        actual = dict(
+            conn.execute(
+                text(
+                    "SELECT reaction_type, count(*) FROM reactions WHERE lunch_record_id = :r "
+                    "GROUP BY reaction_type"
+                ),
+                {"r": record_id},
+            ).all()
+        )
+        stored = dict(
+            conn.execute(
+                text("SELECT reaction_type, count FROM reaction_counts WHERE lunch_record_id = :r"),
+                {"r": record_id},
+            ).all()
+        )
+    for type_id in set(actual) | set(stored):
+        assert stored.get(type_id, 0) == actual.get(type_id, 0), type_id
+
+
+def test_negative_delta_is_clamped_and_logged(db, make_user, make_record, caplog):
+    from domains.community.service.reaction_counts import apply_reaction_count_deltas
+
+    record_id = make_record(make_user(1))
+    code, other = ALLOWED_REACTION_CODES[0], ALLOWED_REACTION_CODES[1]
+    with SessionLocal() as session:
+        # 카운터 행이 없는 기록에 감소 (insert 분기)
+        counts = apply_reaction_count_deltas(session, record_id, {code: -1})
+        assert counts[code] == 0
+        counts = apply_reaction_count_deltas(session, record_id, {other: 1})
+        # 기존 행에서 0 아래로 감소 (update 분기)
+        counts = apply_reaction_count_deltas(session, record_id, {other: -2})
+        assert counts[other] == 0
+        session.commit()
+
+    with engine.connect() as conn:
+        stored = conn.execute(
+            text("SELECT min(count) FROM reaction_counts WHERE lunch_record_id = :rid"), {"rid": record_id}
+        ).scalar_one()
+    assert stored == 0
+    drift_logs = [r for r in caplog.records if "reaction_counts drift" in r.getMessage()]
+    assert len(drift_logs) == 2
@@ -0,0 +1,61 @@
+"""GET /sync 토큰과 증분 동기화."""
+
+from datetime import datetime
+
+import pytest
+
+from domains.sync.service.sync_service import InvalidSyncToken
+from domains.sync.service.sync_service_impl import decode_sync_token, encode_sync_token
+
+
+def test_sync_token_round_trip():
+    token = (datetime(2026, 1, 2, 3, 4, 5, 678), 42, datetime(2026, 1, 1))
+    assert decode_sync_token(encode_sync_token(token)) == token
+
+
+@pytest.mark.parametrize("value", ["!!!", "bm90LWEtdG9rZW4", "YXxifGM"])
+def test_invalid_sync_token(value):
+    with pytest.raises(InvalidSyncToken):
+        decode_sync_token(value)
+
+
+def test_imported_rows_reach_clients_that_synced_during_import(db, make_user, monkeypatch):
+    import io
+    import time
+
+    from core.database import SessionLocal
+    from domains.lunch_records.service import record_import
+    from domains.sync.service import sync_service_impl
+    from domains.sync.service.sync_service_impl import SyncServiceImpl
+
+    user_id = make_user(1)
+    service = SyncServiceImpl()
+    tokens = []
+
+    def sync_during_import(_imported, _rejected):
+        # 적재가 커밋되기 전에 다른 기록이 생기고, 안전 지연이 지난 뒤 클라이언트가 동기화해 토큰이 앞서 나간다
+        from datetime import date
+
+        from domains.lunch_records.schemas import LunchRecordCreate
+        from domains.lunch_records.service.lunch_record_service_impl import LunchRecordServiceImpl
+
+        with SessionLocal() as session:
+            LunchRecordServiceImpl().create(session, user_id, LunchRecordCreate(recorded_at=date(2026, 1, 3)))
+        time.sleep(0.3)
+        with SessionLocal() as session:
+            tokens.append(service.get_changes(session, user_id, None, 100).next_token)
+        time.sleep(0.3)
+
+    ndjson = "".join(
+        '{"user_id": %d, "recorded_at": "2026-01-0%d", "menu_name": "m"}\n' % (user_id, day) for day in (1, 2)
+    )
+    monkeypatch.setattr(sync_service_impl, "SYNC_SAFETY_LAG_SECONDS", 0.2)
+    with SessionLocal() as session:
+        result = record_import.import_lunch_records(
+            session, io.StringIO(ndjson), "ndjson", on_progress=sync_during_import
+        )
+    assert result.imported == 2
+    time.sleep(0.3)
+    with SessionLocal() as session:
+        changes = service.get_changes(session, user_id, tokens[0], 100)
+    assert sorted(r.recorded_at.day for r in changes.records) == [1, 2]
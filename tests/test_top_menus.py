@@ -0,0 +1,86 @@
+"""인기 메뉴 스케치 재구축: 요청 경로를 막지 않고, 재구축 중 생성된 기록을 잃지 않는지 검증."""
+
+import threading
+
+from core.events import LUNCH_RECORDS_IMPORTED, publish
+from domains.community.service import top_menus
+
+
+def test_import_event_rebuilds_in_background(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    done = threading.Semaphore(0)
+    calls = []
+
+    def fake_rebuild() -> int:
+        calls.append(threading.current_thread().name)
+        started.set()
+        release.wait(5)
+        done.release()
+        return 0
+
+    monkeypatch.setattr(top_menus, "rebuild_top_menus", fake_rebuild)
+
+    publish(LUNCH_RECORDS_IMPORTED, user_ids=[1])
+    assert started.wait(5)
+    # 실행 중에 들어온 요청들은 한 번으로 합쳐진다
+    publish(LUNCH_RECORDS_IMPORTED, user_ids=[2])
+    publish(LUNCH_RECORDS_IMPORTED, user_ids=[3])
+    release.set()
+    assert done.acquire(timeout=5) and done.acquire(timeout=5)
+    assert not done.acquire(timeout=0.2)
+    assert calls == ["top-menus-rebuild", "top-menus-rebuild"]
+
+
+def _menu_count(sketches: top_menus.TopMenuSketches, menu_name: str) -> int:
+    _start, _end, sketch = sketches.get("week", None)
+    return next((h.count for h in sketch.top(100) if h.item == menu_name), 0)
+
+
+def test_rebuild_keeps_records_created_during_scan(db, make_user):
+    from sqlalchemy import event, text
+
+    from core.database import SessionLocal, engine
+    from core.report_period import today_kst
+
+    user_id = make_user(1)
+    today = today_kst()
+    sketches = top_menus.TopMenuSketches(100)
+
+    def create(menu_name: str) -> None:
+        with engine.begin() as conn:
+            record_id = conn.execute(
+                text(
+                    "INSERT INTO lunch_records (user_id, recorded_at, category, menu_name, created_at, updated_at) "
+                    "VALUES (:user_id, :day, 'KOREAN', :menu_name, now(), now()) RETURNING id"
+                ),
+                {"user_id": user_id, "day": today, "menu_name": menu_name},
+            ).scalar_one()
+        sketches.record(today, "KOREAN", menu_name, record_id)
+
+    created = []
+
+    def before(conn, cursor, statement, *args):
+        # 집계 직전에 커밋된 기록: 스냅샷에 보이므로 다시 더하면 안 된다
+        if "GROUP BY" in statement and not created:
+            created.append("before")
+            create("비빔밥")
+
+    def after(conn, cursor, statement, *args):
+        # 집계 뒤에 커밋된 기록: 스냅샷에 없으므로 교체 전에 더해야 한다
+        if "GROUP BY" in statement and created == ["before"]:
+            created.append("after")
+            create("냉면")
+
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
+    try:
+        with SessionLocal() as session:
+            sketches.rebuild(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", before)
+        event.remove(engine, "after_cursor_execute", after)
+
+    assert created == ["before", "after"]
+    assert _menu_count(sketches, "비빔밥") == 1
+    assert _menu_count(sketches, "냉면") == 1
@@ -0,0 +1,125 @@
+"""여러 워커가 trending_scores에 점수를 저장할 때 서로 덮어쓰지 않는지 검증."""
+
+import math
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from domains.community.service.trending import TrendingTracker, reaction_log_weight
+
+
+def _stored_score(record_id: int) -> float:
+    from core.database import SessionLocal
+    from models import TrendingScore
+
+    with SessionLocal() as session:
+        return session.execute(
+            select(TrendingScore.log_score).where(TrendingScore.lunch_record_id == record_id)
+        ).scalar_one()
+
+
+def test_workers_persist_increments(db, make_user, make_record):
+    from core.database import SessionLocal
+
+    record_id = make_record(make_user(1))
+    at = datetime.utcnow()
+    weight = reaction_log_weight(at)
+    worker_a, worker_b = TrendingTracker(), TrendingTracker()
+
+    worker_a.add(record_id, at)
+    worker_b.add(record_id, at)
+    worker_b.add(record_id, at)
+    with SessionLocal() as session:
+        worker_a.persist(session)
+    with SessionLocal() as session:
+        worker_b.persist(session)
+
+    # 워커 A 1건 + 워커 B 2건 = 3건
+    assert _stored_score(record_id) == pytest.approx(weight + math.log(3))
+
+    # A가 다시 저장하면 B가 반영한 점수를 받아 온다
+    worker_a.remove(record_id, at)
+    with SessionLocal() as session:
+        worker_a.persist(session)
+    assert _stored_score(record_id) == pytest.approx(weight + math.log(2))
+    assert worker_a.snapshot(None, None).record_ids == (record_id,)
+    assert worker_a._scores[record_id] == pytest.approx(weight + math.log(2))
+
+
+def test_remove_from_other_workers_score(db, make_user, make_record):
+    from core.database import SessionLocal
+
+    record_id = make_record(make_user(1))
+    at = datetime.utcnow()
+    worker_a, worker_b = TrendingTracker(), TrendingTracker()
+
+    worker_a.add(record_id, at)
+    with SessionLocal() as session:
+        worker_a.persist(session)
+    # B는 이 기록의 추가 이벤트를 본 적이 없어도 취소분을 저장한다
+    worker_b.remove(record_id, at)
+    with SessionLocal() as session:
+        worker_b.persist(session)
+
+    from models import TrendingScore
+
+    with SessionLocal() as session:
+        assert session.get(TrendingScore, record_id) is None
+
+
+def test_load_rebuilds_empty_table_once(db, make_user, make_record):
+    from sqlalchemy import text
+
+    from core.database import SessionLocal, engine
+
+    user_id = make_user(1)
+    record_id = make_record(user_id)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO reactions (lunch_record_id, user_id, reaction_type, created_at) "
+                "SELECT :rid, :uid, id, now() AT TIME ZONE 'utc' FROM reaction_types LIMIT 1"
+            ),
+            {"rid": record_id, "uid": user_id},
+        )
+
+    for _ in range(2):
+        with SessionLocal() as session:
+            assert TrendingTracker().load(session) == 1
+    assert _stored_score(record_id) > -math.inf
+
+
+def test_snapshot_top_k_matches_full_ranking(monkeypatch):
+    import random
+
+    from domains.community.service import trending
+
+    monkeypatch.setattr(trending, "TRENDING_SNAPSHOT_REFRESH_SECONDS", 0)
+    monkeypatch.setattr(trending, "TRENDING_TOP_K", 5)
+    rng = random.Random(7)
+    tracker = TrendingTracker()
+    base = datetime(2026, 1, 1)
+    reactions = []
+    for rid in range(1, 41):
+        tracker._categories[rid] = ("KOREAN", "JAPANESE", None)[rid % 3]
+
+    for step in range(600):
+        if reactions and rng.random() < 0.3:
+            rid, at = reactions.pop(rng.randrange(len(reactions)))
+            tracker.remove(rid, at)
+        else:
+            rid, at = rng.randint(1, 40), base + timedelta(minutes=rng.randint(0, 600))
+            reactions.append((rid, at))
+            tracker.add(rid, at)
+        if step % 20 == 0:
+            for category in (None, "KOREAN", "JAPANESE"):
+                expected = sorted(
+                    (
+                        (score, rid)
+                        for rid, score in tracker._scores.items()
+                        if score > -math.inf and (category is None or tracker._categories[rid] == category)
+                    ),
+                    reverse=True,
+                )[:5]
+                assert tracker.snapshot(None, category).record_ids == tuple(rid for _s, rid in expected)